@@ -0,0 +1,170 @@
+import argparse
+import copy
+import json
+import platform
+import statistics
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from benchmarks.bench_html_report import synthetic_result
+from src.pytest_playwright_axe.axe import Axe
+from src.pytest_playwright_axe.scripts import AXE_RUN_SCRIPT
+
+
+NODE_COUNTS = [100, 1000, 10000, 50000]
+ITERATIONS = 3
+PHASES = ["inject_ms", "axe_run_ms", "transfer_ms", "json_report_ms", "html_report_ms", "collect_changes_ms"]
+
+# Runs the shipped AXE_RUN_SCRIPT, leaving the results in the page so transferring them to Python can be timed
+# separately (unlike the package's TIMED_AXE_RUN_SCRIPT, which returns them with the run time).
+BENCHMARK_AXE_RUN_SCRIPT = """async argument => {
+    const start = performance.now();
+    window.__axeBenchmarkResults = await (""" + AXE_RUN_SCRIPT + """)(argument);
+    return performance.now() - start;
+}"""
+TRANSFER_RESULTS_SCRIPT = "() => window.__axeBenchmarkResults"
+
+# Each block contains 16 elements, including a missing alt attribute and a low contrast paragraph.
+FIXTURE_BLOCK = """<section aria-labelledby="heading-{number}">
+    <h2 id="heading-{number}">Section {number}</h2>
+    <p>Paragraph text for section {number}, with a <a href="/item/{number}">link to item {number}</a>.</p>
+    <ul><li><button type="button">Edit</button></li><li><button type="button">Copy</button></li><li><button type="button">Delete</button></li></ul>
+    <label for="input-{number}">Field {number}</label><input id="input-{number}" type="text">
+    <img src="/image-{number}.png">
+    <p style="color: #999; background: #fff">Low contrast text {number}</p>
+</section>"""
+FIXTURE_BLOCK_ELEMENTS = 16
+
+
+def fixture_html(node_count: int) -> str:
+    """Build a local page with approximately the number of elements provided, including some violations."""
+    blocks = "".join(FIXTURE_BLOCK.format(number=number) for number in range(max(1, node_count // FIXTURE_BLOCK_ELEMENTS)))
+    return f"""<!DOCTYPE html><html lang="en"><head><title>Benchmark</title></head>
+        <body><main>{blocks}</main></body></html>"""
+
+
+def previous_snapshot(data: dict) -> dict:
+    """Build a snapshot to compare the results against, with every third violating node and the last violation removed."""
+    snapshot = copy.deepcopy(data)
+    snapshot["violations"] = snapshot["violations"][:-1]
+    for violation in snapshot["violations"]:
+        violation["nodes"] = [node for number, node in enumerate(violation["nodes"]) if number % 3]
+    return snapshot
+
+
+def time_report_phases(axe: Axe, data: dict, timings: dict) -> None:
+    """Time the Python side of processing a result, appending the durations to the timings provided."""
+    snapshot_data = previous_snapshot(data)
+
+    start = time.perf_counter()
+    axe._create_json_report(data, "benchmark")
+    timings["json_report_ms"].append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    axe._generate_html(data, "benchmark")
+    timings["html_report_ms"].append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    axe._collect_all_changes(data, snapshot_data)
+    timings["collect_changes_ms"].append((time.perf_counter() - start) * 1000)
+
+
+def benchmark_page(page, axe: Axe, node_count: int, iterations: int = ITERATIONS) -> dict:
+    """Time each phase of a scan of a fixture page in the browser, returning the median duration of each phase."""
+    timings = {phase: [] for phase in PHASES}
+    for _ in range(iterations):
+        page.set_content(fixture_html(node_count))
+
+        start = time.perf_counter()
+        axe._inject_axe(page)
+        timings["inject_ms"].append((time.perf_counter() - start) * 1000)
+
+        timings["axe_run_ms"].append(page.evaluate(BENCHMARK_AXE_RUN_SCRIPT, [None, None, None]))
+
+        start = time.perf_counter()
+        data = page.evaluate(TRANSFER_RESULTS_SCRIPT)
+        timings["transfer_ms"].append((time.perf_counter() - start) * 1000)
+
+        time_report_phases(axe, data, timings)
+
+    return {
+        "dom_nodes": page.evaluate("document.getElementsByTagName('*').length"),
+        "violating_nodes": sum(len(violation["nodes"]) for violation in data["violations"]),
+        **{phase: statistics.median(durations) for phase, durations in timings.items()}
+    }
+
+
+def benchmark_offline(node_count: int, axe: Axe, iterations: int = ITERATIONS) -> dict:
+    """Time the report phases only, against a synthetic result roughly the size of a scan of the fixture page."""
+    timings = {phase: [] for phase in PHASES[3:]}
+    data = synthetic_result(rule_count=50, nodes_per_rule=max(1, node_count // 50))
+    for _ in range(iterations):
+        time_report_phases(axe, data, timings)
+
+    return {
+        "dom_nodes": node_count,
+        "violating_nodes": sum(len(violation["nodes"]) for violation in data["violations"]),
+        **{phase: statistics.median(durations) for phase, durations in timings.items()}
+    }
+
+
+def benchmark_hot_paths(node_counts: list[int] = NODE_COUNTS, iterations: int = ITERATIONS, offline: bool = False) -> dict:
+    """Run the benchmark against each fixture size, returning the results with details of the environment."""
+    results = {
+        "environment": {"python": platform.python_version(), "platform": platform.platform()},
+        "iterations": iterations,
+        "results": {}
+    }
+
+    with TemporaryDirectory() as output_directory:
+        axe = Axe(output_directory=output_directory)
+        results["environment"]["axe_core"] = axe.axe_version
+
+        if offline:
+            for node_count in node_counts:
+                results["results"][str(node_count)] = benchmark_offline(node_count, axe, iterations)
+            return results
+
+        from playwright.sync_api import sync_playwright
+        with sync_playwright() as playwright:
+            browser = playwright.chromium.launch()
+            results["environment"]["browser"] = f"chromium {browser.version}"
+            for node_count in node_counts:
+                # A new page for each size, so axe-core is injected into a clean page
+                page = browser.new_page()
+                results["results"][str(node_count)] = benchmark_page(page, axe, node_count, iterations)
+                page.close()
+            browser.close()
+
+    return results
+
+
+def compare_results(results: dict, baseline: dict) -> list[str]:
+    """Compare the results against a previous run, returning a line for each phase showing the change in duration."""
+    lines = []
+    for node_count, result in results["results"].items():
+        baseline_result = baseline["results"].get(node_count, {})
+        for phase in PHASES:
+            if phase in result and baseline_result.get(phase):
+                change = (result[phase] - baseline_result[phase]) / baseline_result[phase] * 100
+                lines.append(f"{node_count} nodes, {phase}: {baseline_result[phase]:.1f} -> {result[phase]:.1f} ({change:+.0f}%)")
+    return lines
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Time each phase of scanning and reporting on local fixture pages.")
+    parser.add_argument("--nodes", type=int, nargs="+", default=NODE_COUNTS, help="Fixture page sizes to benchmark.")
+    parser.add_argument("--iterations", type=int, default=ITERATIONS, help="Runs per fixture, the median is reported.")
+    parser.add_argument("--offline", action="store_true", help="Only time the report phases, without a browser.")
+    parser.add_argument("--output", type=Path, help="File to write the results to as JSON.")
+    parser.add_argument("--baseline", type=Path, help="JSON results from a previous run to compare against.")
+    args = parser.parse_args()
+
+    benchmark_results = benchmark_hot_paths(args.nodes, args.iterations, args.offline)
+    if args.output:
+        args.output.write_text(json.dumps(benchmark_results, indent=4), encoding="utf-8")
+
+    if args.baseline:
+        print("\n".join(compare_results(benchmark_results, json.loads(args.baseline.read_text(encoding="utf-8")))))
+    else:
+        print(json.dumps(benchmark_results, indent=4))
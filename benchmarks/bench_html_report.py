@@ -0,0 +1,70 @@
+import time
+import tracemalloc
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from src.pytest_playwright_axe.axe import Axe
+
+
+def synthetic_result(rule_count: int = 50, nodes_per_rule: int = 200) -> dict:
+    """Build an axe-core result with the number of violating rules and nodes per rule provided."""
+    def rule(rule_type: str, number: int, node_count: int) -> dict:
+        return {
+            "id": f"{rule_type}-rule-{number}",
+            "impact": "serious",
+            "tags": ["cat.color", "wcag2aa", "wcag143"],
+            "description": f"Ensures {rule_type} rule {number} is met & <checked>",
+            "help": "help",
+            "helpUrl": f"https://dequeuniversity.com/rules/axe/{rule_type}-{number}",
+            "nodes": [{
+                "target": [f"#main > div:nth-child({node})", "span"],
+                "html": f"<div class=\"item-{node}\"><span>Item {node}</span></div>",
+                "failureSummary": "Fix any of the following:\n  Element has insufficient color contrast"
+            } for node in range(node_count)]
+        }
+
+    return {
+        "testEngine": {"name": "axe-core", "version": "4.11.4"},
+        "testRunner": {"name": "axe"},
+        "testEnvironment": {"userAgent": "benchmark"},
+        "timestamp": "2024-11-04T16:14:57.934Z",
+        "url": "https://www.test.com/benchmark",
+        "toolOptions": {"reporter": "v1"},
+        "violations": [rule("violation", number, nodes_per_rule) for number in range(rule_count)],
+        "passes": [rule("pass", number, nodes_per_rule) for number in range(rule_count)],
+        "incomplete": [],
+        "inapplicable": [rule("inapplicable", number, 0) for number in range(rule_count)]
+    }
+
+
+def benchmark_html_report(rule_count: int = 50, nodes_per_rule: int = 200) -> dict:
+    """Time and measure the peak memory of rendering and writing the HTML report for a large result."""
+    data = synthetic_result(rule_count, nodes_per_rule)
+
+    with TemporaryDirectory() as output_directory:
+        axe = Axe(output_directory=output_directory)
+
+        start = time.perf_counter()
+        axe._create_html_report(data, "benchmark")
+        duration = time.perf_counter() - start
+
+        # Memory is measured on a separate run, as tracing allocations slows down rendering
+        tracemalloc.start()
+        axe._create_html_report(data, "benchmark")
+        _, peak_memory = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        report_size = Path(output_directory).joinpath("benchmark.html").stat().st_size
+
+    return {
+        "violating_nodes": rule_count * nodes_per_rule,
+        "duration_ms": duration * 1000,
+        "peak_memory_kb": peak_memory / 1024,
+        "report_size_kb": report_size / 1024
+    }
+
+
+if __name__ == "__main__":
+    for nodes_per_rule in [20, 200, 2000]:
+        result = benchmark_html_report(nodes_per_rule=nodes_per_rule)
+        print(f"{result['violating_nodes']} violating nodes: {result['duration_ms']:.1f}ms, "
+              f"peak memory = {result['peak_memory_kb']:.0f}KB, report = {result['report_size_kb']:.0f}KB")
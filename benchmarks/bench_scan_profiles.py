@@ -0,0 +1,68 @@
+import time
+from playwright.sync_api import sync_playwright
+from src.pytest_playwright_axe.axe import Axe
+from src.pytest_playwright_axe.options import AXE_OPTIONS_WCAG_22AA, AXE_OPTIONS_WCAG_22AA_VIOLATIONS, AxeOptions, VIOLATIONS_ONLY_FILTER
+
+
+ITERATIONS = 3
+
+PROFILES = {
+    "default (all rules)": AxeOptions(),
+    "AXE_OPTIONS_WCAG_22AA": AXE_OPTIONS_WCAG_22AA,
+    "WCAG 2.2 AA, violations result type": AxeOptions(run_only=AXE_OPTIONS_WCAG_22AA.run_only, result_types=("violations",)),
+    "AXE_OPTIONS_WCAG_22AA_VIOLATIONS": AXE_OPTIONS_WCAG_22AA_VIOLATIONS,
+}
+
+
+def large_fixture_html(section_count: int = 500) -> str:
+    """Build a DOM-heavy page, mostly made up of passing elements with a few violations in each section."""
+    sections = []
+    for number in range(section_count):
+        sections.append(f"""<section aria-labelledby="heading-{number}">
+            <h2 id="heading-{number}">Section {number}</h2>
+            <p>Paragraph text for section {number}, with a <a href="/item/{number}">link to item {number}</a>.</p>
+            <ul>{"".join(f"<li><button type='button'>Action {item}</button></li>" for item in range(5))}</ul>
+            <label for="input-{number}">Field {number}</label><input id="input-{number}" type="text">
+            <img src="/image-{number}.png"{' alt="Image"' if number % 10 else ""}>
+            <p style="color: #999; background: #fff">Low contrast text {number}</p>
+        </section>""")
+
+    return f"""<!DOCTYPE html><html lang="en"><head><title>Benchmark</title></head>
+        <body><main>{"".join(sections)}</main></body></html>"""
+
+
+def benchmark_scan_profiles(section_count: int = 500, iterations: int = ITERATIONS) -> dict:
+    """Time axe-core scans of a large fixture page using each profile, reporting the average time per scan."""
+    results = {}
+    with sync_playwright() as playwright:
+        browser = playwright.chromium.launch()
+        page = browser.new_page()
+        page.set_content(large_fixture_html(section_count))
+        axe = Axe()
+        node_count = page.evaluate("document.getElementsByTagName('*').length")
+
+        for name, options in PROFILES.items():
+            # The first scan loads axe-core and resolves any rules, so is not timed
+            scan = axe.run(page, options=options, result_filter=VIOLATIONS_ONLY_FILTER,
+                           html_report_generated=False, json_report_generated=False)
+
+            start = time.perf_counter()
+            for _ in range(iterations):
+                axe.run(page, options=options, result_filter=VIOLATIONS_ONLY_FILTER,
+                        html_report_generated=False, json_report_generated=False)
+            duration = time.perf_counter() - start
+
+            results[name] = {
+                "dom_nodes": node_count,
+                "ms_per_scan": duration / iterations * 1000,
+                "violating_nodes": sum(axe._node_count(violation) for violation in scan["violations"])
+            }
+
+        browser.close()
+    return results
+
+
+if __name__ == "__main__":
+    for name, result in benchmark_scan_profiles().items():
+        print(f"{name}: {result['ms_per_scan']:.0f}ms per scan of {result['dom_nodes']} DOM nodes, "
+              f"{result['violating_nodes']} violating nodes")
@@ -0,0 +1,25 @@
+import timeit
+from src.pytest_playwright_axe.axe import AXE_PATH, MIN_AXE_PATH, load_axe_script, invalidate_axe_script_cache
+
+
+ITERATIONS = 200
+
+
+def benchmark_script_cache(iterations: int = ITERATIONS) -> dict:
+    """Compare reading axe-core from disk on every scan against the in-process script cache."""
+    results = {}
+    for axe_path in [AXE_PATH, MIN_AXE_PATH]:
+        invalidate_axe_script_cache()
+        uncached = timeit.timeit(lambda: axe_path.read_text(encoding="UTF-8"), number=iterations)
+        cached = timeit.timeit(lambda: load_axe_script(axe_path), number=iterations)
+        results[axe_path.name] = {
+            "uncached_ms_per_scan": uncached / iterations * 1000,
+            "cached_ms_per_scan": cached / iterations * 1000,
+        }
+    return results
+
+
+if __name__ == "__main__":
+    for name, result in benchmark_script_cache().items():
+        print(f"{name}: uncached = {result['uncached_ms_per_scan']:.3f}ms, "
+              f"cached = {result['cached_ms_per_scan']:.3f}ms per scan")
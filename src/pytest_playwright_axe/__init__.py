@@ -1,3 +1,19 @@
-from .axe import Axe, AxeAccessibilityException, OPTIONS_WCAG_22AA
-__all__ = ["Axe", "AxeAccessibilityException", "OPTIONS_WCAG_22AA"]
+from .axe import Axe, load_axe_script, preload_axe_script, invalidate_axe_script_cache, node_fingerprint
+from .exceptions import AxeAccessibilityException
+from .options import ALL_FRAMES, AXE_OPTIONS_WCAG_22AA, AXE_OPTIONS_WCAG_22AA_VIOLATIONS, AxeContext, AxeOptions, FrameFilter, OPTIONS_WCAG_22AA, ResultFilter, VIOLATIONS_ONLY_FILTER
+from .report_writer import ReportWriter
+from .scan_cache import ScanCache
+from .crawl_frontier import CrawlFrontier, normalize_url
+from .template_sampler import TemplateSampler
+from .scan_metrics import ScanMetrics
+from .async_axe import AsyncAxe
+from .consolidated_report import ConsolidatedReport
+from .snapshot_store import SnapshotStore
+from .cli import regenerate_reports
+from .scan_runner import ScanRunner
+from .violation_aggregator import ViolationAggregator
+__all__ = ["ALL_FRAMES", "AXE_OPTIONS_WCAG_22AA", "AXE_OPTIONS_WCAG_22AA_VIOLATIONS", "Axe", "AsyncAxe", "AxeAccessibilityException", "AxeContext", "AxeOptions", "ConsolidatedReport", "CrawlFrontier", "FrameFilter", "OPTIONS_WCAG_22AA",
+           "ReportWriter", "ResultFilter", "ScanCache", "ScanMetrics", "ScanRunner", "SnapshotStore", "TemplateSampler", "VIOLATIONS_ONLY_FILTER", "ViolationAggregator",
+           "load_axe_script", "preload_axe_script", "invalidate_axe_script_cache", "regenerate_reports",
+           "node_fingerprint", "normalize_url"]
 __version__ = "4.11.4"
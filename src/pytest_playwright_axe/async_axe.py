@@ -0,0 +1,482 @@
+import asyncio
+import logging
+import time
+from typing import TYPE_CHECKING
+from playwright.async_api import Page, Frame, Locator, BrowserContext, Error as PlaywrightError, expect
+from .axe import AxeBase, load_axe_script
+from .crawl_frontier import CrawlFrontier
+from .exceptions import AxeAccessibilityException
+from .options import AxeContext, AxeOptions, FrameFilter, ResultFilter
+from .scan_metrics import ScanMetrics
+from .scripts import (AXE_LOADED_CHECK, CHANGED_REGIONS_CONTEXT, CHANGED_REGIONS_SCRIPT, DOM_FINGERPRINT_SCRIPT, DOM_SIGNATURE_SCRIPT,
+                      FRAME_MATCHES_SCRIPT, FRAME_SELECTOR_SCRIPT, LINKS_SCRIPT, MUTATION_RECORDER_SCRIPT, NODES_IN_CHANGED_REGIONS_SCRIPT)
+from .template_sampler import TemplateSampler
+
+if TYPE_CHECKING:
+    from .consolidated_report import ConsolidatedReport
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncAxe(AxeBase):
+    """
+    This utility allows for interaction with axe-core using the Playwright async API. It accepts the same
+    arguments as Axe, and generates the same reports and snapshot comparisons. Reports, snapshot store and
+    scan cache files are written on a worker thread, so the event loop is not blocked while they are written.
+
+    Example:
+        ```
+        # Default usage
+        async def test_example(page: Page) -> None:
+            axe = AsyncAxe()
+            await axe.run(page)
+        ```
+    """
+
+    _locator_type = Locator
+
+    async def run(self,
+                  page: Page,
+                  filename: str = "",
+                  context: str | AxeContext = "",
+                  options: str | AxeOptions = "",
+                  report_on_violation_only: bool = False,
+                  strict_mode: bool = None,
+                  html_report_generated: bool = True,
+                  json_report_generated: bool = True,
+                  result_filter: ResultFilter = None,
+                  frame_filter: FrameFilter = None) -> dict:
+        """
+        This runs axe-core against the page provided. See Axe.run() for details of the arguments.
+
+        Args:
+            page (playwright.async_api.Page): The page object to execute axe-core against.
+
+        Returns:
+            dict: A Python dictionary with the axe-core output of the page scanned.
+
+        Example:
+            ```
+            results = await AsyncAxe().run(page, json_report_generated=False)
+            ```
+        """
+        response, metrics = await self._evaluate_page(page, filename, context, options, result_filter, frame_filter)
+        return await self._process_results(response, filename, report_on_violation_only, self._strict_mode(strict_mode),
+                                           html_report_generated, json_report_generated, metrics)
+
+    async def run_list(self,
+                       page: Page,
+                       page_list: list[str | dict],
+                       use_list_for_filename: bool = True,
+                       context: str | AxeContext = "",
+                       options: str | AxeOptions = "",
+                       report_on_violation_only: bool = False,
+                       strict_mode: bool = None,
+                       html_report_generated: bool = True,
+                       json_report_generated: bool = True,
+                       result_filter: ResultFilter = None,
+                       concurrency: int = 1,
+                       consolidated_report: "ConsolidatedReport" = None,
+                       scope_to_changes: bool = False,
+                       frame_filter: FrameFilter = None,
+                       sampler: TemplateSampler = None) -> dict:
+        """
+        This runs axe-core against a list of pages provided. See Axe.run_list() for details of the arguments.
+
+        Args:
+            page (playwright.async_api.Page): The page object to execute axe-core against.
+            page_list (list[str | dict]): A list of URLs to execute against, in the same format as Axe.run_list().
+            concurrency (int): [Optional] The number of pages to scan at the same time. If greater than 1, str entries are scanned on new pages opened in the browser context of the page provided.
+            consolidated_report (ConsolidatedReport): [Optional] If provided, the results for each page are added to the consolidated report provided, in page_list order.
+            scope_to_changes (bool): [Optional] If true, dict entries whose url is also a str entry only scan the regions changed by their action, as in Axe.run_list(). When concurrency is 1, this depends on the order of page_list in the same way.
+            frame_filter (FrameFilter): [Optional] If provided, the child frames of each page to scan, as in Axe.run().
+            sampler (TemplateSampler): [Optional] If provided, str entries are grouped by template and only a sample of each group is scanned, as in Axe.run_list().
+
+        dict entries are always scanned using the page provided, as their locators are bound to it. Results are keyed and
+        ordered exactly as they would be when scanning one page at a time, and if strict_mode is set, the first violation
+        in page_list order is raised once all pages have been scanned.
+
+        Returns:
+            dict: A Python dictionary with the axe-core output of all the pages scanned, with the page_list value used as the key for each report.
+
+        Example:
+            ```
+            results = await AsyncAxe().run_list(page, ["/home", "/search", "/about"], concurrency=3)
+            ```
+        """
+        if concurrency < 1:
+            raise AxeAccessibilityException("concurrency must be 1 or greater.")
+
+        strict_mode = self._strict_mode(strict_mode)
+        planned_pages = self._plan_page_list(page_list, use_list_for_filename)
+        # Pages are added to the consolidated report before any violation is raised
+        scan_arguments = self._build_scan_arguments(context, options, report_on_violation_only,
+                                                    strict_mode and not consolidated_report, html_report_generated,
+                                                    json_report_generated, result_filter, frame_filter)
+
+        if concurrency == 1:
+            results = {}
+            for results_key, filename, selected_page in planned_pages:
+                base_results = results.get(selected_page["url"]) \
+                    if scope_to_changes and isinstance(selected_page, dict) else None
+                response = await self._scan_list_entry(page, selected_page, filename, scan_arguments, base_results,
+                                                       sampler)
+                if response is None:
+                    continue
+                results[results_key] = response
+                if consolidated_report:
+                    await asyncio.to_thread(self._report_list_result, consolidated_report, results_key, response,
+                                            filename, scan_arguments, strict_mode, sampler)
+
+            if consolidated_report and sampler:
+                consolidated_report.add_groups(sampler.groups)
+            return results
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def scan_on_new_page(url: str, filename: str) -> dict | None:
+            # Pages sampled by URL are checked first, so no page is opened for the pages skipped
+            if self._skipped_by_url(sampler, url):
+                return None
+            async with semaphore:
+                new_page = await page.context.new_page()
+                try:
+                    return await self._scan_list_entry(new_page, url, filename, scan_arguments,
+                                                       sampler=sampler if sampler and sampler.group_by_dom else None)
+                finally:
+                    await new_page.close()
+
+        async def scan_on_page(entries: list[tuple[int, str, dict]],
+                               base_results: dict[str, dict] = None) -> dict[int, dict | BaseException]:
+            entry_results = {}
+            for index, filename, selected_page in entries:
+                try:
+                    entry_results[index] = await self._scan_list_entry(
+                        page, selected_page, filename, scan_arguments,
+                        base_results.get(selected_page["url"]) if base_results is not None else None)
+                except Exception as e:
+                    entry_results[index] = e
+            return entry_results
+
+        page_entries = [(index, filename, selected_page)
+                        for index, (_, filename, selected_page) in enumerate(planned_pages)
+                        if isinstance(selected_page, dict)]
+        new_page_indexes = [index for index, (_, _, selected_page) in enumerate(planned_pages)
+                            if not isinstance(selected_page, dict)]
+
+        if scope_to_changes:
+            # dict entries are scanned once the str entries they are scoped against are complete
+            gathered = await asyncio.gather(
+                *[scan_on_new_page(planned_pages[index][2], planned_pages[index][1]) for index in new_page_indexes],
+                return_exceptions=True
+            )
+            scan_results = dict(zip(new_page_indexes, gathered))
+            base_results = {planned_pages[index][2]: result for index, result in scan_results.items()
+                            if not isinstance(result, BaseException)}
+            scan_results.update(await scan_on_page(page_entries, base_results))
+        else:
+            gathered = await asyncio.gather(
+                scan_on_page(page_entries),
+                *[scan_on_new_page(planned_pages[index][2], planned_pages[index][1]) for index in new_page_indexes],
+                return_exceptions=True
+            )
+            scan_results = dict(zip(new_page_indexes, gathered[1:]))
+            scan_results.update(gathered[0])
+        scan_errors = {index: result for index, result in scan_results.items() if isinstance(result, BaseException)}
+        for index in scan_errors:
+            del scan_results[index]
+        scan_results = {index: result for index, result in scan_results.items() if result is not None}
+
+        return await asyncio.to_thread(self._collect_list_results, planned_pages, scan_results, scan_errors,
+                                       scan_arguments, strict_mode, consolidated_report, sampler)
+
+    async def crawl(self,
+                    page: Page,
+                    frontier: CrawlFrontier,
+                    context: str | AxeContext = "",
+                    options: str | AxeOptions = "",
+                    report_on_violation_only: bool = False,
+                    strict_mode: bool = None,
+                    html_report_generated: bool = True,
+                    json_report_generated: bool = True,
+                    result_filter: ResultFilter = None,
+                    concurrency: int = 1,
+                    consolidated_report: "ConsolidatedReport" = None,
+                    frame_filter: FrameFilter = None) -> dict:
+        """
+        This crawls a site from the seed URLs of the frontier provided. See Axe.crawl() for details of the arguments.
+
+        Args:
+            page (playwright.async_api.Page): The page object to execute axe-core against.
+            frontier (CrawlFrontier): The frontier holding the seed URLs, limits and state of the crawl.
+            concurrency (int): [Optional] The number of pages to scan at the same time. If greater than 1, pages are scanned on new pages opened in the browser context of the page provided.
+
+        Returns:
+            dict: A Python dictionary with the axe-core output of the pages scanned by this call, with the normalized URL used as the key for each report.
+
+        Example:
+            ```
+            results = await AsyncAxe().crawl(page, CrawlFrontier(["https://example.com/"], max_pages=100), concurrency=4)
+            ```
+        """
+        if concurrency < 1:
+            raise AxeAccessibilityException("concurrency must be 1 or greater.")
+
+        # Violations are raised once the crawl is complete, so every page is scanned
+        scan_arguments = self._build_scan_arguments(context, options, report_on_violation_only, False,
+                                                    html_report_generated, json_report_generated, result_filter,
+                                                    frame_filter)
+        scan_results: dict[str, dict] = {}
+
+        async def crawl_on_new_page(url: str, depth: int) -> None:
+            new_page = await page.context.new_page()
+            try:
+                await self._crawl_page(new_page, frontier, url, depth, scan_arguments, scan_results, consolidated_report)
+            finally:
+                await new_page.close()
+
+        try:
+            if concurrency == 1:
+                while (entry := frontier.next()) is not None:
+                    await self._crawl_page(page, frontier, *entry, scan_arguments, scan_results, consolidated_report)
+            else:
+                pending = set()
+                while True:
+                    while len(pending) < concurrency and (entry := frontier.next()) is not None:
+                        pending.add(asyncio.create_task(crawl_on_new_page(*entry)))
+                    if not pending:
+                        break
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        if task.exception():
+                            # Let the other pages finish, so their results are kept
+                            await asyncio.gather(*pending, return_exceptions=True)
+                            raise task.exception()
+        finally:
+            await asyncio.to_thread(frontier.save)
+
+        return self._finish_crawl(frontier, scan_results, self._strict_mode(strict_mode))
+
+    async def get_rules(self, page: Page, rules: list[str] = None) -> list[dict]:
+        """
+        This runs axe.getRules(), returning the specified rules (or all if no ruleset provided).
+
+        Args:
+            page (playwright.async_api.Page): The page object to execute axe-core against.
+            rules (list[str]): [Optional] A list of rules to return. If not provided, all rules are returned.
+
+        Returns:
+            list[dict]: A list of dictionaries containing the axe-core rules returned.
+        """
+        await self._inject_axe(page)
+
+        return await page.evaluate(
+            f"axe.getRules({"" if rules is None else str(rules)});")
+
+    async def _inject_axe(self, page: Page) -> bool:
+        """This injects axe-core into the page if the expected version is not already loaded, returning True if injected."""
+        if self.use_init_script:
+            await self._register_init_script(page.context)
+
+        if await page.evaluate(AXE_LOADED_CHECK, self.axe_version):
+            return False
+
+        await page.evaluate(load_axe_script(self.axe_path))
+        return True
+
+    async def _dom_fingerprint(self, page: Page, frame_filter: FrameFilter | None) -> str:
+        """This fingerprints the page for the scan cache, including each frame if frames are being scanned."""
+        if frame_filter is None:
+            return await page.evaluate(DOM_FINGERPRINT_SCRIPT)
+
+        return "|".join(await asyncio.gather(*(frame.evaluate(DOM_FINGERPRINT_SCRIPT) for frame in page.frames)))
+
+    async def _inject_axe_into_frames(self, page: Page, frame_filter: FrameFilter) -> list[str | dict]:
+        """This injects axe-core into the child frames allowed by the filter, preparing each level of frames concurrently."""
+        excluded = []
+        frames = list(page.main_frame.child_frames)
+        while frames:
+            prepared = await asyncio.gather(*(self._prepare_frame(frame, frame_filter) for frame in frames))
+            excluded.extend(selector for _, selector in prepared if selector is not None)
+            frames = [child for frame, (injected, _) in zip(frames, prepared) if injected for child in frame.child_frames]
+
+        return excluded
+
+    async def _prepare_frame(self, frame: Frame, frame_filter: FrameFilter) -> tuple[bool, str | dict | None]:
+        """This injects axe-core into a frame if allowed by the filter, returning whether it was injected and its selector if excluded."""
+        try:
+            if not await self._frame_allowed(frame, frame_filter):
+                return False, await self._frame_selector(frame)
+            if not await frame.evaluate(AXE_LOADED_CHECK, self.axe_version):
+                await frame.evaluate(load_axe_script(self.axe_path))
+        except PlaywrightError as e:
+            # Frames can be detached at any point, e.g. by the page navigating them
+            logger.warning(f"Failed to prepare frame [{frame.url}] for scanning: {e}")
+            return False, None
+
+        return True, None
+
+    async def _frame_allowed(self, frame: Frame, frame_filter: FrameFilter) -> bool:
+        """This determines whether the frame provided should be scanned, based on its URL and frame element."""
+        if not frame_filter.allows_url(frame.url):
+            return False
+
+        return not frame_filter.exclude_selectors or not await (await frame.frame_element()).evaluate(
+            FRAME_MATCHES_SCRIPT, list(frame_filter.exclude_selectors))
+
+    async def _frame_selector(self, frame: Frame) -> str | dict:
+        """This builds the axe-core selector for a child frame, from the selector of each frame element up to the main frame."""
+        frame_path = []
+        while frame.parent_frame is not None:
+            frame_path.insert(0, await (await frame.frame_element()).evaluate(FRAME_SELECTOR_SCRIPT))
+            frame = frame.parent_frame
+
+        return frame_path[0] if len(frame_path) == 1 else {"fromFrames": frame_path}
+
+    async def _register_init_script(self, context: BrowserContext) -> None:
+        """This registers axe-core as an init script on the browser context, if not already registered."""
+        if context in self._init_script_contexts:
+            return
+
+        await context.add_init_script(script=load_axe_script(self.axe_path))
+        self._init_script_contexts.add(context)
+
+    async def _scan_list_entry(self,
+                               page: Page,
+                               selected_page: str | dict,
+                               filename: str,
+                               scan_arguments: dict,
+                               base_results: dict = None,
+                               sampler: TemplateSampler = None) -> dict | None:
+        """This navigates to a single page list entry, completes any pre-scan actions and runs axe-core, returning None if the sampler skips it."""
+        if isinstance(selected_page, dict):
+            await page.goto(selected_page["url"])
+            if base_results is not None and not scan_arguments["context"]:
+                await page.evaluate(MUTATION_RECORDER_SCRIPT)
+                await self._complete_pre_scan_actions(page, selected_page)
+                return await self._run_scoped(page, filename, base_results, scan_arguments)
+            await self._complete_pre_scan_actions(page, selected_page)
+        else:
+            if self._skipped_by_url(sampler, selected_page):
+                return None
+            await page.goto(selected_page)
+            if sampler and sampler.group_by_dom and not sampler.claim(
+                    selected_page, sampler.dom_group(await page.evaluate(DOM_SIGNATURE_SCRIPT))):
+                return None
+
+        return await self.run(page, filename=filename, **scan_arguments)
+
+    async def _crawl_page(self,
+                          page: Page,
+                          frontier: CrawlFrontier,
+                          url: str,
+                          depth: int,
+                          scan_arguments: dict,
+                          scan_results: dict[str, dict],
+                          consolidated_report: "ConsolidatedReport" = None) -> None:
+        """This scans a URL from the frontier, adding the links found on the page to the frontier."""
+        filename = self._modify_filename_for_report(url)
+        try:
+            response = await self._scan_list_entry(page, url, filename, scan_arguments)
+            links = await page.evaluate(LINKS_SCRIPT) if frontier.follows_links(depth) else []
+        except PlaywrightError as e:
+            logger.warning(f"Failed to crawl {url}: {e}")
+            frontier.complete(url, failed=True)
+            return
+        except BaseException:
+            frontier.stop()
+            raise
+
+        await asyncio.to_thread(self._record_crawl_result, frontier, url, response, links, page.url, filename,
+                                scan_arguments, scan_results, consolidated_report)
+
+    async def _run_scoped(self, page: Page, filename: str, base_results: dict, scan_arguments: dict) -> dict:
+        """This scans only the regions changed since recording started, merging the results into the base results."""
+        region_count = await page.evaluate(CHANGED_REGIONS_SCRIPT)
+        if region_count is None:
+            return await self.run(page, filename=filename, **scan_arguments)
+
+        metrics = ScanMetrics(url=page.url, filename=filename, axe_version=self.axe_version)
+        if region_count == 0:
+            response = self._merge_scoped_results(base_results, None, [], 0)
+        else:
+            replaced = await page.evaluate(NODES_IN_CHANGED_REGIONS_SCRIPT, self._base_node_targets(base_results))
+            with metrics.phase("inject_ms"):
+                await self._inject_axe(page)
+            scoped_results = await self._evaluate_axe(page, self._build_evaluate_command(
+                CHANGED_REGIONS_CONTEXT, scan_arguments["options"], scan_arguments["result_filter"]), None, metrics)
+            response = self._merge_scoped_results(base_results, scoped_results, replaced, region_count)
+
+        return await self._process_results(response, filename, scan_arguments["report_on_violation_only"],
+                                           self._strict_mode(scan_arguments["strict_mode"]),
+                                           scan_arguments["html_report_generated"],
+                                           scan_arguments["json_report_generated"], metrics)
+
+    async def _evaluate_page(self,
+                             page: Page,
+                             filename: str,
+                             context: str | AxeContext,
+                             options: str | AxeOptions,
+                             result_filter: ResultFilter | None,
+                             frame_filter: FrameFilter | None) -> tuple[dict, ScanMetrics]:
+        """This runs axe-core against the page (or reads the results from the scan cache), without recording the results."""
+        metrics, expression, argument, frame_filter = self._prepare_scan(page.url, filename, context, options,
+                                                                         result_filter, frame_filter)
+        cache_key = None
+        if self.scan_cache:
+            with metrics.phase("fingerprint_ms"):
+                cache_key = self._scan_cache_key(page.url, await self._dom_fingerprint(page, frame_filter), expression,
+                                                 argument, frame_filter)
+        response = await asyncio.to_thread(self._cached_results, cache_key, metrics) if cache_key else None
+
+        if response is None:
+            with metrics.phase("inject_ms"):
+                await self._inject_axe(page)
+            if self._requires_rule_resolution(options):
+                with metrics.phase("resolve_rules_ms"):
+                    options = self._resolve_options(options) or self._resolve_options(options, await self.get_rules(page))
+                expression, argument = self._build_evaluate_arguments(context, options, result_filter)
+            if frame_filter:
+                with metrics.phase("inject_frames_ms"):
+                    argument = self._exclude_frames(argument, await self._inject_axe_into_frames(page, frame_filter))
+            response = await self._evaluate_axe(page, expression, argument, metrics)
+            if cache_key:
+                await asyncio.to_thread(self.scan_cache.put, cache_key, response)
+
+        return response, metrics
+
+    async def _process_results(self,
+                               response: dict,
+                               filename: str,
+                               report_on_violation_only: bool,
+                               strict_mode: bool,
+                               html_report_generated: bool,
+                               json_report_generated: bool,
+                               metrics: ScanMetrics = None) -> dict:
+        """This logs the scan summary and generates the requested reports on a worker thread, so the event loop is not blocked."""
+        metrics = metrics or ScanMetrics(url=response["url"], filename=filename, axe_version=self.axe_version)
+        await asyncio.to_thread(self._record_results, response, filename, report_on_violation_only,
+                                html_report_generated, json_report_generated, metrics)
+        return self._finish_results(response, strict_mode, metrics)
+
+    async def _evaluate_axe(self, page: Page, expression: str, argument: list | None, metrics: ScanMetrics) -> dict:
+        """This runs axe-core in the page, timing the run and transfer of results separately if collecting metrics."""
+        if not self._collecting_metrics():
+            return await page.evaluate(expression, argument)
+
+        start = time.perf_counter()
+        timed_results = await page.evaluate(self._timed_expression(expression, argument), argument)
+        return self._record_axe_timings(metrics, timed_results, start)
+
+    async def _complete_pre_scan_actions(self, page: Page, actions: dict) -> None:
+        """This completes any pre-scan actions provided, in the same format as Axe._complete_pre_scan_actions()."""
+        self._check_pre_scan_actions(actions)
+
+        await self._resolve_pre_scan_action(actions)()
+
+        assertion = self._resolve_pre_scan_assertion(actions, expect)
+        if assertion:
+            await assertion()
+
+        if "wait_time" in actions and isinstance(actions["wait_time"], int):
+            await page.wait_for_timeout(actions["wait_time"])
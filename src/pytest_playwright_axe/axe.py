@@ -1,13 +1,47 @@
+import gzip
+import hashlib
 import logging
 import os
 import json
 from html import escape
 import re
+import queue
+import threading
+import time
+import weakref
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from dataclasses import asdict
 from datetime import datetime
-from playwright.sync_api import Page, Locator, expect
+from playwright.sync_api import Page, Frame, Locator, BrowserContext, Error as PlaywrightError, expect, sync_playwright
 from pathlib import Path
+from typing import Any, IO, TYPE_CHECKING
+from .crawl_frontier import CrawlFrontier
+from .exceptions import AxeAccessibilityException
+from .options import AxeContext, AxeOptions, FrameFilter, ResultFilter
+from .report_writer import ReportWriter
+from .scan_cache import ScanCache
+from .scan_metrics import ScanMetrics
+from .scripts import (AXE_LOADED_CHECK, AXE_RUN_SCRIPT, CHANGED_REGIONS_CONTEXT, CHANGED_REGIONS_SCRIPT, DOM_FINGERPRINT_SCRIPT,
+                      DOM_SIGNATURE_SCRIPT, FRAME_MATCHES_SCRIPT, FRAME_SELECTOR_SCRIPT, LINKS_SCRIPT, MUTATION_RECORDER_SCRIPT,
+                      NODES_IN_CHANGED_REGIONS_SCRIPT, SHAPE_RESULTS_SCRIPT, TIMED_AXE_COMMAND, TIMED_AXE_RUN_SCRIPT)
+from .template_sampler import TemplateSampler
+
+try:
+    from compression import zstd
+except ImportError:
+    # zstd is only available in the standard library from Python 3.14
+    zstd = None
+
+if TYPE_CHECKING:
+    from .consolidated_report import ConsolidatedReport
+    from .snapshot_store import SnapshotStore
+    from .violation_aggregator import ViolationAggregator
 
 logger = logging.getLogger(__name__)
+# Scan metrics are logged as a line of JSON per scan at DEBUG level, for collection by log aggregation tools
+metrics_logger = logging.getLogger(f"{__name__}.metrics")
 
 RESOURCES_DIR = Path(__file__).parent.joinpath("resources")
 AXE_PATH = RESOURCES_DIR.joinpath("axe.js")
@@ -34,95 +68,270 @@ KEY_MAPPING = {
     "toolOptions": "Tool Options",
     "timestamp": "Timestamp",
     "url": "URL",
+    "scopedRegions": "Scoped Regions",
+    "cachedTimestamp": "Cached Scan Timestamp",
 }
 
-WCAG_22AA_RULESET = ['wcag2a', 'wcag21a', 'wcag2aa',
-                     'wcag21aa', 'wcag22a', 'wcag22aa', 'best-practice']
-OPTIONS_WCAG_22AA = "{runOnly: {type: 'tag', values: " + \
-    str(WCAG_22AA_RULESET) + "}}"
+JSON_COMPRESSION_EXTENSIONS = {"": "", "gzip": ".gz", "zstd": ".zst"}
+SCOPED_RESULT_TYPES = ("violations", "incomplete", "passes")
+JSON_EXCLUDABLE_SECTIONS = ("passes", "incomplete", "inapplicable")
+JSON_READ_ERRORS = (ValueError, OSError, EOFError) + ((zstd.ZstdError,) if zstd else ())
 
+AXE_VERSION_PATTERN = re.compile(r"axe v(\d+\.\d+\.\d+)")
 
-class Axe:
+# Cache of axe-core script source, keyed by resolved path with the file mtime
+# stored alongside so an updated file on disk is picked up automatically.
+_AXE_SCRIPT_CACHE: dict[Path, tuple[int, str]] = {}
+_AXE_SCRIPT_CACHE_LOCK = threading.Lock()
+
+# Cache of AxeOptions with their tag-based runOnly resolved to rule IDs, keyed by the
+# axe-core version and the options as provided.
+_RESOLVED_OPTIONS_CACHE: dict[tuple[str, "AxeOptions"], "AxeOptions"] = {}
+_RESOLVED_OPTIONS_CACHE_LOCK = threading.Lock()
+
+
+def load_axe_script(axe_path: str | Path = AXE_PATH) -> str:
     """
-    This utility allows for interaction with axe-core, to allow for accessibility scanning of pages
-    under test to identify any accessibility concerns.
+    This returns the source of the axe-core script provided, reading it from disk only if it
+    has not been read before or has been modified since it was last read.
 
     Args:
-        output_directory (str | pathlib.Path): [Optional] The directory to output the reports to. If not provided, defaults to os.getcwd()/axe-reports directory.
-        css_override (str): [Optional] If provided, overrides the default CSS used within the HTML report generated.
-        use_minified_file (bool): [Optional] If true, use the minified axe-core file. If false (default), use the full axe-core file.
-        snapshot_directory (str | pathlib.Path): [Optional] The directory to check for JSON snapshots from previous runs to compare against.
+        axe_path (str | pathlib.Path): [Optional] The path to the axe-core script. If not provided, defaults to the full axe-core file.
+
+    Returns:
+        str: The axe-core script source.
+    """
+    resolved_path = Path(axe_path).resolve()
+    mtime = resolved_path.stat().st_mtime_ns
+
+    with _AXE_SCRIPT_CACHE_LOCK:
+        cached = _AXE_SCRIPT_CACHE.get(resolved_path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    script = resolved_path.read_text(encoding="UTF-8")
+    with _AXE_SCRIPT_CACHE_LOCK:
+        _AXE_SCRIPT_CACHE[resolved_path] = (mtime, script)
+    return script
+
+
+@lru_cache(maxsize=8)
+def _report_style(css_path: Path, mtime: int) -> str:
+    """This returns the style element for the CSS file provided, cached per modification time of the file."""
+    return f"<style>{css_path.read_text(encoding='UTF-8')}</style>"
+
+
+@lru_cache(maxsize=1024)
+def _wcag_labels(tags: tuple[str, ...]) -> str:
+    """This returns the human-readable WCAG labels for the axe-core tags provided, cached per set of tags."""
+    return ", ".join(WCAG_KEYS[tag] for tag in tags if tag in WCAG_KEYS)
+
+
+@lru_cache(maxsize=64)
+def _table_header(headers: tuple[tuple[str, str, bool], ...]) -> str:
+    """This returns the header cells for a report table, cached per set of headers."""
+    return "".join(f'<th style="{"text-align: center; " if centered else ""}width: {width}%">{title}</th>'
+                   for title, width, centered in headers)
+
+
+@lru_cache(maxsize=4096)
+def _failure_summary_html(failure_summary: str) -> str:
+    """This returns the HTML for a node's failure summary, cached as summaries are often repeated across nodes."""
+    return escape(failure_summary).replace(
+        "Fix any of the following:", "<strong>Fix any of the following:</strong><br />").replace("\n ", "<br /> &bullet;")
+
+
+def get_axe_version(axe_path: str | Path = AXE_PATH) -> str:
+    """
+    This returns the axe-core version from the header of the axe-core script provided.
+
+    Args:
+        axe_path (str | pathlib.Path): [Optional] The path to the axe-core script. If not provided, defaults to the full axe-core file.
+
+    Returns:
+        str: The axe-core version (e.g. 4.11.4), or an empty string if it could not be determined.
+    """
+    version_match = AXE_VERSION_PATTERN.search(load_axe_script(axe_path)[:200])
+    return version_match.group(1) if version_match else ""
+
+
+def preload_axe_script(*axe_paths: str | Path) -> None:
+    """
+    This loads the axe-core scripts provided into the script cache ahead of any scans.
+
+    Args:
+        *axe_paths (str | pathlib.Path): [Optional] The axe-core scripts to load. If not provided, both the full and minified files are loaded.
 
     Example:
         ```
-        # Default usage
-        axe = Axe()
-        # Custom output directory using minified file
-        axe = Axe(output_directory="accessibility-results", use_minified_file=True)
-        # Snapshot directory specified and custom CSS
-        axe = Axe(
-            snapshot_directory=Path(__file__).parent.joinpath("snapshots"), 
-            css_override=Path(__file__).parent.joinpath("style.css")
-        )
+        # Load both bundled axe-core files before a test session starts
+        preload_axe_script()
         ```
     """
+    for axe_path in axe_paths or (AXE_PATH, MIN_AXE_PATH):
+        load_axe_script(axe_path)
+
+
+def invalidate_axe_script_cache(axe_path: str | Path = None) -> None:
+    """
+    This removes an axe-core script from the script cache, so it is read from disk on next use.
+
+    Args:
+        axe_path (str | pathlib.Path): [Optional] The script to remove from the cache. If not provided, the whole cache is cleared.
+    """
+    with _AXE_SCRIPT_CACHE_LOCK:
+        if axe_path is None:
+            _AXE_SCRIPT_CACHE.clear()
+        else:
+            _AXE_SCRIPT_CACHE.pop(Path(axe_path).resolve(), None)
+
+
+def open_json_file(path: str | Path, mode: str = "r") -> IO[str]:
+    """
+    This opens a JSON file for reading or writing as text, compressing or decompressing it if the path
+    ends in .gz (gzip) or .zst (zstd, Python 3.14 or greater only).
+
+    Args:
+        path (str | pathlib.Path): The path of the JSON file.
+        mode (str): [Optional] "r" (default) to read the file, or "w" to write it.
+
+    Returns:
+        IO[str]: The opened file.
+    """
+    path = Path(path)
+    if path.suffix == ".gz":
+        return gzip.open(path, f"{mode}t", encoding="utf-8")
+    if path.suffix == ".zst":
+        if zstd is None:
+            raise AxeAccessibilityException("zstd compression requires Python 3.14 or greater.")
+        return zstd.open(path, f"{mode}t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+def format_node_target(target: list, separator: str = ", ") -> str:
+    """
+    This formats the target selector of an axe-core node as a single string. Selectors for elements within
+    iframes or shadow DOM (provided by axe-core as nested lists) are joined with " >>> ".
+
+    Args:
+        target (list): The target list from an axe-core node.
+        separator (str): [Optional] The separator between each selector in the target. Defaults to ", ".
+
+    Returns:
+        str: The formatted target selector.
+    """
+    return separator.join(part if isinstance(part, str) else " >>> ".join(part) for part in target)
+
+
+def node_fingerprint(rule_id: str, node: dict, include_html: bool = True) -> str:
+    """
+    This generates a fingerprint identifying an axe-core node for a rule, made up of the rule ID, the target
+    selector and a hash of the node's HTML (with whitespace normalized), so the same element can be matched
+    between scans. If the node already has a "fingerprint" value (e.g. from a stored snapshot), it is used.
+
+    If the node has no HTML (e.g. it was removed by a ResultFilter with strip_html set), the hash is left
+    empty, so the fingerprint is the same as one generated with include_html set to false.
+
+    Args:
+        rule_id (str): The ID of the rule the node was reported against.
+        node (dict): The axe-core node.
+        include_html (bool): [Optional] If true (default), include the hash of the node's HTML. If false, only the rule ID and target selector are used.
+
+    Returns:
+        str: The fingerprint for the node.
+    """
+    fingerprint = node.get("fingerprint")
+    if fingerprint is None:
+        normalized_html = " ".join(node.get("html", "").split())
+        html_hash = hashlib.sha1(normalized_html.encode("utf-8")).hexdigest()[:16] if normalized_html else ""
+        fingerprint = f"{rule_id}|{format_node_target(node.get('target', []))}|{html_hash}"
+
+    return fingerprint if include_html else f"{fingerprint.rsplit('|', 1)[0]}|"
+
+
+class AxeBase:
+    """
+    This holds the configuration, result processing and reporting shared by Axe and AsyncAxe, which drive the pages
+    scanned using the Playwright sync and async APIs respectively. See Axe for details of the arguments.
+    """
+
+    _locator_type: type
 
     def __init__(self, 
                  output_directory: str | Path = DEFAULT_REPORT_PATH,
                  css_override: str = "", 
                  use_minified_file: bool = False,
-                 snapshot_directory: str | Path = None) -> None:
+                 snapshot_directory: str | Path = None,
+                 use_init_script: bool = False,
+                 report_writer: ReportWriter = None,
+                 json_compact: bool = False,
+                 json_compression: str = "",
+                 json_exclude: list[str] = None,
+                 strict_mode: bool = False,
+                 result_callback: Callable[[dict], None] = None,
+                 snapshot_store: "SnapshotStore" = None,
+                 scan_cache: ScanCache = None,
+                 metrics_callback: Callable[[ScanMetrics], None] = None,
+                 violation_aggregator: "ViolationAggregator" = None) -> None:
         self.output_directory = Path(output_directory)
         self.css_override = css_override
         self.axe_path = MIN_AXE_PATH if use_minified_file else AXE_PATH
+        self.axe_version = get_axe_version(self.axe_path)
         self.snapshot_directory = Path(snapshot_directory) if snapshot_directory else None
+        self.use_init_script = use_init_script
+        self._init_script_contexts: weakref.WeakSet[BrowserContext] = weakref.WeakSet()
+        self.report_writer = report_writer
+
+        if json_compression not in JSON_COMPRESSION_EXTENSIONS:
+            raise AxeAccessibilityException(f"JSON compression provided [{json_compression}] is not supported.")
+        if json_compression == "zstd" and zstd is None:
+            raise AxeAccessibilityException("zstd compression requires Python 3.14 or greater.")
+        for section in json_exclude or []:
+            if section not in JSON_EXCLUDABLE_SECTIONS:
+                raise AxeAccessibilityException(f"JSON section provided [{section}] cannot be excluded.")
+
+        self.json_compact = json_compact
+        self.json_compression = json_compression
+        self.json_exclude = set(json_exclude or [])
+        self.strict_mode = strict_mode
+        self.result_callback = result_callback
+        self.snapshot_store = snapshot_store
+        self.scan_cache = scan_cache
+        self.metrics_callback = metrics_callback
+        self.violation_aggregator = violation_aggregator
+        self.last_metrics: ScanMetrics | None = None
+        self._active_metrics = threading.local()
+
+    def _strict_mode(self, strict_mode: bool | None) -> bool:
+        """This returns the strict_mode provided, or the strict_mode of the instance if not provided."""
+        return self.strict_mode if strict_mode is None else strict_mode
+
+    def _prepare_scan(self,
+                      url: str,
+                      filename: str,
+                      context: str | AxeContext,
+                      options: str | AxeOptions,
+                      result_filter: ResultFilter | None,
+                      frame_filter: FrameFilter | None) -> tuple[ScanMetrics, str, list | None, FrameFilter | None]:
+        """This creates the metrics for a scan and builds the expression and argument to evaluate, checking the frame filter."""
+        metrics = ScanMetrics(url=url, filename=filename, axe_version=self.axe_version)
+        expression, argument = self._build_evaluate_arguments(context, options, result_filter)
+        return metrics, expression, argument, self._check_frame_filter(frame_filter, options, argument)
+
+    def _cached_results(self, cache_key: str | None, metrics: ScanMetrics) -> dict | None:
+        """This returns the scan cache results for the key provided (if any), recording whether the cache was hit."""
+        response = self.scan_cache.get(cache_key) if cache_key else None
+        metrics.cache_hit = response is not None
+        return response
 
-    def run(self,
-            page: Page,
-            filename: str = "",
-            context: str = "",
-            options: str = "",
-            report_on_violation_only: bool = False,
-            strict_mode: bool = False,
-            html_report_generated: bool = True,
-            json_report_generated: bool = True) -> dict:
-        """
-        This runs axe-core against the page provided.
-
-        Args:
-            page (playwright.sync_api.Page): The page object to execute axe-core against.
-            filename (str): [Optional] The filename to use for the outputted reports. If not provided, defaults to the URL under test.
-            context (str): [Optional] If provided, a stringified JavaScript object to denote the context axe-core should use.
-            options (str): [Optional] If provided, a stringified JavaScript object to denote the options axe-core should use.
-            report_on_violation_only (bool): [Optional] If true, only generates an Axe report if a violation is detected. If false (default), always generate a report.
-            strict_mode (bool): [Optional] If true, raise an exception if a violation is detected. If false (default), proceed with test execution.
-            html_report_generated (bool): [Optional] If true (default), generates a html report for the page scanned. If false, no html report is generated.
-            json_report_generated (bool): [Optional] If true (default), generates a json report for the page scanned. If false, no json report is generated.
-
-        Returns:
-            dict: A Python dictionary with the axe-core output of the page scanned.
-        
-        Example:
-            ```
-            # Default usage
-            def test_example(page: Page) -> None:
-                axe = Axe()
-                axe.run(page)
-
-                # With no HTML or JSON reports, capture results in variable
-                results = axe.run(
-                    page, 
-                    html_report_generated=False, 
-                    json_report_generated=False
-                )
-            ```        
-        """
-
-        page.evaluate(self.axe_path.read_text(encoding="UTF-8"))
-
-        response = page.evaluate(
-            "axe.run(" + self._build_run_command(context, options) + ").then(results => {return results;})")
-
+    def _record_results(self,
+                        response: dict,
+                        filename: str,
+                        report_on_violation_only: bool,
+                        html_report_generated: bool,
+                        json_report_generated: bool,
+                        metrics: ScanMetrics) -> None:
+        """This logs the scan summary, generates the requested reports and saves the results to the snapshot store and violation aggregator."""
         logger.info(
             f"Axe scan summary of [{response['url']}]:\n"
             f"- Passes = {len(response['passes'])}\n"
@@ -131,138 +340,330 @@ class Axe:
             f"- Incomplete = {len(response['incomplete'])}"
         )
 
-        violations_detected = len(response["violations"]) > 0
-        if not report_on_violation_only or (report_on_violation_only and violations_detected):
-            if html_report_generated:
-                self._create_html_report(response, filename)
-            if json_report_generated:
-                self._create_json_report(response, filename)
+        self._active_metrics.current = metrics
+        try:
+            violations_detected = len(response["violations"]) > 0
+            if not report_on_violation_only or (report_on_violation_only and violations_detected):
+                if html_report_generated:
+                    with metrics.phase("html_report_ms"):
+                        self._write_report(self._create_html_report, response, filename)
+                if json_report_generated:
+                    with metrics.phase("json_report_ms"):
+                        self._write_report(self._create_json_report, response, filename)
+
+            if self.snapshot_store:
+                with metrics.phase("snapshot_store_ms"):
+                    self.snapshot_store.put(filename or self._modify_filename_for_report(response["url"]), response)
+
+            if self.violation_aggregator:
+                with metrics.phase("aggregate_ms"):
+                    self.violation_aggregator.add(response)
+        finally:
+            self._active_metrics.current = None
+
+    def _finish_results(self, response: dict, strict_mode: bool, metrics: ScanMetrics) -> dict:
+        """This passes the results to the result and metrics callbacks, raising an exception if in strict mode and violations were found."""
+        if self.result_callback:
+            self.result_callback(response)
+
+        if self._collecting_metrics():
+            self._emit_metrics(metrics, response)
+
+        if strict_mode:
+            self._raise_on_violations(response)
+
+        return response
 
-        if violations_detected and strict_mode:
+    def _collecting_metrics(self) -> bool:
+        """This determines whether scan metrics are needed, either for the metrics callback or the metrics logger."""
+        return self.metrics_callback is not None or metrics_logger.isEnabledFor(logging.DEBUG)
+
+    def _timed_expression(self, expression: str, argument: list | None) -> str:
+        """This wraps the expression to run axe-core so it also returns the time taken to run in the page."""
+        return TIMED_AXE_RUN_SCRIPT if argument is not None else TIMED_AXE_COMMAND.format(command=expression)
+
+    def _record_axe_timings(self, metrics: ScanMetrics, timed_results: dict, start: float) -> dict:
+        """This records the axe-core run and transfer times from a timed evaluation, returning the results."""
+        run_ms = timed_results["runMs"]
+        metrics.phases["axe_run_ms"] = metrics.phases.get("axe_run_ms", 0.0) + run_ms
+        metrics.phases["transfer_ms"] = metrics.phases.get("transfer_ms", 0.0) + max(
+            0.0, (time.perf_counter() - start) * 1000 - run_ms)
+        return timed_results["results"]
+
+    def _emit_metrics(self, metrics: ScanMetrics, response: dict) -> None:
+        """This passes the metrics for a scan to the metrics callback and logger."""
+        metrics.url = response["url"]
+        if not metrics.cache_hit:
+            metrics.payload_bytes = len(json.dumps(response, separators=(",", ":")).encode("utf-8"))
+
+        self.last_metrics = metrics
+        if self.metrics_callback:
+            self.metrics_callback(metrics)
+        metrics_logger.debug(metrics.to_json())
+
+    def _raise_on_violations(self, response: dict) -> None:
+        """This raises an exception if the axe-core results provided contain any violations."""
+        if len(response["violations"]) > 0:
             raise AxeAccessibilityException(
                 f"Axe Accessibility Violation detected on page: {response['url']}")
 
-        return response
-
-    def run_list(self,
-                 page: Page,
-                 page_list: list[str | dict],
-                 use_list_for_filename: bool = True,
-                 context: str = "",
-                 options: str = "",
-                 report_on_violation_only: bool = False,
-                 strict_mode: bool = False,
-                 html_report_generated: bool = True,
-                 json_report_generated: bool = True) -> dict:
+    def flush_reports(self) -> None:
         """
-        This runs axe-core against a list of pages provided.
-
-        NOTE: It is recommended to set a --base-url value when running Playwright using this functionality, so you only need to pass in a partial URL within the page_list.
-
-        Args:
-            page (playwright.sync_api.Page): The page object to execute axe-core against.
-            page_list (list[str | dict]): A list of URLs to execute against. If a dict is provided, it can include actions and assertions to complete prior to scanning (see below for key/values to provide).
-            use_list_for_filename (bool): If true, based filenames off the list provided. If false, use the full URL under test for the filename.
-            context (str): [Optional] If provided, a stringified JavaScript object to denote the context axe-core should use.
-            options (str): [Optional] If provided, a stringified JavaScript object to denote the options axe-core should use.
-            report_on_violation_only (bool): [Optional] If true, only generates an Axe report if a violation is detected. If false (default), always generate a report.
-            strict_mode (bool): [Optional] If true, raise an exception if a violation is detected. If false (default), proceed with test execution.
-            html_report_generated (bool): [Optional] If true (default), generates a html report for the page scanned. If false, no html report is generated.
-            json_report_generated (bool): [Optional] If true (default), generates a json report for the page scanned. If false, no json report is generated.
-
-        For page_list, the following key/value pairs can be provided if using a dict:
+        This waits for any reports being written in the background to complete, raising an
+        AxeAccessibilityException if any failed. If no report_writer was provided, this does nothing.
 
-        - **url (str)**: The url to initially navigate to.
-        - **action (str)**: The action to undertake. Can be one of the following: "click", "dblclick", "hover", "fill", "type" or "select_option".
-        - **locator (playwright.sync_api.Locator)**: The locator for the element to interact with.
-        - **value (str)**: The value to use (if the action is "fill", "type" or "select_option").
-        - **assert_locator (playwright.sync_api.Locator)**: [Optional] The locator to do an assertion on.
-        - **assert_type (str)**: [Optional] The type of assertion to do against the locator. Can be one of the following: "to_be_visible", "to_be_hidden", "to_be_enabled", "to_contain_text" or "to_not_contain_text".
-        - **assert_value (str)**: [Optional] The value to assert (if the action is "to_contain_text" or "to_not_contain_text")
-        - **wait_time (int)**: [Optional] If specified, the amount of time to wait after completing the action in milliseconds.
-
-        Returns:
-            dict: A Python dictionary with the axe-core output of all the pages scanned, with the page_list value used as the key for each report.
- 
         Example:
             ```
-            # --base-url set to: https://example.com
-            def test_example(page: Page) -> None:
-                # Default usage
-                Axe().run_list(
-                    page, 
-                    ["/home", "/search"]
-                )
-                
-                # Usage with page_list including str and dict
-                page_list = [
-                    "/home",
-                    {
-                        "url": "/search",
-                        "action": "fill",
-                        "locator": page.locator("#search-bar"),
-                        "value": "test item",
-                        "assert_locator": page.locator("#search-results-summary"),
-                        "assert_type": "to_contain_text",
-                        "assert_value": "1 of 1 results"
-                    }
-                ]
-                axe = Axe()
-                axe.run_list(page, page_list)
-            ``` 
+            axe = Axe(report_writer=ReportWriter())
+            axe.run(page)
+            axe.flush_reports()
+            ```
         """
-
-        results = {}
+        if self.report_writer:
+            self.report_writer.flush()
+
+    def _write_report(self, report_function: Callable[[dict, str], None], response: dict, filename: str) -> None:
+        """This writes a report immediately, or hands it to the report writer if one was provided."""
+        if self.report_writer:
+            self.report_writer.submit(report_function, response, filename)
+        else:
+            report_function(response, filename)
+
+    def _plan_page_list(self, page_list: list[str | dict], use_list_for_filename: bool) -> list[tuple[str, str, str | dict]]:
+        """This determines the results key and filename for each entry in the page list, validating any actions provided."""
+        planned_pages = []
         for selected_page in page_list:
             if isinstance(selected_page, dict):
-                page.goto(selected_page["url"])
-                self._complete_pre_scan_actions(page, selected_page)
+                self._check_pre_scan_actions(selected_page)
                 results_key = f"{selected_page["url"]}_{selected_page["action"]}"
-                filename = self._modify_filename_for_report(
-                    f"{selected_page["url"]}_{selected_page["action"]}") if use_list_for_filename else ""
             else:
-                page.goto(selected_page)
-                filename = self._modify_filename_for_report(
-                    selected_page) if use_list_for_filename else ""
                 results_key = selected_page
-            
-            results[results_key] = self.run(
-                page,
-                filename=filename,
-                context=context,
-                options=options,
-                report_on_violation_only=report_on_violation_only,
-                strict_mode=strict_mode,
-                html_report_generated=html_report_generated,
-                json_report_generated=json_report_generated
-            )
-        return results
 
+            filename = self._modify_filename_for_report(results_key) if use_list_for_filename else ""
+            planned_pages.append((results_key, filename, selected_page))
+
+        return planned_pages
+
+    def _build_scan_arguments(self,
+                              context: str | AxeContext,
+                              options: str | AxeOptions,
+                              report_on_violation_only: bool,
+                              strict_mode: bool,
+                              html_report_generated: bool,
+                              json_report_generated: bool,
+                              result_filter: ResultFilter | None,
+                              frame_filter: FrameFilter | None) -> dict:
+        """This builds the arguments passed to run() for each page scanned from a page list or crawl."""
+        return {
+            "context": context,
+            "options": options,
+            "report_on_violation_only": report_on_violation_only,
+            "strict_mode": strict_mode,
+            "html_report_generated": html_report_generated,
+            "json_report_generated": json_report_generated,
+            "result_filter": result_filter,
+            "frame_filter": frame_filter
+        }
 
-    def get_rules(self, page: Page, rules: list[str] = None) -> list[dict]:
+    def _skipped_by_url(self, sampler: TemplateSampler | None, url: str) -> bool:
+        """This determines whether a sampler grouping pages by URL skips the URL provided, recording it against its group."""
+        return bool(sampler) and not sampler.group_by_dom and not sampler.claim(url, sampler.url_group(url))
+
+    def _report_list_result(self,
+                            consolidated_report: "ConsolidatedReport",
+                            results_key: str,
+                            response: dict,
+                            filename: str,
+                            scan_arguments: dict,
+                            strict_mode: bool,
+                            sampler: TemplateSampler = None) -> None:
+        """This adds a page's results to the consolidated report, raising an exception if in strict mode and violations were found."""
+        self._add_to_consolidated_report(consolidated_report, results_key, response, filename, scan_arguments, sampler)
+        if strict_mode:
+            self._raise_on_violations(response)
+
+    def _collect_list_results(self,
+                              planned_pages: list[tuple[str, str, str | dict]],
+                              scan_results: dict[int, dict],
+                              scan_errors: dict[int, BaseException],
+                              scan_arguments: dict,
+                              strict_mode: bool,
+                              consolidated_report: "ConsolidatedReport" = None,
+                              sampler: TemplateSampler = None) -> dict:
+        """This collects the results of a concurrent scan in page list order, raising the first error (or violation, if in strict mode) in page list order."""
+        if consolidated_report:
+            self._add_all_to_consolidated_report(consolidated_report, planned_pages, scan_results,
+                                                 scan_errors, scan_arguments, strict_mode, sampler)
+
+        if scan_errors:
+            raise scan_errors[min(scan_errors)]
+
+        return {results_key: scan_results[index] for index, (results_key, _, _) in enumerate(planned_pages)
+                if index in scan_results}
+
+    def _base_node_targets(self, base_results: dict) -> list[str | None]:
+        """This returns the selector of each node in the base results, or None for nodes within iframes or shadow DOM."""
+        return [node["target"][0] if len(node["target"]) == 1 and isinstance(node["target"][0], str) else None
+                for result_type in SCOPED_RESULT_TYPES
+                for rule in base_results[result_type]
+                for node in rule["nodes"]]
+
+    def _merge_scoped_results(self,
+                              base_results: dict,
+                              scoped_results: dict | None,
+                              replaced: list[bool],
+                              region_count: int) -> dict:
         """
-        This runs axe.getRules(), returning the specified rules (or all if no ruleset provided).
+        This merges the results of a scan of the changed regions into the base results, replacing any base nodes within them.
+        Nodes removed from the base results by the result filter (e.g. passes with drop_pass_nodes) cannot be matched
+        against the changed regions, so a rule with removed nodes found by both scans takes the larger of the two node
+        counts rather than counting the nodes in the changed regions twice.
+        """
+        merged = dict(scoped_results or base_results)
+        merged["scopedRegions"] = region_count
+        replaced_flags = iter(replaced)
+
+        for result_type in SCOPED_RESULT_TYPES:
+            rules = {}
+            for rule in base_results[result_type]:
+                kept_nodes = [node for node in rule["nodes"] if not next(replaced_flags, False)]
+                node_count = self._node_count(rule) - (len(rule["nodes"]) - len(kept_nodes))
+                if node_count > 0:
+                    rules[rule["id"]] = {**rule, "nodes": kept_nodes}
+                    if "nodeCount" in rule:
+                        rules[rule["id"]]["nodeCount"] = node_count
+
+            for rule in (scoped_results or {}).get(result_type, []):
+                if rule["id"] in rules:
+                    base_rule = rules[rule["id"]]
+                    rules[rule["id"]] = {**rule, "nodes": base_rule["nodes"] + rule["nodes"]}
+                    if "nodeCount" in rule:
+                        base_count = self._node_count(base_rule)
+                        rules[rule["id"]]["nodeCount"] = max(base_count, rule["nodeCount"]) \
+                            if base_count > len(base_rule["nodes"]) else base_count + rule["nodeCount"]
+                else:
+                    rules[rule["id"]] = rule
+
+            merged[result_type] = list(rules.values())
+
+        applicable = {rule["id"] for result_type in SCOPED_RESULT_TYPES for rule in merged[result_type]}
+        inapplicable = {}
+        for rule in base_results["inapplicable"] + (scoped_results or {}).get("inapplicable", []):
+            if rule["id"] not in applicable:
+                inapplicable.setdefault(rule["id"], rule)
+        merged["inapplicable"] = list(inapplicable.values())
+
+        return merged
+
+    def _add_to_consolidated_report(self,
+                                    consolidated_report: "ConsolidatedReport",
+                                    results_key: str,
+                                    response: dict,
+                                    filename: str,
+                                    scan_arguments: dict,
+                                    sampler: TemplateSampler = None) -> None:
+        """This adds a page's results to the consolidated report, linking to the page's HTML report if one was generated."""
+        html_report_generated = scan_arguments["html_report_generated"] and (
+            not scan_arguments["report_on_violation_only"] or len(response["violations"]) > 0)
+        report_filename = filename or self._modify_filename_for_report(response["url"])
+        consolidated_report.add(results_key, response, report_filename if html_report_generated else "",
+                                sampler.group_of(results_key) if sampler else "")
+
+    def _add_all_to_consolidated_report(self,
+                                        consolidated_report: "ConsolidatedReport",
+                                        planned_pages: list[tuple[str, str, str | dict]],
+                                        scan_results: dict[int, dict],
+                                        scan_errors: dict[int, Exception],
+                                        scan_arguments: dict,
+                                        strict_mode: bool,
+                                        sampler: TemplateSampler = None) -> None:
+        """This adds the results of a parallel scan to the consolidated report in page list order, recording any violation to raise."""
+        for index, (results_key, filename, _) in enumerate(planned_pages):
+            if index not in scan_results:
+                continue
+
+            self._add_to_consolidated_report(consolidated_report, results_key, scan_results[index],
+                                             filename, scan_arguments, sampler)
+            if strict_mode and len(scan_results[index]["violations"]) > 0 and index not in scan_errors:
+                scan_errors[index] = AxeAccessibilityException(
+                    f"Axe Accessibility Violation detected on page: {scan_results[index]['url']}")
+
+        if sampler:
+            consolidated_report.add_groups(sampler.groups)
+
+    def _record_crawl_result(self,
+                             frontier: CrawlFrontier,
+                             url: str,
+                             response: dict,
+                             links: list[str],
+                             final_url: str,
+                             filename: str,
+                             scan_arguments: dict,
+                             scan_results: dict[str, dict],
+                             consolidated_report: "ConsolidatedReport" = None) -> None:
+        """This records the results of a page crawled, adding the links found on the page to the frontier."""
+        scan_results[url] = response
+        if consolidated_report:
+            self._add_to_consolidated_report(consolidated_report, url, response, filename, scan_arguments)
+        frontier.complete(url, links, final_url)
+
+    def _finish_crawl(self, frontier: CrawlFrontier, scan_results: dict[str, dict], strict_mode: bool) -> dict:
+        """This logs the crawl stats, raising an exception for the first page with a violation if in strict mode."""
+        logger.info(f"Crawl complete: {frontier.stats()}")
+        if strict_mode:
+            for response in scan_results.values():
+                self._raise_on_violations(response)
+        return scan_results
+
+    def diff_results(self, data: dict, snapshot_data: dict) -> dict:
+        """
+        This compares the violations from an axe-core scan against a previous scan (e.g. a snapshot), at both
+        rule and node level. Nodes are matched using node_fingerprint(), so an element that is fixed while a
+        different element breaks for the same rule is reported, even though the rule's node count is unchanged.
 
         Args:
-            page (playwright.sync_api.Page): The page object to execute axe-core against.
-            rules (list[str]): [Optional] A list of rules to return. If not provided, all rules are returned.
-        
+            data (dict): The axe-core results from the current scan.
+            snapshot_data (dict): The axe-core results from the previous scan to compare against.
+
         Returns:
-            list[dict]: A list of dictionaries containing the axe-core rules returned.
-        
+            dict: A Python dictionary with a "changes" list (one entry per rule changed, as shown in the HTML report), and "added_nodes" and "removed_nodes" lists across all rules.
+
         Example:
             ```
-            # Standard usage
-            axe = Axe()
-            rules = axe.get_rules(page)
-            # Get only specific rules
-            rules = axe.get_rules(page, rules=["color-contrast", "image-alt"])
+            diff = axe.diff_results(results, previous_results)
+            for node in diff["added_nodes"]:
+                print(node["rule_id"], node["target"])
             ```
         """
-        page.evaluate(self.axe_path.read_text(encoding="UTF-8"))
+        changes = self._collect_all_changes(data, snapshot_data)
 
-        return page.evaluate(
-            f"axe.getRules({"" if rules is None else str(rules)});")
+        return {
+            "changes": changes,
+            "added_nodes": [node for change in changes for node in change["added_nodes"]],
+            "removed_nodes": [node for change in changes for node in change["removed_nodes"]]
+        }
+
+    def _check_frame_filter(self,
+                            frame_filter: FrameFilter | None,
+                            options: str | AxeOptions,
+                            argument: list | None) -> FrameFilter | None:
+        """This checks the frame filter can be used with the scan, returning None if axe-core is set not to scan iframes."""
+        if frame_filter is None or (isinstance(options, AxeOptions) and options.iframes is False):
+            return None
+
+        if frame_filter.excludes_frames and argument is None:
+            raise AxeAccessibilityException("A frame_filter that excludes frames requires context and options to be "
+                                            "AxeContext and AxeOptions objects (or not provided).")
+        return frame_filter
+
+    def _exclude_frames(self, argument: list | None, excluded: list[str | dict]) -> list | None:
+        """This adds the frames provided to the exclusions of the context in the evaluate argument."""
+        if not excluded:
+            return argument
+
+        context = dict(argument[0] or {})
+        context["exclude"] = [*context.get("exclude", []), *excluded]
+        return [context, *argument[1:]]
 
     def _check_pre_scan_actions(self, actions: dict) -> None:
         """This checks the pre-scan actions provided are valid and excepts if not."""
@@ -276,86 +677,134 @@ class Axe:
         if "value" not in actions and actions["action"] in ["fill", "type", "select_option"]:
             raise AxeAccessibilityException("value is required for this action type.")
 
-        if not isinstance(actions["locator"], Locator):
+        if not isinstance(actions["locator"], self._locator_type):
             raise AxeAccessibilityException("locator must be a Playwright Locator object.")
         
         self._check_pre_scan_assertions(actions)
 
         if "wait_time" in actions and not isinstance(actions["wait_time"], int):
             raise AxeAccessibilityException("wait_time must be an integer representing milliseconds.")
-        
+
     def _check_pre_scan_assertions(self, action: dict) -> None:
         """This checks the pre-scan assertions provided are valid and excepts if not."""
         if "assert_locator" in action and "assert_type" in action:
 
-            if not isinstance(action["assert_locator"], Locator):
+            if not isinstance(action["assert_locator"], self._locator_type):
                 raise AxeAccessibilityException("assert_locator must be a Playwright Locator object.")
 
             if "assert_value" not in action and action["assert_type"] in ["to_contain_text", "to_not_contain_text"]:
                 raise AxeAccessibilityException("assert_value is required for this assert_type.")
 
-    def _complete_pre_scan_actions(self, page: Page, actions: dict) -> None:
-        """This completes any pre-scan actions provided.
-        
-        Action format: dict
-        {
-            "action": [action],
-            "locator": [locator],
-            "value": [value (if applicable)],
-            "assert_locator": [assert_locator (if applicable)],
-            "assert_type": [assert_type (if applicable)],
-            "assert_value": [assert_value (if applicable)],
-            "wait_time": [wait_time (if applicable)]
-        }
-        """
-        self._check_pre_scan_actions(actions)
-
-        locator: Locator = actions["locator"]
+    def _resolve_pre_scan_action(self, actions: dict) -> Callable[[], Any]:
+        """This returns the locator call to make for the pre-scan action provided."""
+        locator = actions["locator"]
 
         match actions["action"]:
             case "click":
-                locator.click()
+                return locator.click
             case "dblclick":
-                locator.dblclick()
+                return locator.dblclick
             case "hover":
-                locator.hover()
+                return locator.hover
             case "fill":
-                locator.fill(actions["value"])
+                return partial(locator.fill, actions["value"])
             case "type":
-                locator.type(actions["value"])
+                return partial(locator.type, actions["value"])
             case "select_option":
-                locator.select_option(actions["value"])
+                return partial(locator.select_option, actions["value"])
             case _:
                 raise AxeAccessibilityException(f"Action type provided [{actions['action']}] is not supported.")
 
-        if "assert_locator" in actions and "assert_type" in actions:
-            
-            assert_locator: Locator = actions["assert_locator"]
-
-            match actions["assert_type"]:
-                case "to_be_visible":
-                    expect(assert_locator).to_be_visible()
-                case "to_be_hidden":
-                    expect(assert_locator).to_be_hidden()
-                case "to_be_enabled":
-                    expect(assert_locator).to_be_enabled()
-                case "to_contain_text":
-                    expect(assert_locator).to_contain_text(actions["assert_value"])
-                case "to_not_contain_text":
-                    expect(assert_locator).not_to_contain_text(actions["assert_value"])
-                case _:
-                    raise AxeAccessibilityException(f"Assert type provided [{actions['assert_type']}] is not supported.")
+    def _resolve_pre_scan_assertion(self, actions: dict, expect_function: Callable) -> Callable[[], Any] | None:
+        """This returns the assertion call to make for the pre-scan assertion provided, if one is provided."""
+        if "assert_locator" not in actions or "assert_type" not in actions:
+            return None
 
-        if "wait_time" in actions and isinstance(actions["wait_time"], int):
-            page.wait_for_timeout(actions["wait_time"])
+        assertions = expect_function(actions["assert_locator"])
+
+        match actions["assert_type"]:
+            case "to_be_visible":
+                return assertions.to_be_visible
+            case "to_be_hidden":
+                return assertions.to_be_hidden
+            case "to_be_enabled":
+                return assertions.to_be_enabled
+            case "to_contain_text":
+                return partial(assertions.to_contain_text, actions["assert_value"])
+            case "to_not_contain_text":
+                return partial(assertions.not_to_contain_text, actions["assert_value"])
+            case _:
+                raise AxeAccessibilityException(f"Assert type provided [{actions['assert_type']}] is not supported.")
 
-    def _build_run_command(self, context: str = "", options: str = "") -> str:
+    def _build_run_command(self, context: str | AxeContext = "", options: str | AxeOptions = "") -> str:
         """This builds the run command for axe-core based on the context and options provided."""
+        context = context if isinstance(context, str) else context.json
+        options = options if isinstance(options, str) else options.json
         if context and options:
             return f"{context}, {options}"
 
         return context or options
 
+    def _build_evaluate_command(self,
+                                context: str | AxeContext = "",
+                                options: str | AxeOptions = "",
+                                result_filter: ResultFilter = None) -> str:
+        """This builds the expression to evaluate in the page, running axe-core and applying any result filter provided."""
+        if result_filter is None:
+            return "axe.run(" + self._build_run_command(context, options) + ").then(results => {return results;})"
+
+        return ("axe.run(" + self._build_run_command(context, options) + ").then(results => (" +
+                SHAPE_RESULTS_SCRIPT + ")(results, " + json.dumps(asdict(result_filter)) + "))")
+
+    def _build_evaluate_arguments(self,
+                                  context: str | AxeContext = "",
+                                  options: str | AxeOptions = "",
+                                  result_filter: ResultFilter = None) -> tuple[str, list | None]:
+        """
+        This returns the expression and argument to evaluate in the page to run axe-core. AxeContext and AxeOptions are
+        passed as an argument to the same expression, whereas str context and options are built into the expression.
+        """
+        if (isinstance(context, str) and context) or (isinstance(options, str) and options):
+            return self._build_evaluate_command(context, options, result_filter), None
+
+        # An empty context is left out, as axe-core rejects it rather than scanning the whole page
+        return AXE_RUN_SCRIPT, [(context.axe_context or None) if context else None,
+                                options.axe_options if options else None,
+                                asdict(result_filter) if result_filter else None]
+
+    def _requires_rule_resolution(self, options: str | AxeOptions) -> bool:
+        """This determines whether the options provided need their run_only tags resolved to rule IDs."""
+        return isinstance(options, AxeOptions) and options.resolve_rules
+
+    def _resolve_options(self, options: AxeOptions, axe_rules: list[dict] = None) -> AxeOptions | None:
+        """This returns the options with run_only resolved to rule IDs, from the cache or the rules provided (or None if neither)."""
+        cache_key = (self.axe_version, options)
+        with _RESOLVED_OPTIONS_CACHE_LOCK:
+            if cache_key in _RESOLVED_OPTIONS_CACHE:
+                return _RESOLVED_OPTIONS_CACHE[cache_key]
+        if axe_rules is None:
+            return None
+
+        resolved_options = options.with_resolved_rules(axe_rules)
+        with _RESOLVED_OPTIONS_CACHE_LOCK:
+            _RESOLVED_OPTIONS_CACHE[cache_key] = resolved_options
+        return resolved_options
+
+    def _scan_cache_key(self,
+                        url: str,
+                        dom_fingerprint: str,
+                        expression: str,
+                        argument: list | None = None,
+                        frame_filter: FrameFilter = None) -> str:
+        """This builds the scan cache key for a page, based on its fingerprint and the scan settings."""
+        key_source = "\n".join([self.axe_version, url, dom_fingerprint, expression, json.dumps(argument, sort_keys=True),
+                                repr(frame_filter)])
+        return hashlib.sha256(key_source.encode("utf-8")).hexdigest()
+
+    def _node_count(self, rule: dict) -> int:
+        """This returns the number of nodes for a rule, including any removed by a result filter."""
+        return rule.get("nodeCount", len(rule["nodes"]))
+
     def _modify_filename_for_report(self, filename_to_modify: str) -> str:
         """This determines the filename to use for generated files."""
         if not filename_to_modify:
@@ -376,10 +825,16 @@ class Axe:
     def _create_json_report(self, data: dict, filename_override: str = "") -> None:
         """This creates a JSON report for the generated report data."""
         filename = f"{self._modify_filename_for_report(data["url"])}.json" if filename_override == "" else f"{filename_override}.json"
-        full_path = self._create_path_for_report(filename)
+        full_path = self._create_path_for_report(filename + JSON_COMPRESSION_EXTENSIONS[self.json_compression])
 
-        with open(full_path, 'w', encoding='utf-8') as file:
-            json.dump(data, file, indent=4)
+        if self.json_exclude:
+            data = {key: value for key, value in data.items() if key not in self.json_exclude}
+
+        with open_json_file(full_path, 'w') as file:
+            if self.json_compact:
+                json.dump(data, file, separators=(",", ":"))
+            else:
+                json.dump(data, file, indent=4)
 
         logger.info(f"JSON report generated: {full_path}")
 
@@ -389,7 +844,7 @@ class Axe:
         full_path = self._create_path_for_report(filename)
 
         with open(full_path, 'w', encoding='utf-8') as file:
-            file.write(self._generate_html(data, filename.replace(".html", "")))
+            file.writelines(self._iter_html(data, filename.replace(".html", "")))
 
         logger.info(f"HTML report generated: {full_path}")
 
@@ -398,36 +853,30 @@ class Axe:
         if self.css_override:
             return f"<style>{self.css_override}</style>"
 
-        return f"<style>{DEFAULT_CSS_PATH.read_text(encoding='UTF-8')}</style>"
-
+        return _report_style(DEFAULT_CSS_PATH, DEFAULT_CSS_PATH.stat().st_mtime_ns)
 
     def _wcag_tagging(self, tags: list[str]) -> str:
         """Convert axe-core tags to human-readable WCAG tags."""
-        wcag_tags = []
-        for tag in tags:
-            if tag in WCAG_KEYS:
-                wcag_tags.append(WCAG_KEYS[tag])
-        return ", ".join(wcag_tags)
-
+        return _wcag_labels(tuple(tags))
 
     def _generate_table_header(self, headers: list[tuple[str, str, bool]]) -> str:
         """Generate the header row for tables in the standard format."""
-        html = ""
-        for header in headers:
-            html += f'<th style="{"text-align: center; " if header[2] else ""}width: {header[1]}%">{header[0]}</th>'
-
-        return html
-
+        return _table_header(tuple(headers))
 
     def _generate_violations_section(self, violations_data: list) -> str:
         """Generate the violations section of the HTML report."""
+        return "".join(self._iter_violations_section(violations_data))
+
+    def _iter_violations_section(self, violations_data: list) -> Iterator[str]:
+        """Generate the violations section of the HTML report, one fragment at a time."""
 
-        html = "<h2>Violations Found</h2>"
+        yield "<h2>Violations Found</h2>"
 
         if len(violations_data) == 0:
-            return f"{html}<p>No violations found.</p>"
+            yield "<p>No violations found.</p>"
+            return
 
-        html += f"<p>{len(violations_data)} violations found.</p>"
+        yield f"<p>{len(violations_data)} violations found.</p>"
 
         list_of_headers = [
             ("#", "2", True), ("Description", "53", False),
@@ -435,133 +884,133 @@ class Axe:
             ("Impact", "10", False), ("Count", "5", True)
         ]
 
-        html += f"<table><tr>{self._generate_table_header(list_of_headers)}"
+        yield f"<table><tr>{self._generate_table_header(list_of_headers)}"
 
-        violation_count = 1
-        violation_section = ""
-        for violation in violations_data:
-            violations_table = ""
-
-            html += f'''<tr>
+        for violation_count, violation in enumerate(violations_data, start=1):
+            yield f'''<tr>
                     <td style="text-align: center;">{violation_count}</td>
                     <td>{escape(violation['description'])}</td>
                     <td><a href="{violation['helpUrl']}" target="_blank">{violation['id']}</a></td>
                     <td>{self._wcag_tagging(violation['tags'])}</td>
                     <td>{violation['impact']}</td>
-                    <td style="text-align: center;">{len(violation['nodes'])}</td>
+                    <td style="text-align: center;">{self._node_count(violation)}</td>
                     </tr>'''
 
-            violation_count += 1
+        yield "</table>"
 
-            node_count = 1
-            violations_table += f"<table><tr>{self._generate_table_header([
+        for violation in violations_data:
+            yield f'''<table><tr><td style="width: 100%"><h3>{escape(violation['description'])}</h3>
+                                <p><strong>Axe Rule ID:</strong> <a href="{violation['helpUrl']}" target="_blank">{violation['id']}</a><br />
+                                <strong>WCAG:</strong> {self._wcag_tagging(violation['tags'])}<br />
+                                <strong>Impact:</strong> {violation['impact']}<br />
+                                <strong>Tags:</strong> {", ".join(violation['tags'])}</p>
+                                '''
+
+            yield f"<table><tr>{self._generate_table_header([
                 ("#", "2", True), ("Description", "49", False), 
                 ("Fix Information", "49", False)
             ])}"
 
-            for node in violation['nodes']:
-                violations_table += f'''<tr><td style="text-align: center;">{node_count}</td>
+            for node_count, node in enumerate(violation['nodes'], start=1):
+                yield f'''<tr><td style="text-align: center;">{node_count}</td>
                                     <td><p>Element Location:</p>
-                                    <pre><code>{escape("<br>".join(node['target']))}</code></pre>
+                                    <pre><code>{escape(format_node_target(node['target'], "<br>"))}</code></pre>
                                     <p>HTML:</p><pre><code>{escape(node['html'])}</code></pre></td>
-                                    <td>{escape(node['failureSummary']).replace("Fix any of the following:", "<strong>Fix any of the following:</strong><br />").replace("\n ", "<br /> &bullet;")}</td></tr>'''
-                node_count += 1
-            violations_table += "</table>"
+                                    <td>{_failure_summary_html(node['failureSummary'])}</td></tr>'''
 
-            violation_section += f'''<table><tr><td style="width: 100%"><h3>{escape(violation['description'])}</h3>
-                                <p><strong>Axe Rule ID:</strong> <a href="{violation['helpUrl']}" target="_blank">{violation['id']}</a><br />
-                                <strong>WCAG:</strong> {self._wcag_tagging(violation['tags'])}<br />
-                                <strong>Impact:</strong> {violation['impact']}<br />
-                                <strong>Tags:</strong> {", ".join(violation['tags'])}</p>
-                                {violations_table}
+            yield '''</table>
                                 </td></tr></table>'''
 
-        return f"{html}</table>{violation_section}"
-
     def _generate_passed_section(self, passed_data: list) -> str:
         """Generate the passed section of the HTML report."""
+        return "".join(self._iter_passed_section(passed_data))
 
-        html = "<h2>Passed Checks</h2>"
+    def _iter_passed_section(self, passed_data: list) -> Iterator[str]:
+        """Generate the passed section of the HTML report, one fragment at a time."""
+
+        yield "<h2>Passed Checks</h2>"
 
         if len(passed_data) == 0:
-            return f"{html}<p>No passed checks found.</p>"
+            yield "<p>No passed checks found.</p>"
+            return
 
-        html += f"<table><tr>{self._generate_table_header([
+        yield f"<table><tr>{self._generate_table_header([
             ("#", "2", True), ("Description", "50", False),
             ("Axe Rule ID", "15", False), ("WCAG", "18", False),
             ("Nodes Passed Count", "15", True)
         ])}"
 
-        pass_count = 1
-        for passed in passed_data:
+        for pass_count, passed in enumerate(passed_data, start=1):
 
-            html += f'''<tr>
+            yield f'''<tr>
                     <td style="text-align: center;">{pass_count}</td>
                     <td>{escape(passed['description'])}</td>
                     <td><a href="{passed['helpUrl']}" target="_blank">{passed['id']}</a></td>
                     <td>{self._wcag_tagging(passed['tags'])}</td>
-                    <td style="text-align: center;">{len(passed['nodes'])}</td>
+                    <td style="text-align: center;">{self._node_count(passed)}</td>
                     </tr>'''
 
-            pass_count += 1
-
-        return f"{html}</table>"
+        yield "</table>"
 
     def _generate_incomplete_section(self, incomplete_data: list) -> str:
         """Generate the incomplete section of the HTML report."""
+        return "".join(self._iter_incomplete_section(incomplete_data))
 
-        html = "<h2>Incomplete Checks</h2>"
+    def _iter_incomplete_section(self, incomplete_data: list) -> Iterator[str]:
+        """Generate the incomplete section of the HTML report, one fragment at a time."""
+
+        yield "<h2>Incomplete Checks</h2>"
 
         if len(incomplete_data) == 0:
-            return f"{html}<p>No incomplete checks found.</p>"
+            yield "<p>No incomplete checks found.</p>"
+            return
 
-        html += f"<table><tr>{self._generate_table_header([
+        yield f"<table><tr>{self._generate_table_header([
             ("#", "2", True), ("Description", "50", False),
             ("Axe Rule ID", "15", False), ("WCAG", "18", False),
             ("Nodes Incomplete Count", "15", True)
         ])}"
 
-        incomplete_count = 1
-        for incomplete in incomplete_data:
+        for incomplete_count, incomplete in enumerate(incomplete_data, start=1):
 
-            html += f'''<tr>
+            yield f'''<tr>
                     <td style="text-align: center;">{incomplete_count}</td>
                     <td>{escape(incomplete['description'])}</td>
                     <td><a href="{incomplete['helpUrl']}" target="_blank">{incomplete['id']}</a></td>
                     <td>{self._wcag_tagging(incomplete['tags'])}</td>
-                    <td style="text-align: center;">{len(incomplete['nodes'])}</td>
+                    <td style="text-align: center;">{self._node_count(incomplete)}</td>
                     </tr>'''
 
-            incomplete_count += 1
-
-        return f"{html}</table>"
+        yield "</table>"
 
     def _generate_inapplicable_section(self, inapplicable_data: list) -> str:
         """This method generates the inapplicable section of the HTML report."""
+        return "".join(self._iter_inapplicable_section(inapplicable_data))
 
-        html = "<h2>Inapplicable Checks</h2>"
+    def _iter_inapplicable_section(self, inapplicable_data: list) -> Iterator[str]:
+        """Generate the inapplicable section of the HTML report, one fragment at a time."""
+
+        yield "<h2>Inapplicable Checks</h2>"
 
         if len(inapplicable_data) == 0:
-            return f"{html}<p>No inapplicable checks found.</p>"
+            yield "<p>No inapplicable checks found.</p>"
+            return
 
-        html += f"<table><tr>{self._generate_table_header([
+        yield f"<table><tr>{self._generate_table_header([
             ("#", "2", True), ("Description", "60", False),
             ("Axe Rule ID", "20", False), ("WCAG", "18", False)
         ])}"
 
-        inapplicable_count = 1
-        for inapplicable in inapplicable_data:
+        for inapplicable_count, inapplicable in enumerate(inapplicable_data, start=1):
 
-            html += f'''<tr>
+            yield f'''<tr>
                     <td style="text-align: center;">{inapplicable_count}</td>
                     <td>{escape(inapplicable['description'])}</td>
                     <td><a href="{inapplicable['helpUrl']}" target="_blank">{inapplicable['id']}</a></td>
                     <td>{self._wcag_tagging(inapplicable['tags'])}</td>
                     </tr>'''
 
-            inapplicable_count += 1
-
-        return f"{html}</table>"
+        yield "</table>"
 
     def _generate_execution_details_section(self, data: dict) -> str:
         """Generate the execution details section of the HTML report."""
@@ -572,7 +1021,8 @@ class Axe:
             ("Data", "20", False), ("Details", "80", False)
         ])}"
 
-        for key in ["testEngine", "testRunner", "testEnvironment", "toolOptions", "timestamp", "url"]:
+        for key in ["testEngine", "testRunner", "testEnvironment", "toolOptions", "timestamp", "url", "scopedRegions",
+                    "cachedTimestamp"]:
             if key in data:
                 html += f"<tr><td>{KEY_MAPPING[key]}</td>"
                 if isinstance(data[key], dict):
@@ -584,20 +1034,35 @@ class Axe:
                     html += f"<td>{escape(str(data[key]))}</td></tr>"
 
         return f"{html}</table>"
-    
+
     def _get_snapshot_data(self, filename: str) -> dict | None:
-        """This retrieves the data from a previous snapshot ready for comparison."""
+        """This retrieves the data from a previous snapshot ready for comparison, timing it if a scan is being processed."""
+        metrics = getattr(self._active_metrics, "current", None)
+        if metrics is None:
+            return self._load_snapshot_data(filename)
+
+        with metrics.phase("snapshot_load_ms"):
+            return self._load_snapshot_data(filename)
+
+    def _load_snapshot_data(self, filename: str) -> dict | None:
+        """This loads the data from a previous snapshot from the snapshot store or directory."""
+        if self.snapshot_store:
+            return self.snapshot_store.get(filename)
+
         if not self.snapshot_directory:
             return None
         
-        snapshot_path = self.snapshot_directory.joinpath(f"{filename}.json")
-        if not snapshot_path.exists():
+        for extension in JSON_COMPRESSION_EXTENSIONS.values():
+            snapshot_path = self.snapshot_directory.joinpath(f"{filename}.json{extension}")
+            if snapshot_path.exists():
+                break
+        else:
             return None
 
         try:
-            with open(snapshot_path, encoding='utf-8') as file:
-                return json.loads(file.read())
-        except json.JSONDecodeError as e:
+            with open_json_file(snapshot_path) as file:
+                return json.load(file)
+        except JSON_READ_ERRORS as e:
             logger.warning(f"Failed to parse snapshot file {snapshot_path}: {e}")
             return None
 
@@ -629,13 +1094,62 @@ class Axe:
         current_violations = {v['id']: v for v in data['violations']}
         snapshot_violations = {v['id']: v for v in snapshot_data['violations']}
         
+        node_changes = self._find_node_changes(current_violations, snapshot_violations)
+
         changes = []
         changes.extend(self._find_new_violations(current_violations, snapshot_violations))
         changes.extend(self._find_resolved_violations(current_violations, snapshot_violations))
         changes.extend(self._find_count_changes(current_violations, snapshot_violations))
+        changes.extend(self._find_changed_nodes(current_violations, snapshot_violations, node_changes))
+
+        for change in changes:
+            change['added_nodes'], change['removed_nodes'] = node_changes.get(change['rule_id'], ([], []))
         
         return changes
 
+    def _index_violation_nodes(self, violation: dict | None, include_html: bool = True) -> dict[str, dict] | None:
+        """This indexes the nodes of a violation by fingerprint, returning None if the nodes cannot be compared."""
+        if violation is None:
+            return {}
+
+        nodes = violation['nodes']
+        if self._node_count(violation) != len(nodes) or not all(isinstance(node, dict) for node in nodes):
+            # Nodes have been capped by a result filter, or are not axe-core nodes
+            return None
+
+        index = {}
+        for node in nodes:
+            fingerprint = node_fingerprint(violation['id'], node, include_html)
+            index[fingerprint] = {
+                'rule_id': violation['id'],
+                'target': format_node_target(node.get('target', [])),
+                'html': node.get('html', ""),
+                'impact': node.get('impact') or violation['impact'],
+                'fingerprint': fingerprint
+            }
+        return index
+
+    def _find_node_changes(self, current_violations: dict, snapshot_violations: dict) -> dict[str, tuple[list[dict], list[dict]]]:
+        """Find the nodes added and removed for each violation, keyed by rule ID."""
+        node_changes = {}
+
+        for violation_id in current_violations.keys() | snapshot_violations.keys():
+            current_nodes = self._index_violation_nodes(current_violations.get(violation_id))
+            snapshot_nodes = self._index_violation_nodes(snapshot_violations.get(violation_id))
+            if current_nodes is None or snapshot_nodes is None:
+                continue
+            if any(fingerprint.endswith("|") for fingerprint in current_nodes.keys() | snapshot_nodes.keys()):
+                # HTML was stripped from one of the scans, so nodes can only be matched by target
+                current_nodes = self._index_violation_nodes(current_violations.get(violation_id), include_html=False)
+                snapshot_nodes = self._index_violation_nodes(snapshot_violations.get(violation_id), include_html=False)
+
+            added_nodes = [node for fingerprint, node in current_nodes.items() if fingerprint not in snapshot_nodes]
+            removed_nodes = [node for fingerprint, node in snapshot_nodes.items() if fingerprint not in current_nodes]
+            if added_nodes or removed_nodes:
+                node_changes[violation_id] = (added_nodes, removed_nodes)
+
+        return node_changes
+
     def _find_new_violations(self, current_violations: dict, snapshot_violations: dict) -> list[dict]:
         """Find violations that are new in the current scan."""
         new_violations = []
@@ -647,9 +1161,9 @@ class Axe:
                     'rule_id': violation_id,
                     'description': violation['description'],
                     'impact': violation['impact'],
-                    'current_count': len(violation['nodes']),
+                    'current_count': self._node_count(violation),
                     'previous_count': 0,
-                    'change': len(violation['nodes']),
+                    'change': self._node_count(violation),
                     'wcag': self._wcag_tagging(violation['tags']),
                     'status_class': 'new-violation'
                 })
@@ -668,8 +1182,8 @@ class Axe:
                     'description': violation['description'],
                     'impact': violation['impact'],
                     'current_count': 0,
-                    'previous_count': len(violation['nodes']),
-                    'change': -len(violation['nodes']),
+                    'previous_count': self._node_count(violation),
+                    'change': -self._node_count(violation),
                     'wcag': self._wcag_tagging(violation['tags']),
                     'status_class': 'resolved-violation'
                 })
@@ -682,8 +1196,8 @@ class Axe:
         
         for violation_id, current_violation in current_violations.items():
             if violation_id in snapshot_violations:
-                current_count = len(current_violation['nodes'])
-                previous_count = len(snapshot_violations[violation_id]['nodes'])
+                current_count = self._node_count(current_violation)
+                previous_count = self._node_count(snapshot_violations[violation_id])
                 
                 if current_count != previous_count:
                     change_type = 'Increased Count' if current_count > previous_count else 'Decreased Count'
@@ -703,6 +1217,31 @@ class Axe:
         
         return count_changes
 
+    def _find_changed_nodes(self, current_violations: dict, snapshot_violations: dict,
+                            node_changes: dict[str, tuple[list[dict], list[dict]]]) -> list[dict]:
+        """Find violations where the count is unchanged, but the nodes affected have changed."""
+        changed_nodes = []
+
+        for violation_id, current_violation in current_violations.items():
+            if violation_id in snapshot_violations and violation_id in node_changes:
+                current_count = self._node_count(current_violation)
+                previous_count = self._node_count(snapshot_violations[violation_id])
+
+                if current_count == previous_count:
+                    changed_nodes.append({
+                        'type': 'Changed Nodes',
+                        'rule_id': violation_id,
+                        'description': current_violation['description'],
+                        'impact': current_violation['impact'],
+                        'current_count': current_count,
+                        'previous_count': previous_count,
+                        'change': 0,
+                        'wcag': self._wcag_tagging(current_violation['tags']),
+                        'status_class': 'changed-nodes'
+                    })
+
+        return changed_nodes
+
     def _generate_changes_table(self, changes: list[dict]) -> str:
         """Generate the HTML table for displaying changes."""
         html = f"""<table class="changes-table">
@@ -718,8 +1257,8 @@ class Axe:
         ])}</tr>"""
         
         # Sort changes by priority
-        type_priority = {'New Violation': 1, 'Increased Count': 2, 'Decreased Count': 3, 'Resolved Violation': 4}
-        changes.sort(key=lambda x: type_priority.get(x['type'], 5))
+        type_priority = {'New Violation': 1, 'Increased Count': 2, 'Changed Nodes': 3, 'Decreased Count': 4, 'Resolved Violation': 5}
+        changes.sort(key=lambda x: type_priority.get(x['type'], 6))
         
         for change in changes:
             html += self._generate_change_row(change)
@@ -734,7 +1273,7 @@ class Axe:
         return f"""<tr {row_class}>
         <td><strong>{change['type']}</strong></td>
         <td><a href="#violation-{change['rule_id']}" title="Jump to violation details">{change['rule_id']}</a></td>
-        <td>{escape(change['description'])}</td>
+        <td>{escape(change['description'])}{self._generate_node_changes(change)}</td>
         <td>{change['wcag']}</td>
         <td>{change['impact']}</td>
         <td style="text-align: center;">{change['previous_count']}</td>
@@ -742,45 +1281,707 @@ class Axe:
         <td style="text-align: center;"><strong>{change_indicator}</strong></td>
         </tr>"""
 
+    def _generate_node_changes(self, change: dict) -> str:
+        """Generate the list of nodes added and removed for a change, if any."""
+        added_nodes = change.get('added_nodes', [])
+        removed_nodes = change.get('removed_nodes', [])
+        if not added_nodes and not removed_nodes:
+            return ""
+
+        items = [f"<li>Added: <code>{escape(node['target'])}</code></li>" for node in added_nodes]
+        items.extend(f"<li>Removed: <code>{escape(node['target'])}</code></li>" for node in removed_nodes)
+        return (f"<details><summary>{len(added_nodes)} node(s) added, {len(removed_nodes)} node(s) removed</summary>"
+                f"<ul>{"".join(items)}</ul></details>")
+
     def _generate_html(self, data: dict, filename: str) -> str:
         """This generates the full HTML report based on the data provided."""
+        return "".join(self._iter_html(data, filename))
+
+    def _iter_html(self, data: dict, filename: str) -> Iterator[str]:
+        """This generates the full HTML report based on the data provided, one fragment at a time."""
 
         snapshot_data = self._get_snapshot_data(filename)
 
         # HTML header
-        html = f'<!DOCTYPE html><html lang="en"><head>{self._css_styling()}<title>Axe Accessibility Report</title></head><body>'
+        yield f'<!DOCTYPE html><html lang="en"><head>{self._css_styling()}<title>Axe Accessibility Report</title></head><body>'
 
         # HTML body
         # Title and URL
-        html += '<header role="banner"><h1>Axe Accessibility Report</h1>'
-        html += f"""<p>This is an axe-core accessibility summary generated on
+        yield '<header role="banner"><h1>Axe Accessibility Report</h1>'
+        yield f"""<p>This is an axe-core accessibility summary generated on
                     {datetime.strptime(data["timestamp"], "%Y-%m-%dT%H:%M:%S.%fZ").strftime("%Y-%m-%d %H:%M")}
                     for: <strong>{data['url']}</strong></p></header><main role="main">"""
 
         # Changes
-        html += self._generate_changes_section(data, snapshot_data)
+        yield self._generate_changes_section(data, snapshot_data)
 
         # Violations
         # Summary
-        html += self._generate_violations_section(data['violations'])
+        yield from self._iter_violations_section(data['violations'])
 
         # Passed Checks (Collapsible)
-        html += self._generate_passed_section(data['passes'])
+        yield from self._iter_passed_section(data['passes'])
 
         # Incomplete Checks (Collapsible)
-        html += self._generate_incomplete_section(data['incomplete'])
+        yield from self._iter_incomplete_section(data['incomplete'])
 
         # Inapplicable Checks (Collapsible)
-        html += self._generate_inapplicable_section(data['inapplicable'])
+        yield from self._iter_inapplicable_section(data['inapplicable'])
 
         # Execution Details (Collapsible)
-        html += self._generate_execution_details_section(data)
+        yield self._generate_execution_details_section(data)
 
         # Close tags
-        html += "</main></body></html>"
+        yield "</main></body></html>"
 
-        return html
 
+class Axe(AxeBase):
+    """
+    This utility allows for interaction with axe-core, to allow for accessibility scanning of pages
+    under test to identify any accessibility concerns.
+
+    Args:
+        output_directory (str | pathlib.Path): [Optional] The directory to output the reports to. If not provided, defaults to os.getcwd()/axe-reports directory.
+        css_override (str): [Optional] If provided, overrides the default CSS used within the HTML report generated.
+        use_minified_file (bool): [Optional] If true, use the minified axe-core file. If false (default), use the full axe-core file.
+        snapshot_directory (str | pathlib.Path): [Optional] The directory to check for JSON snapshots from previous runs to compare against.
+        use_init_script (bool): [Optional] If true, register axe-core against the browser context of each page scanned so it is loaded on every navigation. If false (default), inject axe-core only when it is not already present on the page.
+        report_writer (ReportWriter): [Optional] If provided, reports are written in the background by the writer provided. The results returned from run() and run_list() should not be modified until the writer has been flushed.
+        json_compact (bool): [Optional] If true, JSON reports are written without indentation or whitespace. If false (default), JSON reports are indented.
+        json_compression (str): [Optional] If provided, JSON reports are compressed using "gzip" (saved as .json.gz) or "zstd" (saved as .json.zst, Python 3.14 or greater only).
+        json_exclude (list[str]): [Optional] If provided, the sections to leave out of JSON reports. Can include "passes", "incomplete" or "inapplicable".
+        strict_mode (bool): [Optional] If true, raise an exception if a violation is detected, unless overridden when calling run() or run_list(). If false (default), proceed with test execution.
+        result_callback (Callable[[dict], None]): [Optional] If provided, called with the axe-core results of each page scanned, after any reports have been generated.
+        snapshot_store (SnapshotStore): [Optional] If provided, snapshots are read from the baseline of the store provided instead of snapshot_directory, and a summary of each page scanned is saved to the store's current run.
+        scan_cache (ScanCache): [Optional] If provided, enables incremental scanning: axe-core is only run if the page has changed since it was last scanned with the same settings, otherwise the cached results are used.
+        metrics_callback (Callable[[ScanMetrics], None]): [Optional] If provided, called with the ScanMetrics of each page scanned. The metrics of the last page scanned are also available as last_metrics.
+        violation_aggregator (ViolationAggregator): [Optional] If provided, the violations of each page scanned are added to the aggregator provided, to report issues shared across pages.
+
+    Example:
+        ```
+        # Default usage
+        axe = Axe()
+        # Custom output directory using minified file
+        axe = Axe(output_directory="accessibility-results", use_minified_file=True)
+        # Snapshot directory specified and custom CSS
+        axe = Axe(
+            snapshot_directory=Path(__file__).parent.joinpath("snapshots"), 
+            css_override=Path(__file__).parent.joinpath("style.css")
+        )
+        # Load axe-core on every navigation via the browser context
+        axe = Axe(use_init_script=True)
+        ```
+    """
+
+    _locator_type = Locator
+
+    def run(self,
+            page: Page,
+            filename: str = "",
+            context: str | AxeContext = "",
+            options: str | AxeOptions = "",
+            report_on_violation_only: bool = False,
+            strict_mode: bool = None,
+            html_report_generated: bool = True,
+            json_report_generated: bool = True,
+            result_filter: ResultFilter = None,
+            frame_filter: FrameFilter = None) -> dict:
+        """
+        This runs axe-core against the page provided.
+
+        Args:
+            page (playwright.sync_api.Page): The page object to execute axe-core against.
+            filename (str): [Optional] The filename to use for the outputted reports. If not provided, defaults to the URL under test.
+            context (str | AxeContext): [Optional] If provided, the context axe-core should use, as an AxeContext or a stringified JavaScript object.
+            options (str | AxeOptions): [Optional] If provided, the options axe-core should use, as an AxeOptions (e.g. AXE_OPTIONS_WCAG_22AA) or a stringified JavaScript object.
+            report_on_violation_only (bool): [Optional] If true, only generates an Axe report if a violation is detected. If false (default), always generate a report.
+            strict_mode (bool): [Optional] If true, raise an exception if a violation is detected. If false, proceed with test execution. If not provided, uses the strict_mode of the Axe instance (false by default).
+            html_report_generated (bool): [Optional] If true (default), generates a html report for the page scanned. If false, no html report is generated.
+            json_report_generated (bool): [Optional] If true (default), generates a json report for the page scanned. If false, no json report is generated.
+            result_filter (ResultFilter): [Optional] If provided, reduces the axe-core results in the browser before they are returned (e.g. VIOLATIONS_ONLY_FILTER).
+            frame_filter (FrameFilter): [Optional] If provided, axe-core is injected into the child frames matching the filter (e.g. ALL_FRAMES) so they are included in the scan, and other frames are excluded. If not provided, only the main frame is injected. A filter that can exclude frames requires context and options to be AxeContext and AxeOptions objects (or not provided).
+
+        Returns:
+            dict: A Python dictionary with the axe-core output of the page scanned.
+        
+        Example:
+            ```
+            # Default usage
+            def test_example(page: Page) -> None:
+                axe = Axe()
+                axe.run(page)
+
+                # With no HTML or JSON reports, capture results in variable
+                results = axe.run(
+                    page, 
+                    html_report_generated=False, 
+                    json_report_generated=False
+                )
+            ```        
+        """
+
+        metrics, expression, argument, frame_filter = self._prepare_scan(page.url, filename, context, options,
+                                                                         result_filter, frame_filter)
+        cache_key = None
+        if self.scan_cache:
+            with metrics.phase("fingerprint_ms"):
+                cache_key = self._scan_cache_key(page.url, self._dom_fingerprint(page, frame_filter), expression, argument,
+                                                 frame_filter)
+        response = self._cached_results(cache_key, metrics)
+
+        if response is None:
+            with metrics.phase("inject_ms"):
+                self._inject_axe(page)
+            if self._requires_rule_resolution(options):
+                with metrics.phase("resolve_rules_ms"):
+                    options = self._resolve_options(options) or self._resolve_options(options, self.get_rules(page))
+                expression, argument = self._build_evaluate_arguments(context, options, result_filter)
+            if frame_filter:
+                with metrics.phase("inject_frames_ms"):
+                    argument = self._exclude_frames(argument, self._inject_axe_into_frames(page, frame_filter))
+            response = self._evaluate_axe(page, expression, argument, metrics)
+            if cache_key:
+                self.scan_cache.put(cache_key, response)
+
+        return self._process_results(response, filename, report_on_violation_only, self._strict_mode(strict_mode),
+                                     html_report_generated, json_report_generated, metrics)
+
+    def run_list(self,
+                 page: Page,
+                 page_list: list[str | dict],
+                 use_list_for_filename: bool = True,
+                 context: str | AxeContext = "",
+                 options: str | AxeOptions = "",
+                 report_on_violation_only: bool = False,
+                 strict_mode: bool = None,
+                 html_report_generated: bool = True,
+                 json_report_generated: bool = True,
+                 result_filter: ResultFilter = None,
+                 concurrency: int = 1,
+                 launch_options: dict = None,
+                 context_options: dict = None,
+                 consolidated_report: "ConsolidatedReport" = None,
+                 scope_to_changes: bool = False,
+                 frame_filter: FrameFilter = None,
+                 sampler: TemplateSampler = None) -> dict:
+        """
+        This runs axe-core against a list of pages provided.
+
+        NOTE: It is recommended to set a --base-url value when running Playwright using this functionality, so you only need to pass in a partial URL within the page_list.
+
+        Args:
+            page (playwright.sync_api.Page): The page object to execute axe-core against.
+            page_list (list[str | dict]): A list of URLs to execute against. If a dict is provided, it can include actions and assertions to complete prior to scanning (see below for key/values to provide).
+            use_list_for_filename (bool): If true, based filenames off the list provided. If false, use the full URL under test for the filename.
+            context (str | AxeContext): [Optional] If provided, the context axe-core should use, as an AxeContext or a stringified JavaScript object.
+            options (str | AxeOptions): [Optional] If provided, the options axe-core should use, as an AxeOptions (e.g. AXE_OPTIONS_WCAG_22AA) or a stringified JavaScript object.
+            report_on_violation_only (bool): [Optional] If true, only generates an Axe report if a violation is detected. If false (default), always generate a report.
+            strict_mode (bool): [Optional] If true, raise an exception if a violation is detected. If false, proceed with test execution. If not provided, uses the strict_mode of the Axe instance (false by default).
+            html_report_generated (bool): [Optional] If true (default), generates a html report for the page scanned. If false, no html report is generated.
+            json_report_generated (bool): [Optional] If true (default), generates a json report for the page scanned. If false, no json report is generated.
+            result_filter (ResultFilter): [Optional] If provided, reduces the axe-core results in the browser before they are returned (e.g. VIOLATIONS_ONLY_FILTER).
+            concurrency (int): [Optional] The number of pages to scan in parallel. If 1 (default), pages are scanned one after another using the page provided.
+            launch_options (dict): [Optional] If concurrency is greater than 1, the options to launch each worker browser with (e.g. the browser_type_launch_args fixture).
+            context_options (dict): [Optional] If concurrency is greater than 1, the options to create each worker browser context with (e.g. the browser_context_args fixture, which includes --base-url). Unless a storage_state is included, the cookies and local storage of the page's context are copied to each worker context.
+            consolidated_report (ConsolidatedReport): [Optional] If provided, the results for each page are added to the consolidated report provided, in page_list order.
+            scope_to_changes (bool): [Optional] If true, dict entries whose url is also in page_list as a str entry only scan the regions of the page changed by their action, merging the results into the str entry's results. If false (default), dict entries scan the whole page. When concurrency is 1, only str entries earlier in page_list are merged into, so a dict entry listed before the str entry for its url scans the whole page.
+            frame_filter (FrameFilter): [Optional] If provided, the child frames of each page to scan, as in run(). Scans scoped to changes only cover the main frame, keeping the results from frames in the str entry's results.
+            sampler (TemplateSampler): [Optional] If provided, str entries are grouped by template and only a sample of each group is scanned. Pages not scanned are left out of the results, and the groups are added to the consolidated report (if provided).
+
+        When concurrency is greater than 1, the str entries in page_list are shared between worker threads, each driving
+        its own browser of the same type as the page provided (the Playwright sync API cannot be shared between threads).
+        Worker browsers do not share the page's browser or context: they are launched with launch_options and their
+        contexts created with context_options, so any other state set up on the page's context (e.g. session storage,
+        permissions, routes, extra HTTP headers or init scripts) is not available to them. Only the cookies and local
+        storage of the page's context are copied, as a storage_state, so authenticated scans work unless the session
+        relies on other state. dict entries are scanned using the page provided, as their locators are bound to it. Results are keyed and
+        ordered exactly as they would be when scanning one page at a time, and if strict_mode is set, the first violation
+        in page_list order is raised once all pages have been scanned.
+
+        For page_list, the following key/value pairs can be provided if using a dict:
+
+        - **url (str)**: The url to initially navigate to.
+        - **action (str)**: The action to undertake. Can be one of the following: "click", "dblclick", "hover", "fill", "type" or "select_option".
+        - **locator (playwright.sync_api.Locator)**: The locator for the element to interact with.
+        - **value (str)**: The value to use (if the action is "fill", "type" or "select_option").
+        - **assert_locator (playwright.sync_api.Locator)**: [Optional] The locator to do an assertion on.
+        - **assert_type (str)**: [Optional] The type of assertion to do against the locator. Can be one of the following: "to_be_visible", "to_be_hidden", "to_be_enabled", "to_contain_text" or "to_not_contain_text".
+        - **assert_value (str)**: [Optional] The value to assert (if the action is "to_contain_text" or "to_not_contain_text")
+        - **wait_time (int)**: [Optional] If specified, the amount of time to wait after completing the action in milliseconds.
+
+        Returns:
+            dict: A Python dictionary with the axe-core output of all the pages scanned, with the page_list value used as the key for each report.
+ 
+        Example:
+            ```
+            # --base-url set to: https://example.com
+            def test_example(page: Page) -> None:
+                # Default usage
+                Axe().run_list(
+                    page, 
+                    ["/home", "/search"]
+                )
+                
+                # Usage with page_list including str and dict
+                page_list = [
+                    "/home",
+                    {
+                        "url": "/search",
+                        "action": "fill",
+                        "locator": page.locator("#search-bar"),
+                        "value": "test item",
+                        "assert_locator": page.locator("#search-results-summary"),
+                        "assert_type": "to_contain_text",
+                        "assert_value": "1 of 1 results"
+                    }
+                ]
+                axe = Axe()
+                axe.run_list(page, page_list)
+
+                # Scan across 4 browsers in parallel
+                Axe().run_list(
+                    page,
+                    ["/home", "/search", "/about", "/contact"],
+                    concurrency=4,
+                    context_options=browser_context_args
+                )
+            ``` 
+        """
+
+        if concurrency < 1:
+            raise AxeAccessibilityException("concurrency must be 1 or greater.")
 
-class AxeAccessibilityException(Exception):
-    pass
+        strict_mode = self._strict_mode(strict_mode)
+        planned_pages = self._plan_page_list(page_list, use_list_for_filename)
+        # Pages are added to the consolidated report before any violation is raised
+        scan_arguments = self._build_scan_arguments(context, options, report_on_violation_only,
+                                                    strict_mode and not consolidated_report, html_report_generated,
+                                                    json_report_generated, result_filter, frame_filter)
+
+        if concurrency > 1:
+            return self._run_list_parallel(page, planned_pages, concurrency, scan_arguments,
+                                           launch_options or {}, self._worker_context_options(page, context_options),
+                                           consolidated_report, strict_mode, scope_to_changes, sampler)
+
+        results = {}
+        for results_key, filename, selected_page in planned_pages:
+            base_results = results.get(selected_page["url"]) \
+                if scope_to_changes and isinstance(selected_page, dict) else None
+            response = self._scan_list_entry(page, selected_page, filename, scan_arguments, base_results, sampler)
+            if response is None:
+                continue
+            results[results_key] = response
+            if consolidated_report:
+                self._report_list_result(consolidated_report, results_key, response, filename, scan_arguments,
+                                         strict_mode, sampler)
+
+        if consolidated_report and sampler:
+            consolidated_report.add_groups(sampler.groups)
+        return results
+
+    def crawl(self,
+              page: Page,
+              frontier: CrawlFrontier,
+              context: str | AxeContext = "",
+              options: str | AxeOptions = "",
+              report_on_violation_only: bool = False,
+              strict_mode: bool = None,
+              html_report_generated: bool = True,
+              json_report_generated: bool = True,
+              result_filter: ResultFilter = None,
+              concurrency: int = 1,
+              launch_options: dict = None,
+              context_options: dict = None,
+              consolidated_report: "ConsolidatedReport" = None,
+              frame_filter: FrameFilter = None) -> dict:
+        """
+        This crawls a site from the seed URLs of the frontier provided, scanning each page found once and following
+        the links on each page with the same origin as a seed URL, within the limits and URL patterns of the frontier.
+
+        Each page is scanned and reported on as a str entry in run_list() would be, with the normalized URL used as
+        the results key and for the report filenames. Pages that fail to load are logged and recorded in the frontier's
+        failed list. If the crawl is interrupted or an error is raised, the frontier stops and its state is saved (if it
+        has a state file) so the crawl can be resumed.
+
+        Args:
+            page (playwright.sync_api.Page): The page object to execute axe-core against.
+            frontier (CrawlFrontier): The frontier holding the seed URLs, limits and state of the crawl.
+            context (str | AxeContext): [Optional] If provided, the context axe-core should use, as an AxeContext or a stringified JavaScript object.
+            options (str | AxeOptions): [Optional] If provided, the options axe-core should use, as an AxeOptions (e.g. AXE_OPTIONS_WCAG_22AA) or a stringified JavaScript object.
+            report_on_violation_only (bool): [Optional] If true, only generates an Axe report if a violation is detected. If false (default), always generate a report.
+            strict_mode (bool): [Optional] If true, raise an exception for the first page with a violation once the crawl is complete. If false, proceed with test execution. If not provided, uses the strict_mode of the Axe instance (false by default).
+            html_report_generated (bool): [Optional] If true (default), generates a html report for each page scanned. If false, no html report is generated.
+            json_report_generated (bool): [Optional] If true (default), generates a json report for each page scanned. If false, no json report is generated.
+            result_filter (ResultFilter): [Optional] If provided, reduces the axe-core results in the browser before they are returned (e.g. VIOLATIONS_ONLY_FILTER).
+            concurrency (int): [Optional] The number of pages to scan in parallel. If 1 (default), pages are scanned one after another using the page provided, otherwise across worker browsers as in run_list().
+            launch_options (dict): [Optional] If concurrency is greater than 1, the options to launch each worker browser with (e.g. the browser_type_launch_args fixture).
+            context_options (dict): [Optional] If concurrency is greater than 1, the options to create each worker browser context with (e.g. the browser_context_args fixture). As in run_list(), the cookies and local storage of the page's context are copied to each worker context unless a storage_state is included.
+            consolidated_report (ConsolidatedReport): [Optional] If provided, the results for each page are added to the consolidated report provided, in the order the scans complete.
+            frame_filter (FrameFilter): [Optional] If provided, the child frames of each page to scan, as in run(). Links within frames are not followed.
+
+        Returns:
+            dict: A Python dictionary with the axe-core output of the pages scanned by this call, with the normalized URL used as the key for each report.
+
+        Example:
+            ```
+            def test_example(page: Page) -> None:
+                frontier = CrawlFrontier(["https://example.com/"], max_depth=2, max_pages=200,
+                                         exclude_urls=("*/logout*",), state_file="crawl_state.json")
+                results = Axe().crawl(page, frontier, options=AXE_OPTIONS_WCAG_22AA, concurrency=4,
+                                      context_options=browser_context_args)
+            ```
+        """
+        if concurrency < 1:
+            raise AxeAccessibilityException("concurrency must be 1 or greater.")
+
+        # Violations are raised once the crawl is complete, so every page is scanned
+        scan_arguments = self._build_scan_arguments(context, options, report_on_violation_only, False,
+                                                    html_report_generated, json_report_generated, result_filter,
+                                                    frame_filter)
+        scan_results: dict[str, dict] = {}
+
+        try:
+            if concurrency == 1:
+                while (entry := frontier.next()) is not None:
+                    self._crawl_page(page, frontier, *entry, scan_arguments, scan_results, consolidated_report)
+            else:
+                browser_name = page.context.browser.browser_type.name if page.context.browser else "chromium"
+                worker_context_options = self._worker_context_options(page, context_options)
+                with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="axe-crawler") as executor:
+                    workers = [executor.submit(self._crawl_worker, browser_name, launch_options or {},
+                                               worker_context_options, frontier, scan_arguments, scan_results,
+                                               consolidated_report)
+                               for _ in range(concurrency)]
+                    for worker in workers:
+                        worker.result()
+        finally:
+            frontier.save()
+
+        return self._finish_crawl(frontier, scan_results, self._strict_mode(strict_mode))
+
+    def _process_results(self,
+                         response: dict,
+                         filename: str,
+                         report_on_violation_only: bool,
+                         strict_mode: bool,
+                         html_report_generated: bool,
+                         json_report_generated: bool,
+                         metrics: ScanMetrics = None) -> dict:
+        """This logs the scan summary and generates the requested reports for the axe-core results provided."""
+        metrics = metrics or ScanMetrics(url=response["url"], filename=filename, axe_version=self.axe_version)
+        self._record_results(response, filename, report_on_violation_only, html_report_generated, json_report_generated,
+                             metrics)
+        return self._finish_results(response, strict_mode, metrics)
+
+    def _evaluate_axe(self, page: Page, expression: str, argument: list | None, metrics: ScanMetrics) -> dict:
+        """This runs axe-core in the page, timing the run and transfer of results separately if collecting metrics."""
+        if not self._collecting_metrics():
+            return page.evaluate(expression, argument)
+
+        start = time.perf_counter()
+        timed_results = page.evaluate(self._timed_expression(expression, argument), argument)
+        return self._record_axe_timings(metrics, timed_results, start)
+
+    def _scan_list_entry(self,
+                         page: Page,
+                         selected_page: str | dict,
+                         filename: str,
+                         scan_arguments: dict,
+                         base_results: dict = None,
+                         sampler: TemplateSampler = None) -> dict | None:
+        """This navigates to a single page list entry, completes any pre-scan actions and runs axe-core, returning None if the sampler skips it."""
+        if isinstance(selected_page, dict):
+            page.goto(selected_page["url"])
+            if base_results is not None and not scan_arguments["context"]:
+                page.evaluate(MUTATION_RECORDER_SCRIPT)
+                self._complete_pre_scan_actions(page, selected_page)
+                return self._run_scoped(page, filename, base_results, scan_arguments)
+            self._complete_pre_scan_actions(page, selected_page)
+        else:
+            if self._skipped_by_url(sampler, selected_page):
+                return None
+            page.goto(selected_page)
+            if sampler and sampler.group_by_dom and not sampler.claim(
+                    selected_page, sampler.dom_group(page.evaluate(DOM_SIGNATURE_SCRIPT))):
+                return None
+
+        return self.run(page, filename=filename, **scan_arguments)
+
+    def _run_scoped(self, page: Page, filename: str, base_results: dict, scan_arguments: dict) -> dict:
+        """This scans only the regions changed since recording started, merging the results into the base results."""
+        region_count = page.evaluate(CHANGED_REGIONS_SCRIPT)
+        if region_count is None:
+            return self.run(page, filename=filename, **scan_arguments)
+
+        metrics = ScanMetrics(url=page.url, filename=filename, axe_version=self.axe_version)
+        if region_count == 0:
+            response = self._merge_scoped_results(base_results, None, [], 0)
+        else:
+            replaced = page.evaluate(NODES_IN_CHANGED_REGIONS_SCRIPT, self._base_node_targets(base_results))
+            with metrics.phase("inject_ms"):
+                self._inject_axe(page)
+            scoped_results = self._evaluate_axe(page, self._build_evaluate_command(
+                CHANGED_REGIONS_CONTEXT, scan_arguments["options"], scan_arguments["result_filter"]), None, metrics)
+            response = self._merge_scoped_results(base_results, scoped_results, replaced, region_count)
+
+        return self._process_results(response, filename, scan_arguments["report_on_violation_only"],
+                                     self._strict_mode(scan_arguments["strict_mode"]),
+                                     scan_arguments["html_report_generated"], scan_arguments["json_report_generated"], metrics)
+
+    def _run_list_parallel(self,
+                           page: Page,
+                           planned_pages: list[tuple[str, str, str | dict]],
+                           concurrency: int,
+                           scan_arguments: dict,
+                           launch_options: dict,
+                           context_options: dict,
+                           consolidated_report: "ConsolidatedReport" = None,
+                           strict_mode: bool = False,
+                           scope_to_changes: bool = False,
+                           sampler: TemplateSampler = None) -> dict:
+        """This scans the planned pages across worker browsers, returning results in page list order."""
+        browser_name = page.context.browser.browser_type.name if page.context.browser else "chromium"
+
+        # pages sampled by URL are claimed in page list order before any worker starts, so the pages chosen to
+        # represent each group do not depend on which worker reaches them first
+        work_queue = queue.SimpleQueue()
+        for index, (_, filename, selected_page) in enumerate(planned_pages):
+            if not isinstance(selected_page, dict) and not self._skipped_by_url(sampler, selected_page):
+                work_queue.put((index, selected_page, filename))
+
+        scan_results: dict[int, dict] = {}
+        scan_errors: dict[int, Exception] = {}
+        worker_count = min(concurrency, work_queue.qsize())
+        logger.info(f"Scanning {work_queue.qsize()} pages across {worker_count} {browser_name} workers")
+
+        dom_sampler = sampler if sampler and sampler.group_by_dom else None
+        with ThreadPoolExecutor(max_workers=max(worker_count, 1), thread_name_prefix="axe-worker") as executor:
+            workers = [executor.submit(self._run_list_worker, browser_name, launch_options, context_options,
+                                       work_queue, scan_arguments, scan_results, scan_errors, dom_sampler)
+                       for _ in range(worker_count)]
+
+            if not scope_to_changes:
+                self._scan_dict_entries(page, planned_pages, scan_arguments, scan_results, scan_errors)
+
+            for worker in workers:
+                worker.result()
+
+        if scope_to_changes:
+            # dict entries are scanned once the str entries they are scoped against are complete
+            self._scan_dict_entries(page, planned_pages, scan_arguments, scan_results, scan_errors, scope_to_changes)
+
+        return self._collect_list_results(planned_pages, scan_results, scan_errors, scan_arguments, strict_mode,
+                                          consolidated_report, sampler)
+
+    def _scan_dict_entries(self,
+                           page: Page,
+                           planned_pages: list[tuple[str, str, str | dict]],
+                           scan_arguments: dict,
+                           scan_results: dict[int, dict],
+                           scan_errors: dict[int, Exception],
+                           scope_to_changes: bool = False) -> None:
+        """This scans the dict entries of the planned pages using the page provided, recording the results or errors by index."""
+        url_indexes = {selected_page: index for index, (_, _, selected_page) in enumerate(planned_pages)
+                       if not isinstance(selected_page, dict)}
+
+        for index, (_, filename, selected_page) in enumerate(planned_pages):
+            if isinstance(selected_page, dict):
+                base_results = scan_results.get(url_indexes.get(selected_page["url"])) if scope_to_changes else None
+                try:
+                    scan_results[index] = self._scan_list_entry(page, selected_page, filename, scan_arguments, base_results)
+                except Exception as e:
+                    scan_errors[index] = e
+
+    def _worker_context_options(self, page: Page, context_options: dict | None) -> dict:
+        """This returns the options for each worker browser context, with the storage state of the page's context unless one is provided."""
+        context_options = dict(context_options or {})
+        if "storage_state" not in context_options:
+            context_options["storage_state"] = page.context.storage_state()
+        return context_options
+
+    def _run_list_worker(self,
+                         browser_name: str,
+                         launch_options: dict,
+                         context_options: dict,
+                         work_queue: queue.SimpleQueue,
+                         scan_arguments: dict,
+                         scan_results: dict[int, dict],
+                         scan_errors: dict[int, Exception],
+                         sampler: TemplateSampler = None) -> None:
+        """This runs in a worker thread, scanning pages from the queue with its own browser until the queue is empty."""
+        with sync_playwright() as playwright:
+            browser = playwright[browser_name].launch(**launch_options)
+            try:
+                worker_page = browser.new_context(**context_options).new_page()
+                while True:
+                    try:
+                        index, url, filename = work_queue.get_nowait()
+                    except queue.Empty:
+                        break
+
+                    try:
+                        response = self._scan_list_entry(worker_page, url, filename, scan_arguments, sampler=sampler)
+                        if response is not None:
+                            scan_results[index] = response
+                    except Exception as e:
+                        scan_errors[index] = e
+            finally:
+                browser.close()
+
+    def _crawl_page(self,
+                    page: Page,
+                    frontier: CrawlFrontier,
+                    url: str,
+                    depth: int,
+                    scan_arguments: dict,
+                    scan_results: dict[str, dict],
+                    consolidated_report: "ConsolidatedReport" = None) -> None:
+        """This scans a URL from the frontier, adding the links found on the page to the frontier."""
+        filename = self._modify_filename_for_report(url)
+        try:
+            response = self._scan_list_entry(page, url, filename, scan_arguments)
+            links = page.evaluate(LINKS_SCRIPT) if frontier.follows_links(depth) else []
+        except PlaywrightError as e:
+            logger.warning(f"Failed to crawl {url}: {e}")
+            frontier.complete(url, failed=True)
+            return
+        except BaseException:
+            frontier.stop()
+            raise
+
+        self._record_crawl_result(frontier, url, response, links, page.url, filename, scan_arguments, scan_results,
+                                  consolidated_report)
+
+    def _crawl_worker(self,
+                      browser_name: str,
+                      launch_options: dict,
+                      context_options: dict,
+                      frontier: CrawlFrontier,
+                      scan_arguments: dict,
+                      scan_results: dict[str, dict],
+                      consolidated_report: "ConsolidatedReport" = None) -> None:
+        """This runs in a worker thread, crawling pages from the frontier with its own browser until the crawl is finished."""
+        with sync_playwright() as playwright:
+            browser = playwright[browser_name].launch(**launch_options)
+            try:
+                worker_page = browser.new_context(**context_options).new_page()
+                while (entry := frontier.wait_next()) is not None:
+                    self._crawl_page(worker_page, frontier, *entry, scan_arguments, scan_results, consolidated_report)
+            except BaseException:
+                frontier.stop()
+                raise
+            finally:
+                browser.close()
+
+    def get_rules(self, page: Page, rules: list[str] = None) -> list[dict]:
+        """
+        This runs axe.getRules(), returning the specified rules (or all if no ruleset provided).
+
+        Args:
+            page (playwright.sync_api.Page): The page object to execute axe-core against.
+            rules (list[str]): [Optional] A list of rules to return. If not provided, all rules are returned.
+        
+        Returns:
+            list[dict]: A list of dictionaries containing the axe-core rules returned.
+        
+        Example:
+            ```
+            # Standard usage
+            axe = Axe()
+            rules = axe.get_rules(page)
+            # Get only specific rules
+            rules = axe.get_rules(page, rules=["color-contrast", "image-alt"])
+            ```
+        """
+        self._inject_axe(page)
+
+        return page.evaluate(
+            f"axe.getRules({"" if rules is None else str(rules)});")
+
+    def _inject_axe(self, page: Page) -> bool:
+        """This injects axe-core into the page if the expected version is not already loaded, returning True if injected."""
+        if self.use_init_script:
+            self._register_init_script(page.context)
+
+        if page.evaluate(AXE_LOADED_CHECK, self.axe_version):
+            return False
+
+        page.evaluate(load_axe_script(self.axe_path))
+        return True
+
+    def _register_init_script(self, context: BrowserContext) -> None:
+        """This registers axe-core as an init script on the browser context, if not already registered."""
+        if context in self._init_script_contexts:
+            return
+
+        context.add_init_script(script=load_axe_script(self.axe_path))
+        self._init_script_contexts.add(context)
+
+    def _dom_fingerprint(self, page: Page, frame_filter: FrameFilter | None) -> str:
+        """This fingerprints the page for the scan cache, including each frame if frames are being scanned."""
+        if frame_filter is None:
+            return page.evaluate(DOM_FINGERPRINT_SCRIPT)
+
+        return "|".join(frame.evaluate(DOM_FINGERPRINT_SCRIPT) for frame in page.frames)
+
+    def _inject_axe_into_frames(self, page: Page, frame_filter: FrameFilter) -> list[str | dict]:
+        """This injects axe-core into the child frames allowed by the filter, returning the selectors of the frames to exclude."""
+        excluded = []
+        frames = list(page.main_frame.child_frames)
+        while frames:
+            frame = frames.pop(0)
+            try:
+                if not self._frame_allowed(frame, frame_filter):
+                    excluded.append(self._frame_selector(frame))
+                    continue
+                if not frame.evaluate(AXE_LOADED_CHECK, self.axe_version):
+                    frame.evaluate(load_axe_script(self.axe_path))
+            except PlaywrightError as e:
+                # Frames can be detached at any point, e.g. by the page navigating them
+                logger.warning(f"Failed to prepare frame [{frame.url}] for scanning: {e}")
+                continue
+            frames.extend(frame.child_frames)
+
+        return excluded
+
+    def _frame_allowed(self, frame: Frame, frame_filter: FrameFilter) -> bool:
+        """This determines whether the frame provided should be scanned, based on its URL and frame element."""
+        if not frame_filter.allows_url(frame.url):
+            return False
+
+        return not frame_filter.exclude_selectors or not frame.frame_element().evaluate(
+            FRAME_MATCHES_SCRIPT, list(frame_filter.exclude_selectors))
+
+    def _frame_selector(self, frame: Frame) -> str | dict:
+        """This builds the axe-core selector for a child frame, from the selector of each frame element up to the main frame."""
+        frame_path = []
+        while frame.parent_frame is not None:
+            frame_path.insert(0, frame.frame_element().evaluate(FRAME_SELECTOR_SCRIPT))
+            frame = frame.parent_frame
+
+        return frame_path[0] if len(frame_path) == 1 else {"fromFrames": frame_path}
+
+    def _complete_pre_scan_actions(self, page: Page, actions: dict) -> None:
+        """This completes any pre-scan actions provided.
+        
+        Action format: dict
+        {
+            "action": [action],
+            "locator": [locator],
+            "value": [value (if applicable)],
+            "assert_locator": [assert_locator (if applicable)],
+            "assert_type": [assert_type (if applicable)],
+            "assert_value": [assert_value (if applicable)],
+            "wait_time": [wait_time (if applicable)]
+        }
+        """
+        self._check_pre_scan_actions(actions)
+
+        self._resolve_pre_scan_action(actions)()
+
+        assertion = self._resolve_pre_scan_assertion(actions, expect)
+        if assertion:
+            assertion()
+
+        if "wait_time" in actions and isinstance(actions["wait_time"], int):
+            page.wait_for_timeout(actions["wait_time"])
@@ -0,0 +1,151 @@
+import argparse
+import json
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from .axe import Axe, JSON_COMPRESSION_EXTENSIONS, JSON_EXCLUDABLE_SECTIONS, JSON_READ_ERRORS, open_json_file
+from .snapshot_store import SnapshotStore
+
+logger = logging.getLogger(__name__)
+
+GENERATED = "generated"
+SKIPPED = "skipped"
+FAILED = "failed"
+
+# The Axe instance used to generate reports in each worker process, created once by _init_worker()
+_worker_axe: Axe | None = None
+
+
+def find_json_results(directory: str | Path) -> list[Path]:
+    """
+    This returns the JSON results (including .json.gz and .json.zst files) in a directory, in filename order.
+
+    Args:
+        directory (str | pathlib.Path): The directory to search.
+
+    Returns:
+        list[pathlib.Path]: The paths of the JSON results found.
+    """
+    suffixes = tuple(f".json{extension}" for extension in JSON_COMPRESSION_EXTENSIONS.values())
+    return sorted(path for path in Path(directory).iterdir() if path.is_file() and path.name.endswith(suffixes))
+
+
+def regenerate_reports(results_directory: str | Path,
+                       output_directory: str | Path = None,
+                       snapshot_directory: str | Path = None,
+                       snapshot_store: str | Path = None,
+                       css_override: str = "",
+                       workers: int = None) -> dict[str, int]:
+    """
+    This regenerates the HTML report for each JSON result in a directory, without a browser. Reports are
+    generated across a pool of processes, and can be compared against snapshots as they would be when scanning.
+
+    Files that are not axe-core results (e.g. a consolidated report) are skipped, and files that cannot be
+    read are logged and counted as failed.
+
+    Args:
+        results_directory (str | pathlib.Path): The directory containing the JSON results.
+        output_directory (str | pathlib.Path): [Optional] The directory to save the HTML reports to. If not provided, defaults to results_directory.
+        snapshot_directory (str | pathlib.Path): [Optional] The directory containing JSON snapshots to compare against.
+        snapshot_store (str | pathlib.Path): [Optional] The SQLite file of a SnapshotStore to compare against, instead of snapshot_directory.
+        css_override (str): [Optional] If provided, overrides the default CSS used within the HTML reports.
+        workers (int): [Optional] The number of processes to use. If not provided, defaults to the number of CPUs. If 1, reports are generated in this process.
+
+    Returns:
+        dict[str, int]: The number of reports generated, skipped and failed.
+
+    Example:
+        ```
+        regenerate_reports("axe-reports", snapshot_directory="snapshots", css_override=Path("style.css").read_text())
+        ```
+    """
+    result_paths = find_json_results(results_directory)
+    worker_arguments = (str(output_directory or results_directory), css_override,
+                        str(snapshot_directory) if snapshot_directory else None,
+                        str(snapshot_store) if snapshot_store else None)
+    workers = min(workers or os.cpu_count() or 1, max(len(result_paths), 1))
+
+    if workers == 1:
+        _init_worker(*worker_arguments)
+        statuses = [_regenerate_report(path) for path in result_paths]
+        if _worker_axe.snapshot_store:
+            _worker_axe.snapshot_store.close()
+    else:
+        # Chunked so thousands of small reports are not each sent to a worker separately
+        chunk_size = max(1, len(result_paths) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=worker_arguments) as executor:
+            statuses = list(executor.map(_regenerate_report, result_paths, chunksize=chunk_size))
+
+    counts = {GENERATED: 0, SKIPPED: 0, FAILED: 0}
+    for status in statuses:
+        counts[status] += 1
+    return counts
+
+
+def _init_worker(output_directory: str, css_override: str, snapshot_directory: str | None, snapshot_store: str | None) -> None:
+    """This creates the Axe instance used to generate reports in the current process."""
+    global _worker_axe
+    _worker_axe = Axe(output_directory=output_directory, css_override=css_override,
+                      snapshot_directory=snapshot_directory,
+                      snapshot_store=SnapshotStore(snapshot_store) if snapshot_store else None)
+
+
+def _regenerate_report(result_path: Path) -> str:
+    """This generates the HTML report for a single JSON result, returning whether it was generated, skipped or failed."""
+    try:
+        with open_json_file(result_path) as file:
+            data = json.load(file)
+    except JSON_READ_ERRORS as e:
+        logger.warning(f"Failed to read result file {result_path}: {e}")
+        return FAILED
+
+    if not isinstance(data, dict) or "violations" not in data:
+        logger.debug(f"Skipping {result_path}, as it is not an axe-core result")
+        return SKIPPED
+
+    # Sections left out of the JSON report with json_exclude are reported as empty
+    for section in JSON_EXCLUDABLE_SECTIONS:
+        data.setdefault(section, [])
+
+    filename = result_path.name.removesuffix(".gz").removesuffix(".zst").removesuffix(".json")
+    try:
+        _worker_axe._create_html_report(data, filename)
+    except (KeyError, TypeError, ValueError) as e:
+        logger.warning(f"Failed to generate report for {result_path}: {e}")
+        return FAILED
+
+    return GENERATED
+
+
+def main(argv: list[str] = None) -> int:
+    """This runs the pytest-playwright-axe command line interface, returning the exit code."""
+    parser = argparse.ArgumentParser(prog="pytest-playwright-axe",
+                                     description="Tools for working with pytest-playwright-axe results.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    report_parser = subparsers.add_parser("report", help="Regenerate HTML reports from a directory of JSON results.")
+    report_parser.add_argument("results_directory", type=Path, help="Directory containing the JSON results.")
+    report_parser.add_argument("--output-dir", type=Path, default=None,
+                               help="Directory to save the HTML reports to. Defaults to the results directory.")
+    snapshot_group = report_parser.add_mutually_exclusive_group()
+    snapshot_group.add_argument("--snapshot-dir", type=Path, default=None,
+                                help="Directory containing JSON snapshots to compare against.")
+    snapshot_group.add_argument("--snapshot-store", type=Path, default=None,
+                                help="SQLite snapshot store to compare against.")
+    report_parser.add_argument("--css", type=Path, default=None, help="CSS file to use instead of the default styling.")
+    report_parser.add_argument("--workers", type=int, default=None,
+                               help="Number of processes to use. Defaults to the number of CPUs.")
+
+    args = parser.parse_args(argv)
+    if not args.results_directory.is_dir():
+        parser.error(f"results directory {args.results_directory} does not exist")
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be 1 or greater")
+
+    counts = regenerate_reports(args.results_directory, args.output_dir, args.snapshot_dir, args.snapshot_store,
+                                args.css.read_text(encoding="utf-8") if args.css else "", args.workers)
+
+    print(f"Generated {counts[GENERATED]} HTML report(s) in {args.output_dir or args.results_directory}"
+          f" ({counts[SKIPPED]} skipped, {counts[FAILED]} failed)")
+    return 1 if counts[FAILED] else 0
@@ -0,0 +1,202 @@
+import json
+import logging
+import shutil
+import tempfile
+import threading
+from html import escape
+from .axe import AxeBase, JSON_COMPRESSION_EXTENSIONS, open_json_file
+from .exceptions import AxeAccessibilityException
+
+logger = logging.getLogger(__name__)
+
+
+class ConsolidatedReport:
+    """
+    This builds a single HTML report and a single JSON report for results from multiple pages, adding each
+    page as it is scanned so memory use does not grow with the number of pages. The HTML summary rows and
+    page sections are written to temporary files until the report is closed.
+
+    The HTML report contains a summary table of all pages, linking to a section for each page with its
+    violations (and to the page's own HTML report, if one was generated). The JSON report is written as
+    JSON Lines (one page result per line) by default, or as a single JSON document.
+
+    If pages were sampled using a TemplateSampler, the reports also list each group of pages with the pages
+    scanned on its behalf, so the results of the pages scanned are attributed to every page in the group.
+
+    Args:
+        axe (Axe | AsyncAxe): The Axe or AsyncAxe instance to use for the output directory, CSS styling and JSON compression.
+        filename (str): [Optional] The filename to use for the reports, without an extension. Defaults to "consolidated_report".
+        json_lines (bool): [Optional] If true (default), writes a .jsonl file with one page per line. If false, writes a .json file with a "pages" list.
+
+    Example:
+        ```
+        axe = Axe()
+        with ConsolidatedReport(axe, "nightly_audit") as report:
+            for url in ["/home", "/search"]:
+                page.goto(url)
+                report.add(url, axe.run(page, html_report_generated=False, json_report_generated=False))
+        ```
+    """
+
+    def __init__(self, axe: AxeBase, filename: str = "consolidated_report", json_lines: bool = True) -> None:
+        self.axe = axe
+        self.filename = filename
+        self.json_lines = json_lines
+        self.html_path = axe._create_path_for_report(f"{filename}.html")
+        json_extension = ".jsonl" if json_lines else ".json"
+        self.json_path = axe._create_path_for_report(
+            f"{filename}{json_extension}{JSON_COMPRESSION_EXTENSIONS[axe.json_compression]}")
+
+        self._lock = threading.Lock()
+        self._page_count = 0
+        # Only pages scanned as a sample of a group are numbered here, to link to them from the groups table
+        self._page_numbers: dict[str, int] = {}
+        self._groups: dict[str, dict[str, list[str]]] = {}
+        self._summary_file = None
+        self._sections_file = None
+        self._json_file = None
+
+    def __enter__(self) -> "ConsolidatedReport":
+        self.open()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def open(self) -> None:
+        """This opens the report files ready for pages to be added."""
+        self._summary_file = tempfile.TemporaryFile("w+", encoding="utf-8")
+        self._sections_file = tempfile.TemporaryFile("w+", encoding="utf-8")
+        self._json_file = open_json_file(self.json_path, "w")
+        if not self.json_lines:
+            self._json_file.write('{"pages": [')
+
+    def add(self, results_key: str, data: dict, filename: str = "", group: str = "") -> None:
+        """
+        This adds the results for a page to the report.
+
+        Args:
+            results_key (str): The key for the page, as used by run_list().
+            data (dict): The axe-core results for the page.
+            filename (str): [Optional] The filename of the page's own reports, if generated, to link to.
+            group (str): [Optional] The TemplateSampler group the page was scanned as a sample of.
+        """
+        if self._json_file is None:
+            raise AxeAccessibilityException("Consolidated report must be opened before pages are added.")
+
+        with self._lock:
+            self._page_count += 1
+            page_number = self._page_count
+            if group:
+                self._page_numbers[results_key] = page_number
+            self._write_json_entry(page_number, results_key, data, filename, group)
+            self._write_html_section(page_number, results_key, data, filename)
+            group_label = f"<br>Template: {escape(group)}" if group else ""
+            self._summary_file.write(f'''<tr>
+                    <td style="text-align: center;">{page_number}</td>
+                    <td><a href="#page-{page_number}">{escape(results_key)}</a>{group_label}</td>
+                    <td style="text-align: center;">{len(data['violations'])}</td>
+                    <td style="text-align: center;">{sum(self.axe._node_count(violation) for violation in data['violations'])}</td>
+                    <td style="text-align: center;">{len(data['incomplete'])}</td>
+                    <td style="text-align: center;">{len(data['passes'])}</td>
+                    </tr>''')
+
+    def add_groups(self, groups: dict[str, dict[str, list[str]]]) -> None:
+        """
+        This records the groups of a TemplateSampler, replacing any previously recorded group with the same name.
+        The groups are written to the reports when the report is closed.
+
+        Args:
+            groups (dict[str, dict[str, list[str]]]): The groups of the sampler (TemplateSampler.groups), listing the pages scanned and skipped in each group.
+        """
+        with self._lock:
+            self._groups.update({group: {"scanned": list(members["scanned"]), "skipped": list(members["skipped"])}
+                                 for group, members in groups.items()})
+
+    def close(self) -> None:
+        """This writes the HTML report, including the summary of all pages added, and closes the report files."""
+        if self._json_file is None:
+            return
+
+        self._write_json_groups()
+        self._json_file.close()
+        self._json_file = None
+
+        with open(self.html_path, "w", encoding="utf-8") as file:
+            file.write(f'<!DOCTYPE html><html lang="en"><head>{self.axe._css_styling()}'
+                       '<title>Axe Accessibility Consolidated Report</title></head><body>')
+            represented = sum(len(members["skipped"]) for members in self._groups.values())
+            represented_text = f", representing {self._page_count + represented} page(s)" if self._groups else ""
+            file.write('<header role="banner"><h1>Axe Accessibility Consolidated Report</h1>'
+                       f'<p>This is an axe-core accessibility summary of {self._page_count} page(s){represented_text}.</p></header><main role="main">')
+            file.write(f"<h2>Pages Scanned</h2><table><tr>{self.axe._generate_table_header([
+                ("#", "2", True), ("Page", "58", False), ("Violations", "10", True),
+                ("Violating Nodes", "10", True), ("Incomplete", "10", True), ("Passes", "10", True)
+            ])}")
+            self._summary_file.seek(0)
+            shutil.copyfileobj(self._summary_file, file)
+            file.write("</table>")
+            if self._groups:
+                self._write_html_groups(file)
+
+            self._sections_file.seek(0)
+            shutil.copyfileobj(self._sections_file, file)
+            file.write("</main></body></html>")
+
+        self._summary_file.close()
+        self._sections_file.close()
+        self._summary_file = None
+        self._sections_file = None
+
+        logger.info(f"Consolidated HTML report generated: {self.html_path}")
+        logger.info(f"Consolidated JSON report generated: {self.json_path}")
+
+    def _write_json_entry(self, page_number: int, results_key: str, data: dict, filename: str, group: str = "") -> None:
+        """This writes the JSON entry for a page."""
+        if self.axe.json_exclude:
+            data = {key: value for key, value in data.items() if key not in self.axe.json_exclude}
+
+        entry = {"key": results_key, "filename": filename, "results": data}
+        if group:
+            entry["group"] = group
+        entry = json.dumps(entry, separators=(",", ":"))
+        if self.json_lines:
+            self._json_file.write(f"{entry}\n")
+        else:
+            self._json_file.write(entry if page_number == 1 else f",{entry}")
+
+    def _write_json_groups(self) -> None:
+        """This writes the sampled groups as a line each after the pages (JSON Lines), or as a "groups" list (JSON), and ends the document."""
+        groups = [{"group": group, **members} for group, members in self._groups.items()]
+        if self.json_lines:
+            self._json_file.writelines(f"{json.dumps(group, separators=(',', ':'))}\n" for group in groups)
+        else:
+            self._json_file.write(f'],"groups":{json.dumps(groups, separators=(",", ":"))}}}' if groups else "]}")
+
+    def _write_html_groups(self, file) -> None:
+        """This writes the table of sampled groups, linking to the pages scanned and listing the pages they represent."""
+        file.write(f"<h2>Sampled Templates</h2><table><tr>{self.axe._generate_table_header([
+            ("Template", "40", False), ("Pages Scanned", "40", False), ("Pages Represented", "20", True)
+        ])}")
+        for group, members in self._groups.items():
+            scanned_links = ", ".join(
+                f'<a href="#page-{self._page_numbers[results_key]}">{escape(results_key)}</a>'
+                if results_key in self._page_numbers else escape(results_key)
+                for results_key in members["scanned"])
+            skipped_list = "".join(f"<li>{escape(results_key)}</li>" for results_key in members["skipped"])
+            skipped_details = (f"<details><summary>{len(members['skipped'])} page(s) not scanned</summary>"
+                               f"<ul>{skipped_list}</ul></details>") if members["skipped"] else ""
+            file.write(f'''<tr>
+                    <td>{escape(group)}</td>
+                    <td>{scanned_links}</td>
+                    <td style="text-align: center;">{len(members["scanned"]) + len(members["skipped"])}{skipped_details}</td>
+                    </tr>''')
+        file.write("</table>")
+
+    def _write_html_section(self, page_number: int, results_key: str, data: dict, filename: str) -> None:
+        """This writes the HTML section for a page, with its violations."""
+        report_link = f' (<a href="{escape(filename)}.html">full report</a>)' if filename else ""
+        self._sections_file.write(f'''<section id="page-{page_number}"><h2>{page_number}. {escape(results_key)}</h2>
+                    <p><strong>URL:</strong> {escape(data['url'])}{report_link}</p>''')
+        self._sections_file.writelines(self.axe._iter_violations_section(data['violations']))
+        self._sections_file.write("</section>")
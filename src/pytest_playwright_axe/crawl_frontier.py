@@ -0,0 +1,225 @@
+import json
+import logging
+import threading
+from collections import deque
+from contextlib import suppress
+from fnmatch import fnmatchcase
+from pathlib import Path
+from urllib.parse import parse_qsl, urlencode, urljoin, urlsplit, urlunsplit
+from .exceptions import AxeAccessibilityException
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def normalize_url(url: str, base_url: str = "") -> str:
+    """
+    This normalizes a URL for crawling, so different forms of the same URL are only scanned once. The URL is
+    resolved against base_url (if provided), the scheme and host are lowercased, any default port, credentials and
+    fragment are removed, an empty path becomes "/" and the query parameters are sorted.
+
+    Args:
+        url (str): The URL to normalize.
+        base_url (str): [Optional] If provided, the URL to resolve a relative url against.
+
+    Returns:
+        str: The normalized URL.
+
+    Example:
+        ```
+        normalize_url("HTTPS://Example.com:443?b=2&a=1#top")  # https://example.com/?a=1&b=2
+        ```
+    """
+    parts = urlsplit(urljoin(base_url, url.strip()))
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if ":" in host:
+        host = f"[{host}]"
+    netloc = host if parts.port is None or parts.port == DEFAULT_PORTS.get(scheme) else f"{host}:{parts.port}"
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((scheme, netloc, parts.path or "/", query, ""))
+
+
+class CrawlFrontier:
+    """
+    This holds the state of a crawl for Axe.crawl(): the URLs queued to be scanned, with their depth from the seed
+    URLs, and every URL already seen so each page is only scanned once. Only links with the same origin as one of the
+    seed URLs are followed, and URLs are normalized (see normalize_url()) before being compared.
+
+    If a state_file is provided, the state is saved to it as JSON as the crawl progresses and when the crawl stops
+    (including on an error or interruption), and loaded from it when the frontier is created, so a crawl can be
+    resumed where it left off. URLs being scanned when the crawl stopped are scanned again on resume.
+
+    Args:
+        seed_urls (list[str]): The absolute URLs to start crawling from. Seed URLs are always scanned, regardless of the URL patterns.
+        max_depth (int): [Optional] If provided, the number of links to follow away from the seed URLs (0 only scans the seed URLs).
+        max_pages (int): [Optional] If provided, the maximum number of pages to scan, including any scanned before resuming.
+        include_urls (tuple[str, ...]): [Optional] If provided, only links with a URL matching one of these glob patterns (e.g. "https://example.com/docs/*") are followed.
+        exclude_urls (tuple[str, ...]): [Optional] If provided, links with a URL matching any of these glob patterns are not followed.
+        state_file (str | pathlib.Path): [Optional] If provided, the JSON file to save the state of the crawl to, and to resume from if it exists.
+        save_every (int): [Optional] The number of pages to scan between each save of the state file. Defaults to 25.
+
+    Example:
+        ```
+        frontier = CrawlFrontier(["https://example.com/"], max_depth=3, max_pages=500,
+                                 exclude_urls=("*/logout*", "*.pdf"), state_file="crawl_state.json")
+        Axe().crawl(page, frontier)
+        ```
+    """
+
+    def __init__(self,
+                 seed_urls: list[str],
+                 max_depth: int = None,
+                 max_pages: int = None,
+                 include_urls: tuple[str, ...] = (),
+                 exclude_urls: tuple[str, ...] = (),
+                 state_file: str | Path = None,
+                 save_every: int = 25) -> None:
+        self.max_depth = max_depth
+        self.max_pages = max_pages
+        self.include_urls = (include_urls,) if isinstance(include_urls, str) else tuple(include_urls)
+        self.exclude_urls = (exclude_urls,) if isinstance(exclude_urls, str) else tuple(exclude_urls)
+        self.state_file = Path(state_file) if state_file else None
+        self.save_every = save_every
+
+        self._condition = threading.Condition()
+        self._queue: deque[tuple[str, int]] = deque()
+        self._seen: set[str] = set()
+        self._in_progress: dict[str, int] = {}
+        self.scanned: list[str] = []
+        self.failed: list[str] = []
+        self._origins: set[str] = set()
+        self._stopped = False
+
+        if self.state_file and self.state_file.exists():
+            self._load()
+
+        for seed_url in seed_urls:
+            parts = urlsplit(seed_url)
+            if parts.scheme not in DEFAULT_PORTS or not parts.netloc:
+                raise AxeAccessibilityException(f"Seed URL provided [{seed_url}] must be an absolute http or https URL.")
+            url = normalize_url(seed_url)
+            self._origins.add(self._origin(url))
+            if url not in self._seen:
+                self._seen.add(url)
+                self._queue.append((url, 0))
+
+    @property
+    def finished(self) -> bool:
+        """Whether the crawl is complete, as there are no URLs left to scan (or the page limit is reached) and none in progress."""
+        with self._condition:
+            return not self._in_progress and (not self._queue or self._limit_reached())
+
+    def next(self) -> tuple[str, int] | None:
+        """This returns the next URL to scan with its depth, marking it as in progress, or None if there are none available now."""
+        with self._condition:
+            if self._stopped or not self._queue or self._limit_reached():
+                return None
+            url, depth = self._queue.popleft()
+            self._in_progress[url] = depth
+            return url, depth
+
+    def wait_next(self) -> tuple[str, int] | None:
+        """This returns the next URL to scan with its depth, waiting for URLs in progress to add links if required, or None once the crawl is finished."""
+        with self._condition:
+            while True:
+                entry = self.next()
+                if entry is not None or not self._in_progress or self._stopped:
+                    return entry
+                self._condition.wait()
+
+    def stop(self) -> None:
+        """This stops the crawl after the URLs in progress, so no more URLs are returned. URLs in progress that are not completed are scanned again on resume."""
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+
+    def follows_links(self, depth: int) -> bool:
+        """This determines whether the links on a page at the depth provided should be added to the frontier."""
+        return self.max_depth is None or depth < self.max_depth
+
+    def complete(self, url: str, links: list[str] = None, final_url: str = "", failed: bool = False) -> None:
+        """
+        This marks a URL as scanned (or failed), adding any new links found on the page to the frontier.
+
+        Args:
+            url (str): The URL returned by next().
+            links (list[str]): [Optional] The links found on the page. Relative links are resolved against final_url (or url). Ignored if the page is at the maximum depth.
+            final_url (str): [Optional] The URL of the page after any redirects, which is also marked as seen.
+            failed (bool): [Optional] If true, the URL could not be scanned. It is not retried.
+        """
+        with self._condition:
+            depth = self._in_progress.pop(url)
+            (self.failed if failed else self.scanned).append(url)
+            if final_url:
+                with suppress(ValueError):
+                    self._seen.add(normalize_url(final_url))
+
+            for link in (links or []) if self.follows_links(depth) else []:
+                try:
+                    link_url = normalize_url(link, final_url or url)
+                except ValueError:
+                    continue
+                if link_url not in self._seen and self._allows_url(link_url):
+                    self._seen.add(link_url)
+                    self._queue.append((link_url, depth + 1))
+
+            if self.state_file and len(self.scanned) % self.save_every == 0 and not failed:
+                self._save()
+            self._condition.notify_all()
+
+    def save(self) -> None:
+        """This saves the state of the crawl to the state file, if one was provided."""
+        if self.state_file:
+            with self._condition:
+                self._save()
+
+    def stats(self) -> dict:
+        """This returns the number of pages scanned, failed and queued, and the number of unique URLs seen."""
+        with self._condition:
+            return {"scanned": len(self.scanned), "failed": len(self.failed),
+                    "queued": len(self._queue) + len(self._in_progress), "seen": len(self._seen)}
+
+    def _limit_reached(self) -> bool:
+        """This determines whether the page limit has been reached, counting the pages in progress."""
+        return self.max_pages is not None and len(self.scanned) + len(self._in_progress) >= self.max_pages
+
+    def _origin(self, url: str) -> str:
+        """This returns the scheme and host of a normalized URL."""
+        parts = urlsplit(url)
+        return f"{parts.scheme}://{parts.netloc}"
+
+    def _allows_url(self, url: str) -> bool:
+        """This determines whether a link should be followed, based on its origin and the URL patterns."""
+        if self._origin(url) not in self._origins:
+            return False
+        if self.include_urls and not any(fnmatchcase(url, pattern) for pattern in self.include_urls):
+            return False
+        return not any(fnmatchcase(url, pattern) for pattern in self.exclude_urls)
+
+    def _save(self) -> None:
+        """This writes the state file, putting any URLs in progress back in the queue so they are scanned on resume."""
+        state = {
+            "queue": [[url, depth] for url, depth in self._in_progress.items()] +
+                     [[url, depth] for url, depth in self._queue],
+            "seen": sorted(self._seen),
+            "scanned": self.scanned,
+            "failed": self.failed
+        }
+        temporary_path = self.state_file.with_name(f"{self.state_file.name}.tmp")
+        self.state_file.parent.mkdir(parents=True, exist_ok=True)
+        temporary_path.write_text(json.dumps(state), encoding="utf-8")
+        temporary_path.replace(self.state_file)
+
+    def _load(self) -> None:
+        """This loads the state of a previous crawl from the state file."""
+        try:
+            state = json.loads(self.state_file.read_text(encoding="utf-8"))
+            self._queue = deque((url, depth) for url, depth in state["queue"])
+            self._seen = set(state["seen"])
+            self.scanned = list(state["scanned"])
+            self.failed = list(state["failed"])
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            raise AxeAccessibilityException(f"Failed to resume crawl from state file {self.state_file}: {e}")
+        logger.info(f"Resuming crawl from {self.state_file}: {len(self.scanned)} scanned, {len(self._queue)} queued")
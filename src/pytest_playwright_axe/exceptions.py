@@ -0,0 +1,2 @@
+class AxeAccessibilityException(Exception):
+    pass
@@ -0,0 +1,220 @@
+import json
+from dataclasses import dataclass, replace
+from fnmatch import fnmatchcase
+from functools import cached_property
+from .exceptions import AxeAccessibilityException
+
+WCAG_22AA_RULESET = ['wcag2a', 'wcag21a', 'wcag2aa',
+                     'wcag21aa', 'wcag22a', 'wcag22aa', 'best-practice']
+
+RESULT_TYPES = ("violations", "incomplete", "passes", "inapplicable")
+# Tags axe-core leaves out of a tag-based runOnly unless they are requested
+AXE_DEFAULT_TAG_EXCLUDE = ("experimental", "deprecated")
+
+
+@dataclass(frozen=True)
+class ResultFilter:
+    """
+    This describes how the axe-core results should be reduced in the browser before they are returned,
+    to reduce the amount of data transferred from the browser on large pages.
+
+    Args:
+        drop_pass_nodes (bool): [Optional] If true, remove the nodes from each passed rule. The rules themselves (and their node counts) are kept.
+        drop_inapplicable (bool): [Optional] If true, remove the inapplicable rules from the results.
+        max_nodes_per_rule (int): [Optional] If provided, the maximum number of nodes to return for each violation, incomplete and passed rule.
+        strip_html (bool): [Optional] If true, replace the HTML snippet of each node (and its related nodes) with an empty string.
+
+    Example:
+        ```
+        # Only return the detail needed for violations
+        Axe().run(page, result_filter=ResultFilter(drop_pass_nodes=True, drop_inapplicable=True))
+        ```
+    """
+    drop_pass_nodes: bool = False
+    drop_inapplicable: bool = False
+    max_nodes_per_rule: int | None = None
+    strip_html: bool = False
+
+
+VIOLATIONS_ONLY_FILTER = ResultFilter(drop_pass_nodes=True, drop_inapplicable=True)
+
+
+@dataclass(frozen=True)
+class AxeOptions:
+    """
+    This describes the options axe-core should use. It is serialized to JSON once and passed to axe-core as an
+    argument, rather than as JavaScript source, and is hashable so it can be used as a dictionary or cache key.
+
+    Args:
+        run_only (tuple[str, ...]): [Optional] If provided, only run the rules with these tags (or IDs, if run_only_type is "rule").
+        run_only_type (str): [Optional] Either "tag" (default) or "rule".
+        rules (dict[str, bool]): [Optional] If provided, rule IDs mapped to whether the rule is enabled.
+        result_types (tuple[str, ...]): [Optional] If provided, the result types to return all nodes for. Other result types only return one node per rule. Can include "violations", "incomplete", "passes" or "inapplicable".
+        iframes (bool): [Optional] If provided, whether axe-core should test iframes.
+        selectors (bool): [Optional] If provided, whether axe-core should return a selector for each node.
+        resolve_rules (bool): [Optional] If true, tags in run_only are resolved to the IDs of the rules to run (leaving out any disabled in rules) before scanning, so axe-core does not need to match tags against every rule. Resolved rules are cached per axe-core version.
+
+    Example:
+        ```
+        options = AxeOptions(run_only=("wcag2a", "wcag2aa"), rules={"color-contrast": False})
+        Axe().run(page, options=options)
+        ```
+    """
+    run_only: tuple[str, ...] = ()
+    run_only_type: str = "tag"
+    rules: tuple[tuple[str, bool], ...] = ()
+    result_types: tuple[str, ...] = ()
+    iframes: bool | None = None
+    selectors: bool | None = None
+    resolve_rules: bool = False
+
+    def __post_init__(self) -> None:
+        if self.run_only_type not in ("tag", "rule"):
+            raise AxeAccessibilityException(f"run_only_type provided [{self.run_only_type}] must be 'tag' or 'rule'.")
+        for result_type in self.result_types:
+            if result_type not in RESULT_TYPES:
+                raise AxeAccessibilityException(f"Result type provided [{result_type}] is not valid.")
+
+        # Stored as tuples so the options are hashable, whatever sequence or mapping is provided
+        rules = self.rules.items() if isinstance(self.rules, dict) else self.rules
+        object.__setattr__(self, "run_only", tuple(self.run_only))
+        object.__setattr__(self, "rules", tuple(sorted((rule_id, bool(enabled)) for rule_id, enabled in rules)))
+        object.__setattr__(self, "result_types", tuple(self.result_types))
+
+    @cached_property
+    def axe_options(self) -> dict:
+        """The options in the format expected by axe-core."""
+        options = {}
+        if self.run_only:
+            options["runOnly"] = {"type": self.run_only_type, "values": list(self.run_only)}
+        if self.rules:
+            options["rules"] = {rule_id: {"enabled": enabled} for rule_id, enabled in self.rules}
+        if self.result_types:
+            options["resultTypes"] = list(self.result_types)
+        if self.iframes is not None:
+            options["iframes"] = self.iframes
+        if self.selectors is not None:
+            options["selectors"] = self.selectors
+        return options
+
+    @cached_property
+    def json(self) -> str:
+        """The options serialized as JSON."""
+        return json.dumps(self.axe_options, separators=(",", ":"), sort_keys=True)
+
+    def with_resolved_rules(self, axe_rules: list[dict]) -> "AxeOptions":
+        """
+        This returns a copy of these options with the tags in run_only replaced by the IDs of the rules they select,
+        matching how axe-core selects rules by tag: rules enabled or disabled in rules are included or left out,
+        and rules tagged "experimental" or "deprecated" are left out unless those tags are in run_only.
+
+        Args:
+            axe_rules (list[dict]): The rules available in axe-core, as returned by Axe.get_rules().
+
+        Returns:
+            AxeOptions: The options with run_only resolved to rule IDs, or these options if run_only is not a list of tags.
+        """
+        if self.run_only_type != "tag" or not self.run_only:
+            return self
+
+        enabled_rules = dict(self.rules)
+        excluded_tags = [tag for tag in AXE_DEFAULT_TAG_EXCLUDE if tag not in self.run_only]
+        rule_ids = tuple(
+            rule["ruleId"] for rule in axe_rules
+            if enabled_rules.get(rule["ruleId"], any(tag in rule["tags"] for tag in self.run_only) and
+                                 not any(tag in rule["tags"] for tag in excluded_tags))
+        )
+        return replace(self, run_only=rule_ids, run_only_type="rule", rules=(), resolve_rules=False)
+
+
+@dataclass(frozen=True)
+class AxeContext:
+    """
+    This describes the context axe-core should use, as CSS selectors for the elements to include and exclude.
+    Like AxeOptions, it is passed to axe-core as an argument and is hashable.
+
+    Args:
+        include (tuple[str, ...]): [Optional] If provided, the selectors of the elements to scan. If not provided, the whole page is scanned.
+        exclude (tuple[str, ...]): [Optional] If provided, the selectors of the elements not to scan.
+
+    Example:
+        ```
+        Axe().run(page, context=AxeContext(include=("main",), exclude=(".ad-banner",)))
+        ```
+    """
+    include: tuple[str, ...] = ()
+    exclude: tuple[str, ...] = ()
+
+    def __post_init__(self) -> None:
+        for field_name in ("include", "exclude"):
+            selectors = getattr(self, field_name)
+            object.__setattr__(self, field_name, (selectors,) if isinstance(selectors, str) else tuple(selectors))
+
+    @cached_property
+    def axe_context(self) -> dict:
+        """The context in the format expected by axe-core."""
+        context = {}
+        if self.include:
+            context["include"] = list(self.include)
+        if self.exclude:
+            context["exclude"] = list(self.exclude)
+        return context
+
+    @cached_property
+    def json(self) -> str:
+        """The context serialized as JSON, or an empty str if no selectors were provided (axe-core rejects an empty context)."""
+        return json.dumps(self.axe_context, separators=(",", ":")) if self.axe_context else ""
+
+
+@dataclass(frozen=True)
+class FrameFilter:
+    """
+    This describes which child frames (iframes) should be scanned. axe-core is injected into each frame matching
+    the filter before the scan, and axe-core merges the results from each frame into the results of the page, with
+    the target of each node in a frame starting with the selector of the frame. Frames not matching the filter are
+    excluded from the scan, so axe-core does not wait for them to respond.
+
+    Shadow DOM does not need a filter, as axe-core scans open shadow roots as part of the page they are in.
+
+    Args:
+        include_urls (tuple[str, ...]): [Optional] If provided, only frames with a URL matching one of these glob patterns (e.g. "https://*.example.com/*") are scanned.
+        exclude_urls (tuple[str, ...]): [Optional] If provided, frames with a URL matching any of these glob patterns are not scanned.
+        exclude_selectors (tuple[str, ...]): [Optional] If provided, frames whose iframe element matches any of these selectors are not scanned.
+
+    Example:
+        ```
+        # Scan every frame except adverts
+        Axe().run(page, frame_filter=FrameFilter(exclude_urls=("https://ads.example.com/*",)))
+        ```
+    """
+    include_urls: tuple[str, ...] = ()
+    exclude_urls: tuple[str, ...] = ()
+    exclude_selectors: tuple[str, ...] = ()
+
+    def __post_init__(self) -> None:
+        for field_name in ("include_urls", "exclude_urls", "exclude_selectors"):
+            values = getattr(self, field_name)
+            object.__setattr__(self, field_name, (values,) if isinstance(values, str) else tuple(values))
+
+    @property
+    def excludes_frames(self) -> bool:
+        """Whether the filter can exclude any frames from the scan."""
+        return bool(self.include_urls or self.exclude_urls or self.exclude_selectors)
+
+    def allows_url(self, url: str) -> bool:
+        """This determines whether a frame with the URL provided should be scanned, based on the URL patterns."""
+        if self.include_urls and not any(fnmatchcase(url, pattern) for pattern in self.include_urls):
+            return False
+        return not any(fnmatchcase(url, pattern) for pattern in self.exclude_urls)
+
+
+# Scans every child frame
+ALL_FRAMES = FrameFilter()
+
+OPTIONS_WCAG_22AA = "{runOnly: {type: 'tag', values: " + \
+    str(WCAG_22AA_RULESET) + "}}"
+# The same ruleset as OPTIONS_WCAG_22AA, as AxeOptions passed to axe-core as an argument
+AXE_OPTIONS_WCAG_22AA = AxeOptions(run_only=tuple(WCAG_22AA_RULESET))
+# Runs the WCAG 2.2 AA rules, resolved to rule IDs, returning every node only for violations
+AXE_OPTIONS_WCAG_22AA_VIOLATIONS = AxeOptions(run_only=tuple(WCAG_22AA_RULESET), result_types=("violations",),
+                                              resolve_rules=True)
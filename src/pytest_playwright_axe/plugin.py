@@ -0,0 +1,206 @@
+import threading
+import pytest
+from collections.abc import Iterator
+from pathlib import Path
+from .axe import Axe, DEFAULT_REPORT_PATH, preload_axe_script
+from .report_writer import ReportWriter
+from .scan_cache import ScanCache
+from .scan_metrics import ScanMetrics
+from .snapshot_store import SnapshotStore
+
+SUMMARY_KEY = pytest.StashKey["AxeSessionSummary"]()
+REPORT_WRITER_KEY = pytest.StashKey[ReportWriter]()
+WORKER_OUTPUT_KEY = "axe_summary"
+
+
+class AxeSessionSummary:
+    """
+    This records the number of pages scanned and the violations found across a test session, so they can be
+    summarised at the end of the run. Summaries from pytest-xdist workers are combined using merge().
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.pages_scanned = 0
+        self.pages_with_violations = 0
+        self.rules: dict[str, dict] = {}
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def record(self, response: dict) -> None:
+        """This records the axe-core results for a single page."""
+        with self._lock:
+            self.pages_scanned += 1
+            if len(response["violations"]) > 0:
+                self.pages_with_violations += 1
+
+            for violation in response["violations"]:
+                rule = self.rules.setdefault(violation["id"], {"impact": violation["impact"], "pages": 0, "nodes": 0})
+                rule["pages"] += 1
+                rule["nodes"] += violation.get("nodeCount", len(violation["nodes"]))
+
+    def record_cache(self, cache_stats: dict) -> None:
+        """This records the hits and misses from a ScanCache used in the session."""
+        with self._lock:
+            self.cache_hits += cache_stats["hits"]
+            self.cache_misses += cache_stats["misses"]
+
+    def merge(self, summary_data: dict) -> None:
+        """This adds the summary data from another session (e.g. a pytest-xdist worker) to this summary."""
+        with self._lock:
+            self.pages_scanned += summary_data["pages_scanned"]
+            self.pages_with_violations += summary_data["pages_with_violations"]
+            self.cache_hits += summary_data["cache_hits"]
+            self.cache_misses += summary_data["cache_misses"]
+
+            for rule_id, rule_data in summary_data["rules"].items():
+                rule = self.rules.setdefault(rule_id, {"impact": rule_data["impact"], "pages": 0, "nodes": 0})
+                rule["pages"] += rule_data["pages"]
+                rule["nodes"] += rule_data["nodes"]
+
+    def to_dict(self) -> dict:
+        """This returns the summary as a dict that can be serialized (e.g. to send from a pytest-xdist worker)."""
+        with self._lock:
+            return {
+                "pages_scanned": self.pages_scanned,
+                "pages_with_violations": self.pages_with_violations,
+                "cache_hits": self.cache_hits,
+                "cache_misses": self.cache_misses,
+                "rules": {rule_id: dict(rule) for rule_id, rule in self.rules.items()}
+            }
+
+    def summary_lines(self) -> list[str]:
+        """This returns the lines to output in the terminal summary, with the most frequent violations first."""
+        lines = [f"Pages scanned: {self.pages_scanned}, pages with violations: {self.pages_with_violations}"]
+        if self.cache_hits or self.cache_misses:
+            lines.append(f"Scan cache: {self.cache_hits} hit(s), {self.cache_misses} miss(es)")
+
+        for rule_id, rule in sorted(self.rules.items(), key=lambda item: (-item[1]["pages"], -item[1]["nodes"], item[0])):
+            lines.append(f"  {rule_id} ({rule['impact']}): {rule['nodes']} node(s) on {rule['pages']} page(s)")
+
+        return lines
+
+
+class MetricsFile:
+    """
+    This appends the ScanMetrics of each page scanned to a file, as a line of JSON per page. Lines are written
+    individually in append mode, so pytest-xdist workers can share the same file.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self._lock = threading.Lock()
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(path, "a", encoding="utf-8", buffering=1)
+
+    def write(self, metrics: ScanMetrics) -> None:
+        """This writes the metrics for a single page."""
+        with self._lock:
+            self._file.write(metrics.to_json() + "\n")
+
+    def close(self) -> None:
+        """This closes the file."""
+        with self._lock:
+            self._file.close()
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("playwright-axe", "axe-core accessibility scanning")
+    group.addoption("--axe-output-dir", default=str(DEFAULT_REPORT_PATH),
+                    help="Directory to save axe-core reports to. Defaults to axe-reports in the current directory.")
+    group.addoption("--axe-minified", action="store_true", default=False,
+                    help="Use the minified axe-core file.")
+    group.addoption("--axe-snapshot-dir", default=None,
+                    help="Directory containing JSON snapshots from previous runs to compare against.")
+    group.addoption("--axe-snapshot-store", default=None,
+                    help="SQLite file to store snapshots in and compare against, instead of --axe-snapshot-dir.")
+    group.addoption("--axe-promote-snapshots", action="store_true", default=False,
+                    help="Make the snapshots from this run the baseline in --axe-snapshot-store at the end of the run.")
+    group.addoption("--axe-scan-cache", default=None,
+                    help="Directory to cache results in, so pages unchanged since a previous scan are not scanned again.")
+    group.addoption("--axe-metrics-file", default=None,
+                    help="File to append the timings of each scan to, as a line of JSON per page.")
+    group.addoption("--axe-report-workers", type=int, default=None,
+                    help="Number of background threads to write reports on, so tests continue while reports are written.")
+    group.addoption("--axe-strict", action="store_true", default=False,
+                    help="Fail the test if an axe-core violation is detected.")
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.stash[SUMMARY_KEY] = AxeSessionSummary()
+
+
+@pytest.fixture(scope="session")
+def axe(pytestconfig: pytest.Config) -> Iterator[Axe]:
+    """
+    An Axe instance shared across the test session, configured using the --axe-* command line options.
+    Every page scanned using this instance is included in the summary at the end of the run. If
+    --axe-report-workers is provided, reports are written by a ReportWriter closed at the end of the session.
+    """
+    preload_axe_script()
+    store_path = pytestconfig.getoption("--axe-snapshot-store")
+    snapshot_store = SnapshotStore(store_path) if store_path else None
+    cache_directory = pytestconfig.getoption("--axe-scan-cache")
+    scan_cache = ScanCache(cache_directory) if cache_directory else None
+    metrics_path = pytestconfig.getoption("--axe-metrics-file")
+    metrics_file = MetricsFile(metrics_path) if metrics_path else None
+    report_workers = pytestconfig.getoption("--axe-report-workers")
+    report_writer = ReportWriter(workers=report_workers) if report_workers else None
+    if report_writer:
+        pytestconfig.stash[REPORT_WRITER_KEY] = report_writer
+    session_axe = Axe(
+        output_directory=pytestconfig.getoption("--axe-output-dir"),
+        use_minified_file=pytestconfig.getoption("--axe-minified"),
+        snapshot_directory=pytestconfig.getoption("--axe-snapshot-dir"),
+        strict_mode=pytestconfig.getoption("--axe-strict"),
+        result_callback=pytestconfig.stash[SUMMARY_KEY].record,
+        snapshot_store=snapshot_store,
+        scan_cache=scan_cache,
+        metrics_callback=metrics_file.write if metrics_file else None,
+        report_writer=report_writer
+    )
+    yield session_axe
+    session_axe.flush_reports()
+
+    if metrics_file:
+        metrics_file.close()
+
+    if scan_cache:
+        pytestconfig.stash[SUMMARY_KEY].record_cache(scan_cache.stats())
+
+    if snapshot_store:
+        snapshot_store.close()
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    # Write any reports still queued (e.g. if the axe fixture teardown failed) and stop the writer threads
+    report_writer = session.config.stash.get(REPORT_WRITER_KEY, None)
+    if report_writer:
+        report_writer.close()
+
+    # Snapshots are promoted once, by the pytest-xdist controller (or the only process) after all tests have run
+    store_path = session.config.getoption("--axe-snapshot-store")
+    if store_path and session.config.getoption("--axe-promote-snapshots") and not hasattr(session.config, "workerinput"):
+        with SnapshotStore(store_path) as snapshot_store:
+            snapshot_store.promote()
+
+    # Send this worker's summary to the pytest-xdist controller
+    if hasattr(session.config, "workeroutput"):
+        session.config.workeroutput[WORKER_OUTPUT_KEY] = session.config.stash[SUMMARY_KEY].to_dict()
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error) -> None:
+    # Called on the pytest-xdist controller as each worker finishes
+    worker_summary = getattr(node, "workeroutput", {}).get(WORKER_OUTPUT_KEY)
+    if worker_summary:
+        node.config.stash[SUMMARY_KEY].merge(worker_summary)
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus: int, config: pytest.Config) -> None:
+    summary = config.stash.get(SUMMARY_KEY, None)
+    if hasattr(config, "workerinput") or summary is None or summary.pages_scanned == 0:
+        return
+
+    terminalreporter.write_sep("=", "axe-core accessibility summary")
+    for line in summary.summary_lines():
+        terminalreporter.write_line(line)
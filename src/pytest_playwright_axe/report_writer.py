@@ -0,0 +1,101 @@
+import atexit
+import logging
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
+from .exceptions import AxeAccessibilityException
+
+logger = logging.getLogger(__name__)
+
+
+class ReportWriter:
+    """
+    This writes reports on background threads, so scanning can continue while reports are generated.
+    It can be shared between multiple Axe instances.
+
+    Reports are queued as they are submitted, and once max_pending reports are waiting to be written any
+    further submissions block until one completes. Any errors are logged as they occur and raised as an
+    AxeAccessibilityException from flush() or close(). Any reports still pending when Python exits are written
+    before exiting.
+
+    Args:
+        max_pending (int): [Optional] The maximum number of reports waiting to be written. Defaults to 8.
+        workers (int): [Optional] The number of threads writing reports. Defaults to 2.
+
+    Example:
+        ```
+        writer = ReportWriter()
+        axe = Axe(report_writer=writer)
+        axe.run_list(page, ["/home", "/search"])
+        # Wait for all reports to be written
+        writer.flush()
+        ```
+    """
+
+    def __init__(self, max_pending: int = 8, workers: int = 2) -> None:
+        if max_pending < 1 or workers < 1:
+            raise AxeAccessibilityException("max_pending and workers must be 1 or greater.")
+
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="axe-report-writer")
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._lock = threading.Lock()
+        self._all_written = threading.Condition(self._lock)
+        self._pending: set[Future] = set()
+        self._errors: list[BaseException] = []
+        self._closed = False
+        atexit.register(self._close_at_exit)
+
+    def submit(self, function: Callable[..., Any], *args: Any) -> None:
+        """This queues a report writing function to run in the background, blocking if the queue is full."""
+        if self._closed:
+            raise AxeAccessibilityException("Report writer has been closed.")
+
+        self._slots.acquire()
+        try:
+            future = self._executor.submit(function, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+
+        with self._lock:
+            self._pending.add(future)
+        future.add_done_callback(self._complete)
+
+    def flush(self) -> None:
+        """This waits for all queued reports to be written, raising an exception if any failed."""
+        with self._all_written:
+            self._all_written.wait_for(lambda: not self._pending)
+            errors, self._errors = self._errors, []
+        if errors:
+            raise AxeAccessibilityException(
+                f"Failed to write {len(errors)} report(s), first error: {errors[0]}") from errors[0]
+
+    def close(self) -> None:
+        """This writes any queued reports and stops the background threads, raising an exception if any failed."""
+        if self._closed:
+            return
+
+        self._closed = True
+        try:
+            self.flush()
+        finally:
+            self._executor.shutdown(wait=True)
+            atexit.unregister(self._close_at_exit)
+
+    def _complete(self, future: Future) -> None:
+        """This releases the queue slot for a completed report and records any error."""
+        self._slots.release()
+        with self._all_written:
+            self._pending.discard(future)
+            if future.exception() is not None:
+                self._errors.append(future.exception())
+                logger.error(f"Failed to write report in background: {future.exception()}")
+            self._all_written.notify_all()
+
+    def _close_at_exit(self) -> None:
+        """This writes any queued reports when Python exits, logging rather than raising any errors."""
+        try:
+            self.close()
+        except AxeAccessibilityException as e:
+            logger.error(str(e))
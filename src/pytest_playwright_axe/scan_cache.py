@@ -0,0 +1,130 @@
+import json
+import logging
+import os
+import tempfile
+import threading
+from contextlib import suppress
+from datetime import datetime, timezone
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+SCAN_CACHE_FILE_PREFIX = "scan-cache-"
+
+
+class ScanCache:
+    """
+    This caches axe-core results for incremental scanning, so a page is only scanned again if it has changed.
+    Results are keyed by a fingerprint of the page (its DOM, stylesheets and viewport size), the page URL, the
+    axe-core version and the context, options and result filter used. It can be shared between multiple Axe instances.
+
+    Results are held in memory, and also saved to the directory provided (if any) so they can be reused by later
+    test runs. Saved files are prefixed with "scan-cache-", so the directory can be shared with other files. The
+    number of hits and misses is recorded, so the saving can be checked using stats().
+
+    Cached results are returned with their timestamp set to the time they were looked up, and the timestamp of
+    the scan they were cached from as cachedTimestamp. Files are written atomically so the directory can be shared
+    between processes (e.g. pytest-xdist workers), and any file that cannot be parsed is logged, removed and
+    treated as a miss.
+
+    Args:
+        directory (str | pathlib.Path): [Optional] If provided, the directory to save cached results to and load them from.
+
+    Example:
+        ```
+        cache = ScanCache(directory=".axe-cache")
+        axe = Axe(scan_cache=cache)
+        axe.run_list(page, ["/home", "/search"])
+        print(cache.stats())
+        ```
+    """
+
+    def __init__(self, directory: str | Path = None) -> None:
+        self.directory = Path(directory) if directory else None
+        self._lock = threading.Lock()
+        self._results: dict[str, str] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> dict | None:
+        """This returns a copy of the cached results for the key provided, or None if there are none."""
+        with self._lock:
+            cached = self._results.get(key)
+
+        if cached is None and self.directory:
+            cache_path = self._cache_path(key)
+            try:
+                cached = cache_path.read_text(encoding="utf-8")
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"Failed to read scan cache file {cache_path}: {e}")
+
+        results = None
+        if cached is not None:
+            try:
+                results = json.loads(cached)
+            except ValueError as e:
+                logger.warning(f"Discarding unreadable scan cache entry {key}: {e}")
+                self._discard(key)
+
+        with self._lock:
+            if results is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._results[key] = cached
+
+        results["cachedTimestamp"] = results["timestamp"]
+        results["timestamp"] = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
+        return results
+
+    def put(self, key: str, results: dict) -> None:
+        """This caches the results provided against the key provided."""
+        serialized = json.dumps(results, separators=(",", ":"))
+        with self._lock:
+            self._results[key] = serialized
+
+        if self.directory:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            # Written to a temporary file first, so other processes never read a partially written file
+            file_descriptor, temporary_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp",
+                                                               prefix=f"{SCAN_CACHE_FILE_PREFIX}{key}.")
+            try:
+                with os.fdopen(file_descriptor, "w", encoding="utf-8") as file:
+                    file.write(serialized)
+                Path(temporary_path).replace(self._cache_path(key))
+            except BaseException:
+                with suppress(OSError):
+                    os.unlink(temporary_path)
+                raise
+
+    def clear(self) -> None:
+        """This removes all cached results (including any saved to the directory, leaving other files) and resets the stats."""
+        with self._lock:
+            self._results.clear()
+            self.hits = 0
+            self.misses = 0
+
+        if self.directory and self.directory.exists():
+            for cache_path in self.directory.glob(f"{SCAN_CACHE_FILE_PREFIX}*.json"):
+                cache_path.unlink()
+
+    def stats(self) -> dict:
+        """This returns the number of cache hits and misses, and the hit rate (between 0 and 1)."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {"hits": self.hits, "misses": self.misses, "hit_rate": self.hits / lookups if lookups else 0.0}
+
+    def _discard(self, key: str) -> None:
+        """This removes the cached results for the key provided, including any file saved to the directory."""
+        with self._lock:
+            self._results.pop(key, None)
+
+        if self.directory:
+            with suppress(OSError):
+                self._cache_path(key).unlink(missing_ok=True)
+
+    def _cache_path(self, key: str) -> Path:
+        """This returns the path of the file the results for the key provided are saved to."""
+        return self.directory.joinpath(f"{SCAN_CACHE_FILE_PREFIX}{key}.json")
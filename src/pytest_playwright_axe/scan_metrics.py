@@ -0,0 +1,66 @@
+import json
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict, field
+
+# Phases timed within another phase, which are left out of the total so their time is not counted twice
+NESTED_PHASES = frozenset({"snapshot_load_ms"})
+
+
+@dataclass
+class ScanMetrics:
+    """
+    This records how long each phase of a scan took, in milliseconds, and the size of the results transferred
+    from the browser. Metrics are passed to the metrics_callback of an Axe instance, and logged as JSON to the
+    pytest_playwright_axe.axe.metrics logger at DEBUG level.
+
+    Phases are only included if they took place during the scan, and can include:
+    - fingerprint_ms: Fingerprinting the page for the scan cache.
+    - inject_ms: Checking for and injecting axe-core.
+    - resolve_rules_ms: Resolving the tags in the options to rule IDs.
+    - inject_frames_ms: Injecting axe-core into the child frames matching the frame_filter.
+    - axe_run_ms: Running axe-core in the page.
+    - transfer_ms: Transferring the results from the page.
+    - snapshot_load_ms: Loading the snapshot to compare against, as part of html_report_ms.
+    - html_report_ms: Generating the HTML report (including snapshot loading), or submitting it to the report writer.
+    - json_report_ms: Writing the JSON report, or submitting it to the report writer.
+    - snapshot_store_ms: Saving the results to the snapshot store.
+    - aggregate_ms: Adding the violations to the violation aggregator.
+
+    Args:
+        url (str): The URL of the page scanned.
+        filename (str): [Optional] The filename provided for the reports, if any.
+        axe_version (str): [Optional] The version of axe-core used.
+        cache_hit (bool): [Optional] If true, the results were returned from the scan cache without running axe-core.
+        payload_bytes (int): [Optional] The size of the results transferred from the browser, as JSON.
+        phases (dict[str, float]): [Optional] The time taken by each phase of the scan, in milliseconds.
+    """
+    url: str
+    filename: str = ""
+    axe_version: str = ""
+    cache_hit: bool = False
+    payload_bytes: int = 0
+    phases: dict[str, float] = field(default_factory=dict)
+
+    @property
+    def total_ms(self) -> float:
+        """This returns the total time taken by the phases recorded, in milliseconds, not counting nested phases twice."""
+        return sum(duration for name, duration in self.phases.items() if name not in NESTED_PHASES)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """This times the code run within it, adding the duration to the phase provided."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + (time.perf_counter() - start) * 1000
+
+    def to_dict(self) -> dict:
+        """This returns the metrics as a dict, including the total time taken."""
+        return {**asdict(self), "total_ms": self.total_ms}
+
+    def to_json(self) -> str:
+        """This returns the metrics as a single line of JSON."""
+        return json.dumps(self.to_dict(), separators=(",", ":"))
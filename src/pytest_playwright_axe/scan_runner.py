@@ -0,0 +1,248 @@
+import asyncio
+import logging
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING
+from playwright.async_api import Browser, BrowserContext, Page, Error as PlaywrightError
+from .async_axe import AsyncAxe
+from .exceptions import AxeAccessibilityException
+from .options import AxeContext, AxeOptions, FrameFilter, ResultFilter
+
+if TYPE_CHECKING:
+    from .consolidated_report import ConsolidatedReport
+
+logger = logging.getLogger(__name__)
+
+# Chromium only, other browsers report 0 so pages are only recycled by scan count
+HEAP_SIZE_SCRIPT = "() => performance.memory ? performance.memory.usedJSHeapSize : 0"
+CLOSE_TIMEOUT = 10.0
+
+
+class _PooledPage:
+    """A page in the scan runner's pool, each in its own browser context so recycling releases all of its memory."""
+
+    def __init__(self) -> None:
+        self.context: BrowserContext | None = None
+        self.page: Page | None = None
+        self.scans = 0
+
+
+class ScanRunner:
+    """
+    This scans a large number of URLs using a pool of pages, each in its own browser context, for audits that
+    are too long to run on a single page. Each page is recycled (its context closed and a new one created)
+    after a number of scans or once its JavaScript heap grows too large, so browser memory stays flat, and a
+    scan that times out or crashes its page is retried on a fresh page rather than stopping the run.
+
+    Results are not kept in memory. Reports are generated, snapshots compared and callbacks called by the
+    AsyncAxe instance provided as for any other scan, and each page can also be added to a ConsolidatedReport.
+
+    Args:
+        axe (AsyncAxe): The AsyncAxe instance to scan with.
+        browser (playwright.async_api.Browser): The browser to open the pool's contexts in. If it disconnects (e.g. crashes), a new browser of the same type is launched with launch_options.
+        pool_size (int): [Optional] The number of pages to scan with at the same time. Defaults to 4.
+        context_options (dict): [Optional] The options to create each browser context with (e.g. the browser_context_args fixture, which includes --base-url).
+        launch_options (dict): [Optional] The options to relaunch the browser with if it disconnects (e.g. the browser_type_launch_args fixture).
+        max_scans_per_page (int): [Optional] The number of scans after which a page is recycled. Defaults to 50.
+        max_heap_mb (float): [Optional] If provided, a page is also recycled once its JavaScript heap exceeds this size in megabytes (Chromium only).
+        scan_timeout (float): [Optional] The number of seconds allowed to navigate to and scan each URL, not including generating its reports. Defaults to 60.
+        retries (int): [Optional] The number of times to retry a URL on a fresh page after a timeout or browser error. Defaults to 1.
+
+    Example:
+        ```
+        async with async_playwright() as playwright:
+            browser = await playwright.chromium.launch()
+            axe = AsyncAxe(json_compression="gzip")
+            async with ScanRunner(axe, browser, pool_size=8, max_heap_mb=512) as runner:
+                with ConsolidatedReport(axe, "site_audit") as report:
+                    summary = await runner.run(urls, options=AXE_OPTIONS_WCAG_22AA, consolidated_report=report)
+        ```
+    """
+
+    def __init__(self,
+                 axe: AsyncAxe,
+                 browser: Browser,
+                 pool_size: int = 4,
+                 context_options: dict = None,
+                 launch_options: dict = None,
+                 max_scans_per_page: int = 50,
+                 max_heap_mb: float = None,
+                 scan_timeout: float = 60.0,
+                 retries: int = 1) -> None:
+        if pool_size < 1:
+            raise AxeAccessibilityException("pool_size must be 1 or greater.")
+        if max_scans_per_page < 1:
+            raise AxeAccessibilityException("max_scans_per_page must be 1 or greater.")
+        if retries < 0:
+            raise AxeAccessibilityException("retries must be 0 or greater.")
+
+        self.axe = axe
+        self.browser = browser
+        self.pool_size = pool_size
+        self.context_options = context_options or {}
+        self.launch_options = launch_options or {}
+        self.max_scans_per_page = max_scans_per_page
+        self.max_heap_mb = max_heap_mb
+        self.scan_timeout = scan_timeout
+        self.retries = retries
+
+        self._pool = [_PooledPage() for _ in range(pool_size)]
+        self._browser_lock = asyncio.Lock()
+        self._launched_browsers: list[Browser] = []
+        self._counts: dict[str, int] = {}
+
+    async def __aenter__(self) -> "ScanRunner":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def run(self,
+                  urls: Iterable[str],
+                  context: str | AxeContext = "",
+                  options: str | AxeOptions = "",
+                  report_on_violation_only: bool = False,
+                  html_report_generated: bool = True,
+                  json_report_generated: bool = True,
+                  result_filter: ResultFilter = None,
+                  frame_filter: FrameFilter = None,
+                  consolidated_report: "ConsolidatedReport" = None) -> dict:
+        """
+        This scans each URL provided using the pool, returning a summary of the run. See Axe.run() for details of
+        the scan arguments. Violations never raise, as a long-running audit should scan every URL. If any other
+        error is raised, the other pages in the pool are stopped and closed before it is raised.
+
+        Args:
+            urls (Iterable[str]): The URLs to scan. This can be a generator, which is read as the pool is ready for more URLs.
+            consolidated_report (ConsolidatedReport): [Optional] If provided, the results for each page are added to the consolidated report provided, in the order the scans complete.
+
+        Returns:
+            dict: The number of URLs scanned, retried and failed, the number of times pages were recycled, and the error for each URL that failed.
+
+        Example:
+            ```
+            summary = await runner.run(["/home", "/search"], result_filter=VIOLATIONS_ONLY_FILTER)
+            ```
+        """
+        scan_arguments = {
+            "context": context,
+            "options": options,
+            "report_on_violation_only": report_on_violation_only,
+            "strict_mode": False,
+            "html_report_generated": html_report_generated,
+            "json_report_generated": json_report_generated,
+            "result_filter": result_filter,
+            "frame_filter": frame_filter
+        }
+        self._counts = {"scanned": 0, "retried": 0, "failed": 0, "recycled": 0}
+        failures: dict[str, str] = {}
+        url_iterator = iter(urls)
+
+        tasks = [asyncio.create_task(self._run_pooled_page(pooled_page, url_iterator, scan_arguments,
+                                                           consolidated_report, failures))
+                 for pooled_page in self._pool]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            # The other pages would otherwise keep navigating, and may be part way through a scan
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            for pooled_page in self._pool:
+                await self._discard(pooled_page)
+            raise
+
+        logger.info(f"Scanned {self._counts['scanned']} pages ({self._counts['failed']} failed, "
+                    f"{self._counts['retried']} retried, {self._counts['recycled']} pages recycled)")
+        return {**self._counts, "failures": failures}
+
+    async def close(self) -> None:
+        """This closes the pool's browser contexts, and any browser launched to replace a disconnected one."""
+        for pooled_page in self._pool:
+            await self._discard(pooled_page)
+        for browser in self._launched_browsers:
+            await browser.close()
+        self._launched_browsers.clear()
+
+    async def _run_pooled_page(self,
+                               pooled_page: _PooledPage,
+                               url_iterator: Iterator[str],
+                               scan_arguments: dict,
+                               consolidated_report: "ConsolidatedReport",
+                               failures: dict[str, str]) -> None:
+        """This scans URLs with a single page of the pool until there are no URLs left."""
+        for url in url_iterator:
+            for attempt in range(self.retries + 1):
+                try:
+                    response = await self._scan(pooled_page, url, scan_arguments)
+                except (asyncio.TimeoutError, PlaywrightError) as e:
+                    # The page may be hung or crashed, so is never reused after an error
+                    await self._discard(pooled_page)
+                    error = f"{type(e).__name__}: {e}".strip().removesuffix(":")
+                    if attempt < self.retries:
+                        logger.warning(f"Retrying {url} after {error}")
+                        self._counts["retried"] += 1
+                        continue
+                    logger.warning(f"Failed to scan {url} after {attempt + 1} attempt(s): {error}")
+                    failures[url] = error
+                    self._counts["failed"] += 1
+                    break
+
+                self._counts["scanned"] += 1
+                if consolidated_report:
+                    self.axe._add_to_consolidated_report(consolidated_report, url, response, "", scan_arguments)
+                if await self._should_recycle(pooled_page):
+                    await self._discard(pooled_page)
+                    self._counts["recycled"] += 1
+                break
+
+    async def _scan(self, pooled_page: _PooledPage, url: str, scan_arguments: dict) -> dict:
+        """This navigates to and scans a URL within the scan timeout, opening a new page first if required."""
+        async with asyncio.timeout(self.scan_timeout):
+            if pooled_page.page is None:
+                await self._open(pooled_page)
+            pooled_page.scans += 1
+            await pooled_page.page.goto(url)
+            response, metrics = await self.axe._evaluate_page(pooled_page.page, "", scan_arguments["context"],
+                                                              scan_arguments["options"], scan_arguments["result_filter"],
+                                                              scan_arguments["frame_filter"])
+
+        # The results are recorded outside the timeout, so a scan is never retried (and its reports, snapshot and
+        # violations recorded twice) once axe-core has returned its results
+        return await self.axe._process_results(response, "", scan_arguments["report_on_violation_only"],
+                                               scan_arguments["strict_mode"], scan_arguments["html_report_generated"],
+                                               scan_arguments["json_report_generated"], metrics)
+
+    async def _open(self, pooled_page: _PooledPage) -> None:
+        """This opens a page in a new browser context, relaunching the browser first if it has disconnected."""
+        async with self._browser_lock:
+            if not self.browser.is_connected():
+                logger.warning("Browser disconnected, launching a new browser")
+                self.browser = await self.browser.browser_type.launch(**self.launch_options)
+                self._launched_browsers.append(self.browser)
+
+        pooled_page.context = await self.browser.new_context(**self.context_options)
+        pooled_page.page = await pooled_page.context.new_page()
+        pooled_page.scans = 0
+
+    async def _should_recycle(self, pooled_page: _PooledPage) -> bool:
+        """This checks whether a page has reached the scan limit or heap limit, or can no longer be used."""
+        if pooled_page.scans >= self.max_scans_per_page:
+            return True
+        if self.max_heap_mb is None:
+            return False
+        try:
+            heap_size = await pooled_page.page.evaluate(HEAP_SIZE_SCRIPT)
+        except PlaywrightError:
+            return True
+        return heap_size > self.max_heap_mb * 1024 * 1024
+
+    async def _discard(self, pooled_page: _PooledPage) -> None:
+        """This closes a page's browser context, ignoring any error as the context may already be closed or hung."""
+        context, pooled_page.context, pooled_page.page = pooled_page.context, None, None
+        if context is None:
+            return
+        try:
+            async with asyncio.timeout(CLOSE_TIMEOUT):
+                await context.close()
+        except (asyncio.TimeoutError, PlaywrightError) as e:
+            logger.debug(f"Failed to close browser context: {e}")
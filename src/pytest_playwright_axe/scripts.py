@@ -0,0 +1,180 @@
+AXE_LOADED_CHECK = "version => typeof window.axe === 'object' && window.axe !== null && window.axe.version === version"
+
+# Applied to the axe-core results in the browser, so only the data requested is
+# serialized and returned to Python. nodeCount retains the original node count of
+# each rule for reporting when nodes are dropped or capped.
+SHAPE_RESULTS_SCRIPT = """(results, resultFilter) => {
+    const stripHtml = node => {
+        node.html = "";
+        for (const check of [...(node.any || []), ...(node.all || []), ...(node.none || [])]) {
+            for (const relatedNode of check.relatedNodes || []) {
+                relatedNode.html = "";
+            }
+        }
+    };
+    const shapeRules = (rules, dropNodes) => {
+        for (const rule of rules) {
+            rule.nodeCount = rule.nodes.length;
+            if (dropNodes) {
+                rule.nodes = [];
+            } else if (resultFilter.max_nodes_per_rule !== null) {
+                rule.nodes = rule.nodes.slice(0, resultFilter.max_nodes_per_rule);
+            }
+            if (resultFilter.strip_html) {
+                rule.nodes.forEach(stripHtml);
+            }
+        }
+    };
+    shapeRules(results.violations, false);
+    shapeRules(results.incomplete, false);
+    shapeRules(results.passes, resultFilter.drop_pass_nodes);
+    if (resultFilter.drop_inapplicable) {
+        results.inapplicable = [];
+    }
+    return results;
+}"""
+
+# A cheap fingerprint of the page state that affects axe-core results: the serialized
+# DOM, the rules of any stylesheets readable from the page (cross-origin stylesheets
+# are represented by their URL) and the viewport size, hashed using cyrb53.
+DOM_FINGERPRINT_SCRIPT = """() => {
+    const cyrb53 = (text, seed = 0) => {
+        let h1 = 0xdeadbeef ^ seed, h2 = 0x41c6ce57 ^ seed;
+        for (let i = 0; i < text.length; i++) {
+            const ch = text.charCodeAt(i);
+            h1 = Math.imul(h1 ^ ch, 2654435761);
+            h2 = Math.imul(h2 ^ ch, 1597334677);
+        }
+        h1 = Math.imul(h1 ^ (h1 >>> 16), 2246822507) ^ Math.imul(h2 ^ (h2 >>> 13), 3266489909);
+        h2 = Math.imul(h2 ^ (h2 >>> 16), 2246822507) ^ Math.imul(h1 ^ (h1 >>> 13), 3266489909);
+        return (4294967296 * (2097151 & h2) + (h1 >>> 0)).toString(16);
+    };
+    const styles = [];
+    for (const sheet of document.styleSheets) {
+        try {
+            for (const rule of sheet.cssRules) {
+                styles.push(rule.cssText);
+            }
+        } catch (e) {
+            styles.push(sheet.href || "");
+        }
+    }
+    const state = [document.documentElement.outerHTML, styles.join("\\n"), window.innerWidth, window.innerHeight].join("\\u0000");
+    return cyrb53(state) + "-" + cyrb53(state, 1) + "-" + state.length;
+}"""
+
+# Summarizes the structure of the page as the set of distinct element paths (e.g. html>body>main>ul>li), so pages built
+# from the same template have the same signature regardless of their text or the number of repeated elements.
+DOM_SIGNATURE_SCRIPT = """() => {
+    const paths = new Set();
+    const walk = (element, path) => {
+        const elementPath = path + ">" + element.localName;
+        paths.add(elementPath);
+        for (const child of element.children) {
+            walk(child, elementPath);
+        }
+    };
+    walk(document.documentElement, "");
+    return Array.from(paths).sort().join("\\n");
+}"""
+
+# Records the elements changed while pre-scan actions are completed, so a scan can
+# be scoped to the regions of the page that changed.
+MUTATION_RECORDER_SCRIPT = """() => {
+    if (window.__axeMutationObserver) {
+        window.__axeMutationObserver.disconnect();
+    }
+    const changedNodes = new Set();
+    const record = records => {
+        for (const mutation of records) {
+            changedNodes.add(mutation.target);
+            mutation.addedNodes.forEach(node => changedNodes.add(node));
+        }
+    };
+    const observer = new MutationObserver(record);
+    observer.observe(document.documentElement, {subtree: true, childList: true, attributes: true, characterData: true});
+    window.__axeMutationObserver = observer;
+    window.__axeRecordMutations = record;
+    window.__axeChangedNodes = changedNodes;
+}"""
+
+# Stops recording and reduces the changed elements to the outermost changed regions,
+# stored in window.__axeChangedRegions. Returns the number of regions, or null if the
+# whole page should be scanned (no recording, or the html, head or body element changed).
+CHANGED_REGIONS_SCRIPT = """() => {
+    const observer = window.__axeMutationObserver;
+    if (!observer) {
+        return null;
+    }
+    window.__axeRecordMutations(observer.takeRecords());
+    observer.disconnect();
+    const elements = new Set();
+    for (const node of window.__axeChangedNodes) {
+        const element = node.nodeType === Node.ELEMENT_NODE ? node : node.parentElement;
+        if (element && element.isConnected) {
+            elements.add(element);
+        }
+    }
+    delete window.__axeMutationObserver;
+    delete window.__axeRecordMutations;
+    delete window.__axeChangedNodes;
+    const regions = [...elements].filter(element => {
+        for (let parent = element.parentElement; parent; parent = parent.parentElement) {
+            if (elements.has(parent)) {
+                return false;
+            }
+        }
+        return true;
+    });
+    if (regions.some(element => [document.documentElement, document.head, document.body].includes(element))) {
+        return null;
+    }
+    window.__axeChangedRegions = regions;
+    return regions.length;
+}"""
+CHANGED_REGIONS_CONTEXT = "{include: window.__axeChangedRegions}"
+
+# Returns whether each node target provided is now within a changed region (or no
+# longer on the page), so its result is replaced by the scoped scan.
+NODES_IN_CHANGED_REGIONS_SCRIPT = """targets => targets.map(target => {
+    if (target === null) {
+        return false;
+    }
+    let element = null;
+    try {
+        element = document.querySelector(target);
+    } catch (e) {
+        return false;
+    }
+    return element === null || window.__axeChangedRegions.some(region => region.contains(element));
+})"""
+
+# Runs axe-core using the context, options and result filter passed in as arguments,
+# so the same expression is evaluated for every scan.
+AXE_RUN_SCRIPT = """([context, options, resultFilter]) =>
+    (context ? axe.run(context, options || {}) : axe.run(options || {}))
+        .then(results => resultFilter ? (""" + SHAPE_RESULTS_SCRIPT + """)(results, resultFilter) : results)"""
+
+# Wraps AXE_RUN_SCRIPT when collecting metrics, so the time spent running axe-core in the page can be separated from
+# the time spent transferring the results back. Built str commands are wrapped using TIMED_AXE_COMMAND instead.
+TIMED_AXE_RUN_SCRIPT = """async argument => {
+    const start = performance.now();
+    const results = await (""" + AXE_RUN_SCRIPT + """)(argument);
+    return {results, runMs: performance.now() - start};
+}"""
+TIMED_AXE_COMMAND = """(async () => {{
+    const start = performance.now();
+    const results = await {command};
+    return {{results, runMs: performance.now() - start}};
+}})()"""
+
+# Used when scanning child frames, to check a frame element against FrameFilter.exclude_selectors, and to build the
+# selector used to exclude a frame from the scan (run in the parent frame, which always has axe-core injected).
+FRAME_MATCHES_SCRIPT = "(element, selectors) => selectors.some(selector => element.matches(selector))"
+FRAME_SELECTOR_SCRIPT = """element => {
+    const selector = axe.utils.getAncestry(element);
+    return Array.isArray(selector) ? {fromShadowDom: selector} : selector;
+}"""
+
+# Used when crawling, to find the links on the page scanned (resolved to absolute URLs by the browser).
+LINKS_SCRIPT = "() => Array.from(document.querySelectorAll('a[href], area[href]'), link => link.href)"
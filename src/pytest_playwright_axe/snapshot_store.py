@@ -0,0 +1,186 @@
+import json
+import logging
+import sqlite3
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+from .axe import JSON_COMPRESSION_EXTENSIONS, JSON_READ_ERRORS, node_fingerprint, open_json_file
+from .exceptions import AxeAccessibilityException
+
+logger = logging.getLogger(__name__)
+
+BASELINE_RUN = "baseline"
+CURRENT_RUN = "current"
+# The number of seconds to wait for another process (e.g. a pytest-xdist worker) writing to the same file
+BUSY_TIMEOUT = 30.0
+
+
+def summarize_results(data: dict) -> dict:
+    """
+    This reduces axe-core results to the data needed for snapshot comparisons: the URL, timestamp and
+    violations, with each violation node reduced to its target, impact and fingerprint.
+
+    Args:
+        data (dict): The axe-core results to summarize.
+
+    Returns:
+        dict: The summarized results, which can be passed to Axe.diff_results() in place of the full results.
+    """
+    violations = []
+    for violation in data["violations"]:
+        nodes = violation["nodes"]
+        violations.append({
+            "id": violation["id"],
+            "description": violation["description"],
+            "impact": violation["impact"],
+            "tags": violation["tags"],
+            "nodeCount": violation.get("nodeCount", len(nodes)),
+            "nodes": [{"target": node.get("target", []),
+                       "impact": node.get("impact"),
+                       "fingerprint": node_fingerprint(violation["id"], node)}
+                      for node in nodes if isinstance(node, dict)]
+        })
+
+    return {"url": data["url"], "timestamp": data["timestamp"], "violations": violations}
+
+
+class SnapshotStore:
+    """
+    This stores snapshots of axe-core results in a single SQLite file, for comparison against future scans.
+    Only a summary of the violations for each page is stored (see summarize_results()), keyed by the report
+    filename, so lookups do not need to parse full JSON reports.
+
+    Results from the current run are stored separately to the baseline they are compared against, and can be
+    promoted to become the new baseline once the run is complete. The file is opened in WAL mode, so several
+    processes (e.g. pytest-xdist workers) can share it, waiting for each other's writes to complete.
+
+    Args:
+        path (str | pathlib.Path): The path of the SQLite file to use. Created if it does not exist.
+
+    Example:
+        ```
+        with SnapshotStore("snapshots.db") as store:
+            store.import_json_directory("snapshots")
+            axe = Axe(snapshot_store=store)
+            axe.run(page)
+            store.promote()
+        ```
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        with self._connection:
+            self._connection.execute("""CREATE TABLE IF NOT EXISTS snapshots (
+                run TEXT NOT NULL,
+                key TEXT NOT NULL,
+                summary TEXT NOT NULL,
+                PRIMARY KEY (run, key)
+            ) WITHOUT ROWID""")
+
+    def __enter__(self) -> "SnapshotStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def get(self, key: str, run: str = BASELINE_RUN) -> dict | None:
+        """
+        This returns the stored summary for a page.
+
+        Args:
+            key (str): The report filename for the page, without an extension.
+            run (str): [Optional] The run to return the summary from, either "baseline" (default) or "current".
+
+        Returns:
+            dict | None: The summary stored for the page, or None if there is no summary stored.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT summary FROM snapshots WHERE run = ? AND key = ?", (run, key)).fetchone()
+
+        return json.loads(row[0]) if row else None
+
+    def put(self, key: str, data: dict, run: str = CURRENT_RUN) -> None:
+        """
+        This stores a summary of the axe-core results for a page, replacing any summary already stored.
+
+        Args:
+            key (str): The report filename for the page, without an extension.
+            data (dict): The axe-core results for the page.
+            run (str): [Optional] The run to store the summary in, either "current" (default) or "baseline".
+        """
+        self._check_run(run)
+        summary = json.dumps(summarize_results(data), separators=(",", ":"))
+        with self._lock, self._connection:
+            self._connection.execute("INSERT OR REPLACE INTO snapshots VALUES (?, ?, ?)", (run, key, summary))
+
+    def keys(self, run: str = BASELINE_RUN) -> list[str]:
+        """This returns the keys of all pages stored for the run provided, in key order."""
+        with self._lock:
+            return [row[0] for row in self._connection.execute(
+                "SELECT key FROM snapshots WHERE run = ? ORDER BY key", (run,))]
+
+    def import_json_directory(self, directory: str | Path, run: str = BASELINE_RUN) -> int:
+        """
+        This imports existing JSON snapshots (including .json.gz and .json.zst files) from a directory, keyed by
+        their filename. Files that cannot be parsed are logged and skipped.
+
+        Args:
+            directory (str | pathlib.Path): The directory containing the JSON snapshots.
+            run (str): [Optional] The run to import the snapshots into, either "baseline" (default) or "current".
+
+        Returns:
+            int: The number of snapshots imported.
+        """
+        self._check_run(run)
+        rows = list(self._iter_json_directory(Path(directory), run))
+        with self._lock, self._connection:
+            self._connection.executemany("INSERT OR REPLACE INTO snapshots VALUES (?, ?, ?)", rows)
+
+        logger.info(f"Imported {len(rows)} snapshot(s) from {directory}")
+        return len(rows)
+
+    def promote(self) -> int:
+        """
+        This makes the summaries stored for the current run the new baseline, replacing the baseline for any
+        page in the current run. Pages not scanned in the current run keep their existing baseline.
+
+        Returns:
+            int: The number of pages promoted.
+        """
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO snapshots SELECT ?, key, summary FROM snapshots WHERE run = ?",
+                (BASELINE_RUN, CURRENT_RUN))
+            promoted = self._connection.execute("DELETE FROM snapshots WHERE run = ?", (CURRENT_RUN,)).rowcount
+
+        logger.info(f"Promoted {promoted} snapshot(s) to baseline")
+        return promoted
+
+    def close(self) -> None:
+        """This closes the SQLite file."""
+        with self._lock:
+            self._connection.close()
+
+    def _check_run(self, run: str) -> None:
+        """This checks the run provided is a valid run."""
+        if run not in (BASELINE_RUN, CURRENT_RUN):
+            raise AxeAccessibilityException(f"Snapshot run provided [{run}] is not valid.")
+
+    def _iter_json_directory(self, directory: Path, run: str) -> Iterator[tuple[str, str, str]]:
+        """This yields the rows to insert for each JSON snapshot in the directory provided."""
+        for extension in JSON_COMPRESSION_EXTENSIONS.values():
+            suffix = f".json{extension}"
+            for snapshot_path in sorted(directory.glob(f"*{suffix}")):
+                try:
+                    with open_json_file(snapshot_path) as file:
+                        summary = summarize_results(json.load(file))
+                except (KeyError, TypeError) + JSON_READ_ERRORS as e:
+                    logger.warning(f"Failed to import snapshot file {snapshot_path}: {e}")
+                    continue
+
+                yield run, snapshot_path.name.removesuffix(suffix), json.dumps(summary, separators=(",", ":"))
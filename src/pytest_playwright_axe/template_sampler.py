@@ -0,0 +1,83 @@
+import hashlib
+import threading
+from fnmatch import fnmatchcase
+from urllib.parse import parse_qsl, urlsplit, urlunsplit
+from .exceptions import AxeAccessibilityException
+
+
+class TemplateSampler:
+    """
+    This samples the pages scanned by run_list(), for sites with many pages built from the same template (e.g.
+    thousands of /product/<id> pages). Pages are grouped by template, and only the first samples_per_group pages
+    of each group are scanned. The other pages are recorded against their group, so a ConsolidatedReport can
+    attribute the results of the pages scanned to the whole group. Only str entries in the page list are sampled.
+
+    Pages are grouped by URL by default, so pages that are not scanned are never loaded. URLs matching one of the
+    url_patterns provided are grouped by the pattern, and other URLs by their template: the URL with each path
+    segment containing a digit replaced by "{id}", and the query parameter values removed (e.g. /product/1234?page=2
+    becomes /product/{id}?page=). If group_by_dom is set, pages are instead grouped by a signature of their DOM
+    structure computed in the page, which needs each page to be loaded but groups pages whose URLs do not follow a pattern.
+
+    The sampler can be shared between run_list() calls, so a template scanned in one call is not scanned again.
+
+    Args:
+        samples_per_group (int): [Optional] The number of pages to scan from each group. Defaults to 3.
+        url_patterns (tuple[str, ...]): [Optional] If provided, glob patterns (e.g. "*/product/*") grouping the URLs matching each pattern together.
+        group_by_dom (bool): [Optional] If true, group pages by their DOM structure instead of their URL. If false (default), group pages by URL.
+
+    Example:
+        ```
+        sampler = TemplateSampler(samples_per_group=2, url_patterns=("*/category/*",))
+        with ConsolidatedReport(axe, "catalogue") as report:
+            axe.run_list(page, product_urls, sampler=sampler, consolidated_report=report)
+        print(sampler.stats())
+        ```
+    """
+
+    def __init__(self, samples_per_group: int = 3, url_patterns: tuple[str, ...] = (), group_by_dom: bool = False) -> None:
+        if samples_per_group < 1:
+            raise AxeAccessibilityException("samples_per_group must be 1 or greater.")
+
+        self.samples_per_group = samples_per_group
+        self.url_patterns = (url_patterns,) if isinstance(url_patterns, str) else tuple(url_patterns)
+        self.group_by_dom = group_by_dom
+        self._lock = threading.Lock()
+        self.groups: dict[str, dict[str, list[str]]] = {}
+        self._page_groups: dict[str, str] = {}
+
+    def url_group(self, url: str) -> str:
+        """This returns the group of a URL, as the first URL pattern it matches or its URL template."""
+        for pattern in self.url_patterns:
+            if fnmatchcase(url, pattern):
+                return pattern
+
+        parts = urlsplit(url)
+        path = "/".join("{id}" if any(character.isdigit() for character in segment) else segment
+                        for segment in parts.path.split("/"))
+        query = "&".join(f"{name}=" for name, _ in parse_qsl(parts.query, keep_blank_values=True))
+        return urlunsplit((parts.scheme, parts.netloc, path, query, ""))
+
+    def dom_group(self, signature: str) -> str:
+        """This returns the group for the DOM signature of a page."""
+        return f"dom-{hashlib.sha256(signature.encode('utf-8')).hexdigest()[:12]}"
+
+    def claim(self, results_key: str, group: str) -> bool:
+        """This records a page against its group, returning True if it should be scanned as one of the group's samples."""
+        with self._lock:
+            members = self.groups.setdefault(group, {"scanned": [], "skipped": []})
+            self._page_groups[results_key] = group
+            scanned = len(members["scanned"]) < self.samples_per_group
+            members["scanned" if scanned else "skipped"].append(results_key)
+            return scanned
+
+    def group_of(self, results_key: str) -> str:
+        """This returns the group a page was recorded against, or an empty str if it was not sampled."""
+        with self._lock:
+            return self._page_groups.get(results_key, "")
+
+    def stats(self) -> dict:
+        """This returns the number of groups found, and the number of pages scanned and skipped."""
+        with self._lock:
+            return {"groups": len(self.groups),
+                    "scanned": sum(len(members["scanned"]) for members in self.groups.values()),
+                    "skipped": sum(len(members["skipped"]) for members in self.groups.values())}
@@ -0,0 +1,185 @@
+import json
+import logging
+import threading
+from dataclasses import dataclass, field
+from html import escape
+from .axe import AxeBase, JSON_COMPRESSION_EXTENSIONS, format_node_target, node_fingerprint, open_json_file
+from .exceptions import AxeAccessibilityException
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class _SharedViolation:
+    """A compact summary of a violating node, counting the pages it was found on."""
+    rule_id: str
+    target: str
+    html: str
+    impact: str | None
+    pages: int = 0
+    occurrences: int = 0
+    sample_pages: list[str] = field(default_factory=list)
+    last_page: int = -1
+
+
+class ViolationAggregator:
+    """
+    This aggregates violations across every page scanned, so issues from shared components (e.g. a header,
+    footer or cookie banner) can be reported once with the number of pages they affect, rather than on every
+    page report. Each violating node is indexed by its rule ID, target selector and a hash of its HTML (see
+    node_fingerprint()), keeping only a compact summary with the number of pages affected and a few example pages.
+
+    Memory use is bounded by max_entries. If more distinct nodes are found, the nodes found on the fewest pages
+    are dropped (and counted in stats()), so the most widely shared issues are kept.
+
+    Args:
+        max_entries (int): [Optional] The maximum number of distinct violating nodes to keep. Defaults to 10000.
+        max_sample_pages (int): [Optional] The number of example page URLs to keep for each node. Defaults to 5.
+        max_html_length (int): [Optional] The number of characters of each node's HTML to keep. Defaults to 300.
+
+    Example:
+        ```
+        aggregator = ViolationAggregator()
+        axe = Axe(violation_aggregator=aggregator)
+        axe.run_list(page, ["/home", "/search", "/about"])
+        aggregator.write_reports(axe)
+        ```
+    """
+
+    def __init__(self, max_entries: int = 10000, max_sample_pages: int = 5, max_html_length: int = 300) -> None:
+        if max_entries < 1:
+            raise AxeAccessibilityException("max_entries must be 1 or greater.")
+
+        self.max_entries = max_entries
+        self.max_sample_pages = max_sample_pages
+        self.max_html_length = max_html_length
+        self._lock = threading.Lock()
+        self._entries: dict[str, _SharedViolation] = {}
+        self._rules: dict[str, dict] = {}
+        self.page_count = 0
+        self.pruned = 0
+
+    def add(self, data: dict) -> None:
+        """
+        This adds the violations from a page's axe-core results to the index. This is called for each page scanned
+        by an Axe instance given this aggregator, and can also be called directly (e.g. with results loaded from JSON).
+
+        Args:
+            data (dict): The axe-core results for a page.
+        """
+        with self._lock:
+            page_number = self.page_count
+            self.page_count += 1
+
+            for violation in data["violations"]:
+                self._rules.setdefault(violation["id"], {
+                    "description": violation["description"],
+                    "help_url": violation["helpUrl"],
+                    "tags": violation["tags"]
+                })
+                for node in violation["nodes"]:
+                    self._add_node(violation, node, data["url"], page_number)
+
+            if len(self._entries) > self.max_entries:
+                self._prune()
+
+    def top(self, limit: int = 20, min_pages: int = 2) -> list[dict]:
+        """
+        This returns the violating nodes found on the most pages, including the details of their rule.
+
+        Args:
+            limit (int): [Optional] The maximum number of nodes to return. Defaults to 20.
+            min_pages (int): [Optional] The minimum number of pages a node must be found on to be included. Defaults to 2.
+
+        Returns:
+            list[dict]: The nodes, with the number of pages and occurrences, and example page URLs, most shared first.
+        """
+        with self._lock:
+            entries = sorted((entry for entry in self._entries.values() if entry.pages >= min_pages),
+                             key=lambda entry: (-entry.pages, -entry.occurrences))[:limit]
+            return [{
+                "rule_id": entry.rule_id,
+                **self._rules[entry.rule_id],
+                "impact": entry.impact,
+                "target": entry.target,
+                "html": entry.html,
+                "pages": entry.pages,
+                "occurrences": entry.occurrences,
+                "sample_pages": list(entry.sample_pages)
+            } for entry in entries]
+
+    def stats(self) -> dict:
+        """This returns the number of pages added, distinct violating nodes kept and nodes dropped to stay within max_entries."""
+        with self._lock:
+            return {"pages": self.page_count, "entries": len(self._entries), "pruned": self.pruned}
+
+    def write_reports(self, axe: AxeBase, filename: str = "shared_violations", limit: int = 50, min_pages: int = 2) -> None:
+        """
+        This writes the top shared issues as a JSON report and a HTML report, using the output directory, CSS and
+        JSON settings of the Axe instance provided.
+
+        Args:
+            axe (Axe | AsyncAxe): The Axe or AsyncAxe instance to use for the output directory, CSS styling and JSON compression.
+            filename (str): [Optional] The filename to use for the reports, without an extension. Defaults to "shared_violations".
+            limit (int): [Optional] The maximum number of nodes to include. Defaults to 50.
+            min_pages (int): [Optional] The minimum number of pages a node must be found on to be included. Defaults to 2.
+        """
+        issues = self.top(limit, min_pages)
+        stats = self.stats()
+
+        json_path = axe._create_path_for_report(f"{filename}.json{JSON_COMPRESSION_EXTENSIONS[axe.json_compression]}")
+        with open_json_file(json_path, "w") as file:
+            json.dump({**stats, "issues": issues}, file,
+                      **({"separators": (",", ":")} if axe.json_compact else {"indent": 4}))
+        logger.info(f"Shared violations JSON report generated: {json_path}")
+
+        html_path = axe._create_path_for_report(f"{filename}.html")
+        with open(html_path, "w", encoding="utf-8") as file:
+            file.write(f'<!DOCTYPE html><html lang="en"><head>{axe._css_styling()}'
+                       '<title>Axe Accessibility Shared Issues</title></head><body>')
+            file.write('<header role="banner"><h1>Axe Accessibility Shared Issues</h1>'
+                       f'<p>This lists the {len(issues)} violating element(s) found on the most pages, out of '
+                       f'{stats["pages"]} page(s) scanned.</p></header><main role="main">')
+            file.write(f"<h2>Top Shared Issues</h2><table><tr>{axe._generate_table_header([
+                ("#", "2", True), ("Description", "28", False), ("Axe Rule ID", "12", False),
+                ("Impact", "8", False), ("Element", "30", False), ("Pages", "8", True), ("Example Pages", "12", False)
+            ])}")
+            for issue_number, issue in enumerate(issues, start=1):
+                page_share = issue["pages"] / stats["pages"] * 100 if stats["pages"] else 0
+                file.write(f'''<tr>
+                    <td style="text-align: center;">{issue_number}</td>
+                    <td>{escape(issue['description'])}<br />{axe._wcag_tagging(issue['tags'])}</td>
+                    <td><a href="{issue['help_url']}" target="_blank">{issue['rule_id']}</a></td>
+                    <td>{issue['impact']}</td>
+                    <td><pre><code>{escape(issue['target'])}</code></pre><pre><code>{escape(issue['html'])}</code></pre></td>
+                    <td style="text-align: center;">{issue['pages']} ({page_share:.0f}%)</td>
+                    <td>{"<br />".join(escape(url) for url in issue['sample_pages'])}</td>
+                    </tr>''')
+            file.write("</table></main></body></html>")
+        logger.info(f"Shared violations HTML report generated: {html_path}")
+
+    def _add_node(self, violation: dict, node: dict, url: str, page_number: int) -> None:
+        """This counts a violating node against its entry in the index, creating the entry if required."""
+        key = node_fingerprint(violation["id"], node)
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._entries[key] = _SharedViolation(
+                rule_id=violation["id"],
+                target=format_node_target(node.get("target", [])),
+                html=node.get("html", "")[:self.max_html_length],
+                impact=node.get("impact", violation["impact"]))
+
+        entry.occurrences += 1
+        if entry.last_page != page_number:
+            entry.last_page = page_number
+            entry.pages += 1
+            if len(entry.sample_pages) < self.max_sample_pages:
+                entry.sample_pages.append(url)
+
+    def _prune(self) -> None:
+        """This drops the entries found on the fewest pages (oldest first), down to three quarters of max_entries."""
+        keep = max(1, self.max_entries * 3 // 4)
+        ranked = sorted(self._entries.items(), key=lambda item: (-item[1].pages, -item[1].last_page))
+        for key, _ in ranked[keep:]:
+            del self._entries[key]
+        self.pruned += len(ranked) - keep
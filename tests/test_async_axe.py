@@ -0,0 +1,209 @@
+import asyncio
+import pytest
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from src.pytest_playwright_axe import AsyncAxe, Axe, AxeAccessibilityException, CrawlFrontier, FrameFilter, TemplateSampler, ScanCache, load_axe_script
+from src.pytest_playwright_axe.axe import AXE_PATH
+from src.pytest_playwright_axe.scripts import AXE_LOADED_CHECK, AXE_RUN_SCRIPT, CHANGED_REGIONS_SCRIPT, DOM_FINGERPRINT_SCRIPT, FRAME_SELECTOR_SCRIPT, LINKS_SCRIPT, TIMED_AXE_RUN_SCRIPT
+from playwright.async_api import Locator
+
+
+def is_axe_run(expression: str) -> bool:
+    """Whether the expression evaluated runs axe-core, using either AXE_RUN_SCRIPT or a built str command."""
+    return expression == AXE_RUN_SCRIPT or expression.startswith("axe.run(")
+
+
+class FakeAsyncContext:
+    """A stand-in for a Playwright async BrowserContext, opening fake pages."""
+    def __init__(self) -> None:
+        self.pages = []
+
+    async def new_page(self) -> "FakeAsyncPage":
+        new_page = FakeAsyncPage(self)
+        self.pages.append(new_page)
+        return new_page
+
+
+class FakeAsyncPage:
+    """A stand-in for a Playwright async Page, returning an empty axe-core result for the current URL."""
+    def __init__(self, context: FakeAsyncContext = None) -> None:
+        self.context = context or FakeAsyncContext()
+        self.url = ""
+        self.axe_loaded = False
+        self.evaluated = []
+        self.closed = False
+
+    async def goto(self, url: str) -> None:
+        await asyncio.sleep(0)
+        self.url = url
+        self.axe_loaded = False
+
+    async def evaluate(self, expression: str, arg=None):
+        if expression == LINKS_SCRIPT:
+            return [f"{self.url.rstrip('/')}/{number}" for number in range(3)] if self.url.count("/") < 5 else []
+        if expression == TIMED_AXE_RUN_SCRIPT:
+            return {"results": await self.evaluate(AXE_RUN_SCRIPT, arg), "runMs": 5.0}
+        self.evaluated.append(expression)
+        if expression == AXE_LOADED_CHECK:
+            return self.axe_loaded
+        if expression == DOM_FINGERPRINT_SCRIPT:
+            return "dom"
+        if is_axe_run(expression):
+            return {"url": self.url, "timestamp": "2024-11-04T16:14:57.934Z", "passes": [], "violations": [], "inapplicable": [], "incomplete": []}
+        self.axe_loaded = True
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class FakeAsyncFrame:
+    """A stand-in for a Playwright async Frame, recording whether axe-core has been injected."""
+    def __init__(self, url: str, selector: str = "", parent_frame: "FakeAsyncFrame" = None) -> None:
+        self.url = url
+        self.selector = selector
+        self.parent_frame = parent_frame
+        self.child_frames = []
+        self.axe_loaded = False
+        if parent_frame:
+            parent_frame.child_frames.append(self)
+
+    async def frame_element(self) -> "FakeAsyncFrame":
+        return self
+
+    async def evaluate(self, expression: str, arg=None):
+        await asyncio.sleep(0)
+        if expression == AXE_LOADED_CHECK:
+            return self.axe_loaded
+        if expression == FRAME_SELECTOR_SCRIPT:
+            return self.selector
+        self.axe_loaded = True
+
+
+def run_async(coroutine):
+    """Run a coroutine in its own thread, as the sync Playwright fixtures hold the main thread's event loop."""
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coroutine).result()
+
+
+def test_async_inject_axe_only_when_not_loaded() -> None:
+    page = FakeAsyncPage()
+    axe = AsyncAxe()
+    assert run_async(axe._inject_axe(page)) is True
+    assert run_async(axe._inject_axe(page)) is False
+    assert page.evaluated.count(load_axe_script(AXE_PATH)) == 1
+
+
+def test_async_run_list_concurrent_keeps_order() -> None:
+    page = FakeAsyncPage()
+    page_list = [f"https://www.test.com/{number}" for number in range(5)]
+
+    results = run_async(AsyncAxe().run_list(page, page_list, concurrency=3,
+                                              html_report_generated=False, json_report_generated=False))
+
+    assert list(results) == page_list
+    assert [result["url"] for result in results.values()] == page_list
+    assert len(page.context.pages) == 5
+    assert all(new_page.closed for new_page in page.context.pages)
+
+
+def test_async_run_scan_cache() -> None:
+    page = FakeAsyncPage()
+    page.url = "https://www.test.com"
+    cache = ScanCache()
+    axe = AsyncAxe(scan_cache=cache)
+
+    run_async(axe.run(page, html_report_generated=False, json_report_generated=False))
+    run_async(axe.run(page, html_report_generated=False, json_report_generated=False))
+
+    assert cache.stats()["hits"] == 1
+    assert len([expression for expression in page.evaluated if is_axe_run(expression)]) == 1
+
+
+def test_async_run_writes_reports_off_event_loop(monkeypatch) -> None:
+    page = FakeAsyncPage()
+    page.url = "https://www.test.com"
+    threads = {}
+    axe = AsyncAxe(result_callback=lambda results: threads.setdefault("event_loop", threading.current_thread()))
+    monkeypatch.setattr(axe, "_create_json_report",
+                        lambda data, filename: threads.setdefault("report", threading.current_thread()))
+
+    run_async(axe.run(page, html_report_generated=False))
+
+    assert threads["report"] is not threads["event_loop"]
+    assert not isinstance(axe, Axe)
+
+
+def test_async_run_metrics_callback() -> None:
+    page = FakeAsyncPage()
+    page.url = "https://www.test.com"
+    collected = []
+    axe = AsyncAxe(metrics_callback=collected.append)
+
+    run_async(axe.run(page, html_report_generated=False, json_report_generated=False))
+
+    assert axe.last_metrics is collected[0]
+    assert list(collected[0].phases) == ["inject_ms", "axe_run_ms", "transfer_ms"]
+    assert collected[0].phases["axe_run_ms"] == 5.0
+    assert collected[0].payload_bytes > 0
+
+
+def test_async_run_frame_filter() -> None:
+    page = FakeAsyncPage()
+    page.url = "https://www.test.com"
+    page.main_frame = FakeAsyncFrame(page.url)
+    widget = FakeAsyncFrame("https://www.test.com/widget", "iframe#widget", page.main_frame)
+    nested = FakeAsyncFrame("https://www.test.com/nested", "iframe#nested", widget)
+    advert = FakeAsyncFrame("https://ads.test.com/banner", "iframe#advert", page.main_frame)
+
+    excluded = run_async(AsyncAxe()._inject_axe_into_frames(page, FrameFilter(exclude_urls=("https://ads.*",))))
+
+    assert widget.axe_loaded and nested.axe_loaded and not advert.axe_loaded
+    assert excluded == ["iframe#advert"]
+
+
+def test_async_run_list_invalid_concurrency() -> None:
+    with pytest.raises(AxeAccessibilityException):
+        run_async(AsyncAxe().run_list(FakeAsyncPage(), ["https://www.test.com/1"], concurrency=0))
+
+
+def test_async_run_list_scope_to_changes_concurrent(monkeypatch) -> None:
+    async def click(self) -> None:
+        pass
+
+    monkeypatch.setattr(Locator, "click", click)
+    page = FakeAsyncPage()
+    page_list = [{"url": "https://www.test.com/1", "action": "click", "locator": Locator.__new__(Locator)},
+                 "https://www.test.com/1", "https://www.test.com/2"]
+
+    results = run_async(AsyncAxe().run_list(page, page_list, concurrency=2, scope_to_changes=True,
+                                              html_report_generated=False, json_report_generated=False))
+
+    assert list(results) == ["https://www.test.com/1_click", "https://www.test.com/1", "https://www.test.com/2"]
+    # The base scan of the url is available, so the changed regions are checked
+    assert CHANGED_REGIONS_SCRIPT in page.evaluated
+
+
+def test_async_crawl_concurrent() -> None:
+    page = FakeAsyncPage()
+    frontier = CrawlFrontier(["https://www.test.com/"], max_pages=10)
+
+    results = run_async(AsyncAxe().crawl(page, frontier, concurrency=3,
+                                           html_report_generated=False, json_report_generated=False))
+
+    assert len(results) == 10
+    assert list(results)[0] == "https://www.test.com/"
+    assert frontier.stats()["scanned"] == 10
+    assert all(new_page.closed for new_page in page.context.pages)
+
+
+def test_async_run_list_sampler_concurrent() -> None:
+    page = FakeAsyncPage()
+    page_list = [f"https://www.test.com/product/{number}" for number in range(6)]
+    sampler = TemplateSampler(samples_per_group=2)
+
+    results = run_async(AsyncAxe().run_list(page, page_list, concurrency=3, sampler=sampler,
+                                              html_report_generated=False, json_report_generated=False))
+
+    assert list(results) == page_list[:2]
+    # No page is opened for the pages skipped
+    assert len(page.context.pages) == 2
@@ -1,10 +1,23 @@
+import gzip
 import json
 import pytest
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from src.pytest_playwright_axe import Axe, AxeAccessibilityException
-from src.pytest_playwright_axe.axe import DEFAULT_CSS_PATH
-from playwright.sync_api import Locator
+from src.pytest_playwright_axe import (ALL_FRAMES, AXE_OPTIONS_WCAG_22AA, AXE_OPTIONS_WCAG_22AA_VIOLATIONS, OPTIONS_WCAG_22AA,
+                                       VIOLATIONS_ONLY_FILTER, Axe,
+                                       AxeAccessibilityException, AxeContext, AxeOptions, ConsolidatedReport, CrawlFrontier,
+                                       FrameFilter, ReportWriter, ResultFilter, ScanCache, ScanMetrics, TemplateSampler,
+                                       invalidate_axe_script_cache, load_axe_script, normalize_url, preload_axe_script)
+from src.pytest_playwright_axe.axe import (AXE_PATH, DEFAULT_CSS_PATH, MIN_AXE_PATH, _AXE_SCRIPT_CACHE, _RESOLVED_OPTIONS_CACHE,
+                                           _report_style, _wcag_labels, format_node_target, get_axe_version, metrics_logger,
+                                           node_fingerprint)
+from src.pytest_playwright_axe.scripts import (AXE_LOADED_CHECK, AXE_RUN_SCRIPT, CHANGED_REGIONS_CONTEXT, CHANGED_REGIONS_SCRIPT,
+                                               DOM_FINGERPRINT_SCRIPT, DOM_SIGNATURE_SCRIPT, FRAME_MATCHES_SCRIPT, FRAME_SELECTOR_SCRIPT,
+                                               LINKS_SCRIPT, NODES_IN_CHANGED_REGIONS_SCRIPT, TIMED_AXE_COMMAND, TIMED_AXE_RUN_SCRIPT)
+from src.pytest_playwright_axe.snapshot_store import summarize_results
+from playwright.sync_api import Locator, Error as PlaywrightError
 
 
 AXE_REPORTS_DIR = Path(__file__).parent.parent / "axe-reports"
@@ -26,6 +39,214 @@ def patch_locator(monkeypatch):
     monkeypatch.setattr(Locator, "text_content", lambda self: "mocked text")
 
 
+def is_axe_run(expression: str) -> bool:
+    """Whether the expression evaluated runs axe-core, using either AXE_RUN_SCRIPT or a built str command."""
+    return expression == AXE_RUN_SCRIPT or expression.startswith("axe.run(")
+
+
+def untimed_expression(expression: str) -> str | None:
+    """The expression wrapped by TIMED_AXE_RUN_SCRIPT or TIMED_AXE_COMMAND, or None if the expression is not timed."""
+    if expression == TIMED_AXE_RUN_SCRIPT:
+        return AXE_RUN_SCRIPT
+    prefix, suffix = TIMED_AXE_COMMAND.format(command="|").split("|")
+    if expression.startswith(prefix) and expression.endswith(suffix):
+        return expression[len(prefix):-len(suffix)]
+    return None
+
+
+STORAGE_STATE = {"cookies": [{"name": "session", "value": "signed-in"}], "origins": []}
+
+
+class FakeContext:
+    """A stand-in for a Playwright BrowserContext, recording init scripts registered."""
+    def __init__(self) -> None:
+        self.init_scripts = []
+        self.browser = None
+
+    def add_init_script(self, script: str = None, path: str = None) -> None:
+        self.init_scripts.append(script)
+
+    def storage_state(self) -> dict:
+        return STORAGE_STATE
+
+
+class FakePlaywright:
+    """A stand-in for sync_playwright() in worker threads, recording the options each worker context is created with."""
+    def __init__(self) -> None:
+        self.context_options = []
+
+    def __call__(self) -> "FakePlaywright":
+        return self
+
+    def __enter__(self) -> "FakePlaywright":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        pass
+
+    def __getitem__(self, browser_name: str) -> "FakePlaywright":
+        return self
+
+    def launch(self, **launch_options) -> "FakePlaywright":
+        return self
+
+    def new_context(self, **context_options) -> "FakePlaywright":
+        self.context_options.append(context_options)
+        return self
+
+    def new_page(self) -> "FakePage":
+        return FakePage()
+
+    def close(self) -> None:
+        pass
+
+
+class FakePage:
+    """A stand-in for a Playwright Page, recording the expressions evaluated and returning axe-core results."""
+    def __init__(self, axe_loaded: bool = False, violations: list = None) -> None:
+        self.context = FakeContext()
+        self.axe_loaded = axe_loaded
+        self.violations = violations or []
+        self.evaluated = []
+        self.arguments = []
+        self.url = ""
+        self.dom = "dom-1"
+        self.axe_rules = []
+
+    def goto(self, url: str) -> None:
+        self.url = url
+        self.axe_loaded = False
+
+    def evaluate(self, expression: str, arg=None):
+        if untimed_expression(expression) is not None:
+            return {"results": self.evaluate(untimed_expression(expression), arg), "runMs": 5.0}
+        self.evaluated.append(expression)
+        if is_axe_run(expression):
+            self.arguments.append(arg)
+        if expression == AXE_LOADED_CHECK:
+            return self.axe_loaded
+        if expression == DOM_FINGERPRINT_SCRIPT:
+            return self.dom
+        if expression.startswith("axe.getRules("):
+            return self.axe_rules
+        if is_axe_run(expression):
+            return {"url": self.url, "timestamp": "2024-11-04T16:14:57.934Z", "passes": [], "incomplete": [],
+                    "inapplicable": [], "violations": self.violations}
+        self.axe_loaded = True
+
+
+class ScopingFakePage(FakePage):
+    """A FakePage reporting the changed regions recorded, and returning separate results for scans of those regions."""
+    def __init__(self, region_count: int | None, violations: list, scoped_violations: list) -> None:
+        super().__init__(violations=violations)
+        self.region_count = region_count
+        self.scoped_violations = scoped_violations
+
+    def evaluate(self, expression: str, arg=None):
+        if expression == CHANGED_REGIONS_SCRIPT:
+            self.evaluated.append(expression)
+            return self.region_count
+        if expression == NODES_IN_CHANGED_REGIONS_SCRIPT:
+            self.evaluated.append(expression)
+            return [target == "#b" for target in arg]
+        response = super().evaluate(expression, arg)
+        if expression.startswith(f"axe.run({CHANGED_REGIONS_CONTEXT}"):
+            response["violations"] = self.scoped_violations
+        return response
+
+
+class FakeFrameElement:
+    """A stand-in for the iframe element of a frame, matching the classes provided."""
+    def __init__(self, selector: str, classes: tuple[str, ...]) -> None:
+        self.selector = selector
+        self.classes = classes
+
+    def evaluate(self, expression: str, arg=None):
+        if expression == FRAME_MATCHES_SCRIPT:
+            return any(selector.lstrip(".") in self.classes for selector in arg)
+        if expression == FRAME_SELECTOR_SCRIPT:
+            return self.selector
+
+
+class FakeFrame:
+    """A stand-in for a Playwright Frame, recording whether axe-core has been injected."""
+    def __init__(self, url: str, selector: str = "", classes: tuple[str, ...] = (), detached: bool = False) -> None:
+        self.url = url
+        self.parent_frame = None
+        self.child_frames = []
+        self.element = FakeFrameElement(selector, classes)
+        self.detached = detached
+        self.axe_loaded = False
+
+    def add_child(self, frame: "FakeFrame") -> "FakeFrame":
+        frame.parent_frame = self
+        self.child_frames.append(frame)
+        return frame
+
+    def frame_element(self) -> FakeFrameElement:
+        return self.element
+
+    def evaluate(self, expression: str, arg=None):
+        if self.detached:
+            raise PlaywrightError("Frame was detached")
+        if expression == AXE_LOADED_CHECK:
+            return self.axe_loaded
+        if expression == DOM_FINGERPRINT_SCRIPT:
+            return f"dom-{self.url}"
+        self.axe_loaded = True
+
+
+class FramedFakePage(FakePage):
+    """A FakePage with child frames, whose main frame is the page itself."""
+    def __init__(self) -> None:
+        super().__init__()
+        self.main_frame = FakeFrame("https://www.test.com")
+        self.widget = self.main_frame.add_child(FakeFrame("https://www.test.com/widget", "iframe#widget"))
+        self.nested = self.widget.add_child(FakeFrame("https://www.test.com/nested", "iframe#nested", ("no-scan",)))
+        self.advert = self.main_frame.add_child(FakeFrame("https://ads.test.com/banner", "iframe#advert"))
+
+    @property
+    def frames(self) -> list:
+        return [self, self.widget, self.nested, self.advert]
+
+
+class SiteFakePage(FakePage):
+    """A FakePage for crawling, returning the links of each page of a site and failing to load URLs not in the site."""
+    def __init__(self, site: dict[str, list[str]], redirects: dict[str, str] = None) -> None:
+        super().__init__()
+        self.site = site
+        self.redirects = redirects or {}
+        self.visited = []
+
+    def goto(self, url: str) -> None:
+        url = self.redirects.get(url, url)
+        if url not in self.site:
+            raise PlaywrightError(f"net::ERR_NAME_NOT_RESOLVED at {url}")
+        self.visited.append(url)
+        super().goto(url)
+
+    def evaluate(self, expression: str, arg=None):
+        if expression == LINKS_SCRIPT:
+            return self.site[self.url]
+        return super().evaluate(expression, arg)
+
+
+SITE = {
+    "https://www.test.com/": ["https://www.test.com/about", "/search?b=2&a=1", "https://other.com/", "#top",
+                              "mailto:test@test.com", "https://www.test.com/missing"],
+    "https://www.test.com/about": ["https://WWW.test.com:443/#contact", "https://www.test.com/about/team"],
+    "https://www.test.com/search?a=1&b=2": ["https://www.test.com/logout"],
+    "https://www.test.com/about/team": ["https://www.test.com/about/team/1"],
+    "https://www.test.com/about/team/1": [],
+    "https://www.test.com/logout": [],
+}
+
+
+def rule(rule_id: str, *targets: str, **extra) -> dict:
+    return {"id": rule_id, "impact": "serious", "tags": [], "description": "test", "helpUrl": "test",
+            "nodes": [{"target": [target], "html": "<div>", "failureSummary": "fix"} for target in targets], **extra}
+
+
 def test_axe_init_around_minified_file() -> None:
     axe = Axe()
     assert axe.axe_path.is_file()
@@ -36,12 +257,512 @@ def test_axe_init_around_minified_file() -> None:
     assert axe.axe_path.name == "axe.min.js"
 
 
+def test_load_axe_script_cached() -> None:
+    invalidate_axe_script_cache()
+    script = load_axe_script(AXE_PATH)
+    assert script == AXE_PATH.read_text(encoding="UTF-8")
+    assert load_axe_script(AXE_PATH) is script
+    assert AXE_PATH.resolve() in _AXE_SCRIPT_CACHE
+
+
+def test_load_axe_script_modified_file(tmp_path: Path) -> None:
+    script_path = tmp_path / "axe.js"
+    script_path.write_text("var a = 1;", encoding="UTF-8")
+    assert load_axe_script(script_path) == "var a = 1;"
+
+    script_path.write_text("var a = 2;", encoding="UTF-8")
+    os.utime(script_path, ns=(0, script_path.stat().st_mtime_ns + 1_000_000))
+    assert load_axe_script(script_path) == "var a = 2;"
+
+
+def test_preload_and_invalidate_axe_script_cache() -> None:
+    invalidate_axe_script_cache()
+    preload_axe_script()
+    assert AXE_PATH.resolve() in _AXE_SCRIPT_CACHE
+    assert MIN_AXE_PATH.resolve() in _AXE_SCRIPT_CACHE
+
+    invalidate_axe_script_cache(MIN_AXE_PATH)
+    assert AXE_PATH.resolve() in _AXE_SCRIPT_CACHE
+    assert MIN_AXE_PATH.resolve() not in _AXE_SCRIPT_CACHE
+
+
+def test_get_axe_version() -> None:
+    assert get_axe_version(AXE_PATH) == get_axe_version(MIN_AXE_PATH)
+    assert get_axe_version(AXE_PATH).count(".") == 2
+
+
+def test_inject_axe_only_when_not_loaded() -> None:
+    page = FakePage()
+    axe = Axe()
+    assert axe._inject_axe(page) is True
+    assert axe._inject_axe(page) is False
+    assert page.evaluated.count(load_axe_script(AXE_PATH)) == 1
+
+
+def test_inject_axe_with_init_script() -> None:
+    page = FakePage(axe_loaded=True)
+    axe = Axe(use_init_script=True)
+    axe._inject_axe(page)
+    axe._inject_axe(page)
+    assert page.context.init_scripts == [load_axe_script(AXE_PATH)]
+    assert load_axe_script(AXE_PATH) not in page.evaluated
+
+
+def test_run_scan_cache_skips_unchanged_page() -> None:
+    page = FakePage()
+    page.goto("https://www.test.com")
+    cache = ScanCache()
+    axe = Axe(scan_cache=cache)
+
+    first = axe.run(page, html_report_generated=False, json_report_generated=False)
+    second = axe.run(page, html_report_generated=False, json_report_generated=False)
+
+    assert second["cachedTimestamp"] == first["timestamp"]
+    assert {**second, "timestamp": first["timestamp"], "cachedTimestamp": None} == {**first, "cachedTimestamp": None}
+    assert "cachedTimestamp" not in first
+    assert "Cached Scan Timestamp" in axe._generate_execution_details_section(second)
+    assert len([expression for expression in page.evaluated if is_axe_run(expression)]) == 1
+    assert cache.stats() == {"hits": 1, "misses": 1, "hit_rate": 0.5}
+
+
+def test_run_scan_cache_rescans_on_change() -> None:
+    page = FakePage()
+    page.goto("https://www.test.com")
+    cache = ScanCache()
+    axe = Axe(scan_cache=cache)
+
+    axe.run(page, html_report_generated=False, json_report_generated=False)
+    page.dom = "dom-2"
+    axe.run(page, html_report_generated=False, json_report_generated=False)
+    axe.run(page, options="{runOnly: ['image-alt']}", html_report_generated=False, json_report_generated=False)
+    axe.run(page, result_filter=VIOLATIONS_ONLY_FILTER, html_report_generated=False, json_report_generated=False)
+
+    assert cache.stats()["misses"] == 4
+    assert len([expression for expression in page.evaluated if is_axe_run(expression)]) == 4
+
+
+def test_scan_cache_directory(tmp_path: Path) -> None:
+    page = FakePage()
+    page.goto("https://www.test.com")
+    Axe(scan_cache=ScanCache(tmp_path)).run(page, html_report_generated=False, json_report_generated=False)
+    (tmp_path / "www_test_com.json").write_text("{}", encoding="utf-8")
+
+    # A new cache using the same directory, as in a later test run
+    cache = ScanCache(tmp_path)
+    new_page = FakePage()
+    new_page.goto("https://www.test.com")
+    Axe(scan_cache=cache).run(new_page, html_report_generated=False, json_report_generated=False)
+
+    assert cache.stats()["hits"] == 1
+    assert not any(is_axe_run(expression) for expression in new_page.evaluated)
+
+    assert len(list(tmp_path.glob("scan-cache-*.json"))) == 1
+    cache.clear()
+    assert [path.name for path in tmp_path.glob("*.json")] == ["www_test_com.json"]
+    assert cache.stats() == {"hits": 0, "misses": 0, "hit_rate": 0.0}
+
+
+def test_scan_cache_corrupt_file_is_miss(tmp_path: Path) -> None:
+    cache = ScanCache(tmp_path)
+    cache.put("key", {"url": "https://www.test.com", "timestamp": "2024-11-04T16:14:57.934Z"})
+    assert [path.name for path in tmp_path.iterdir()] == ["scan-cache-key.json"]
+    (tmp_path / "scan-cache-key.json").write_text('{"url": "https://www.te', encoding="utf-8")
+
+    new_cache = ScanCache(tmp_path)
+    assert new_cache.get("key") is None
+    assert new_cache.stats() == {"hits": 0, "misses": 1, "hit_rate": 0.0}
+    assert not (tmp_path / "scan-cache-key.json").exists()
+
+
+def test_run_metrics_callback(tmp_path: Path) -> None:
+    page = FakePage(violations=[rule("image-alt", "#a")])
+    page.goto("https://www.test.com")
+    collected = []
+    axe = Axe(output_directory=tmp_path, snapshot_directory=tmp_path, metrics_callback=collected.append)
+
+    response = axe.run(page, filename="metrics")
+
+    metrics = collected[0]
+    assert axe.last_metrics is metrics
+    assert metrics.url == "https://www.test.com" and metrics.filename == "metrics" and not metrics.cache_hit
+    assert list(metrics.phases) == ["inject_ms", "axe_run_ms", "transfer_ms", "snapshot_load_ms",
+                                    "html_report_ms", "json_report_ms"]
+    assert metrics.phases["axe_run_ms"] == 5.0
+    assert metrics.payload_bytes == len(json.dumps(response, separators=(",", ":")))
+    assert json.loads(metrics.to_json())["total_ms"] == pytest.approx(metrics.total_ms)
+    assert metrics.total_ms == pytest.approx(sum(duration for name, duration in metrics.phases.items()
+                                                 if name != "snapshot_load_ms"))
+    assert is_axe_run(page.evaluated[-1])
+
+def test_scan_metrics_total_excludes_nested_phases() -> None:
+    metrics = ScanMetrics(url="https://www.test.com", phases={"axe_run_ms": 5.0, "snapshot_load_ms": 2.0,
+                                                              "html_report_ms": 3.0})
+
+    assert metrics.total_ms == 8.0
+
+
+def test_run_metrics_cache_hit() -> None:
+    page = FakePage()
+    page.goto("https://www.test.com")
+    collected = []
+    axe = Axe(scan_cache=ScanCache(), metrics_callback=collected.append)
+
+    axe.run(page, html_report_generated=False, json_report_generated=False)
+    axe.run(page, html_report_generated=False, json_report_generated=False)
+
+    assert [metrics.cache_hit for metrics in collected] == [False, True]
+    assert list(collected[1].phases) == ["fingerprint_ms"]
+    assert collected[1].payload_bytes == 0
+
+
+def test_run_metrics_logged(caplog: pytest.LogCaptureFixture) -> None:
+    page = FakePage()
+    page.goto("https://www.test.com")
+
+    with caplog.at_level("DEBUG", logger=metrics_logger.name):
+        Axe().run(page, options="{runOnly: ['image-alt']}", html_report_generated=False, json_report_generated=False)
+
+    logged = [json.loads(record.getMessage()) for record in caplog.records if record.name == metrics_logger.name]
+    assert len(logged) == 1
+    assert logged[0]["url"] == "https://www.test.com"
+    assert logged[0]["phases"]["axe_run_ms"] == 5.0
+
+
+def test_run_frame_filter_injects_child_frames() -> None:
+    page = FramedFakePage()
+    page.goto("https://www.test.com")
+
+    Axe().run(page, frame_filter=FrameFilter(exclude_urls="https://ads.*"),
+              html_report_generated=False, json_report_generated=False)
+
+    assert page.widget.axe_loaded and page.nested.axe_loaded
+    assert not page.advert.axe_loaded
+    assert page.arguments[0][0] == {"exclude": ["iframe#advert"]}
+
+
+def test_run_frame_filter_excludes_nested_frames() -> None:
+    page = FramedFakePage()
+    page.goto("https://www.test.com")
+
+    Axe().run(page, context=AxeContext(exclude=(".banner",)), frame_filter=FrameFilter(exclude_selectors=(".no-scan",)),
+              html_report_generated=False, json_report_generated=False)
+
+    assert page.advert.axe_loaded and not page.nested.axe_loaded
+    assert page.arguments[0][0] == {"exclude": [".banner", {"fromFrames": ["iframe#widget", "iframe#nested"]}]}
+
+
+def test_run_frame_filter_include_urls() -> None:
+    page = FramedFakePage()
+    page.goto("https://www.test.com")
+
+    Axe().run(page, frame_filter=FrameFilter(include_urls=("https://www.test.com/widget",)),
+              html_report_generated=False, json_report_generated=False)
+
+    # Frames are prepared one level at a time, so the nested frame is excluded last
+    assert page.widget.axe_loaded and not page.nested.axe_loaded
+    assert page.arguments[0][0] == {"exclude": ["iframe#advert", {"fromFrames": ["iframe#widget", "iframe#nested"]}]}
+
+
+def test_run_frame_filter_skipped_frames() -> None:
+    page = FramedFakePage()
+    page.goto("https://www.test.com")
+    page.advert.detached = True
+
+    Axe().run(page, options="{runOnly: ['image-alt']}", frame_filter=ALL_FRAMES,
+              html_report_generated=False, json_report_generated=False)
+    assert page.widget.axe_loaded and page.nested.axe_loaded
+
+    # No frames are injected if axe-core is set not to scan iframes
+    other_page = FramedFakePage()
+    Axe().run(other_page, options=AxeOptions(iframes=False), frame_filter=ALL_FRAMES,
+              html_report_generated=False, json_report_generated=False)
+    assert not other_page.widget.axe_loaded
+
+
+def test_run_frame_filter_requires_argument_context() -> None:
+    page = FramedFakePage()
+    with pytest.raises(AxeAccessibilityException):
+        Axe().run(page, context="{exclude: ['.banner']}", frame_filter=FrameFilter(exclude_urls=("https://ads.*",)))
+
+
+def test_run_frame_filter_scan_cache() -> None:
+    page = FramedFakePage()
+    page.goto("https://www.test.com")
+    cache = ScanCache()
+    axe = Axe(scan_cache=cache)
+
+    axe.run(page, frame_filter=ALL_FRAMES, html_report_generated=False, json_report_generated=False)
+    axe.run(page, html_report_generated=False, json_report_generated=False)
+    page.widget.url = "https://www.test.com/widget-2"
+    axe.run(page, frame_filter=ALL_FRAMES, html_report_generated=False, json_report_generated=False)
+
+    assert cache.stats()["misses"] == 3
+
+
+def test_run_metrics_not_collected_by_default() -> None:
+    page = FakePage()
+    page.goto("https://www.test.com")
+    axe = Axe()
+
+    axe.run(page, html_report_generated=False, json_report_generated=False)
+
+    assert axe.last_metrics is None
+    assert AXE_RUN_SCRIPT in page.evaluated
+
+
+def test_normalize_url() -> None:
+    assert normalize_url("HTTPS://Www.Test.com:443?b=2&a=1#top") == "https://www.test.com/?a=1&b=2"
+    assert normalize_url("http://user@test.com:8080/path") == "http://test.com:8080/path"
+    assert normalize_url("../other", "https://www.test.com/a/b/") == "https://www.test.com/a/other"
+
+
+def test_crawl_frontier_invalid_seed() -> None:
+    with pytest.raises(AxeAccessibilityException):
+        CrawlFrontier(["/home"])
+
+
+def test_crawl_follows_same_origin_links_once() -> None:
+    page = SiteFakePage(SITE)
+    frontier = CrawlFrontier(["https://www.test.com"], exclude_urls=("*/logout",))
+
+    results = Axe().crawl(page, frontier, html_report_generated=False, json_report_generated=False)
+
+    assert page.visited == ["https://www.test.com/", "https://www.test.com/about", "https://www.test.com/search?a=1&b=2",
+                            "https://www.test.com/about/team", "https://www.test.com/about/team/1"]
+    assert list(results) == page.visited
+    assert frontier.failed == ["https://www.test.com/missing"]
+    assert frontier.stats() == {"scanned": 5, "failed": 1, "queued": 0, "seen": 6}
+    assert frontier.finished
+
+
+def test_crawl_limits() -> None:
+    page = SiteFakePage(SITE)
+    Axe().crawl(page, CrawlFrontier(["https://www.test.com/"], max_depth=1), html_report_generated=False,
+                json_report_generated=False)
+    assert "https://www.test.com/about/team" not in page.visited
+    assert "https://www.test.com/logout" not in page.visited
+
+    page = SiteFakePage(SITE)
+    frontier = CrawlFrontier(["https://www.test.com/"], max_pages=2, include_urls=("*/about*",))
+    Axe().crawl(page, frontier, html_report_generated=False, json_report_generated=False)
+    assert page.visited == ["https://www.test.com/", "https://www.test.com/about"]
+    assert frontier.stats()["queued"] == 1
+
+
+def test_crawl_redirect_marked_as_seen() -> None:
+    site = {"https://www.test.com/": ["https://www.test.com/old", "https://www.test.com/about"],
+            "https://www.test.com/about": ["https://www.test.com/new"],
+            "https://www.test.com/new": []}
+    page = SiteFakePage(site, redirects={"https://www.test.com/old": "https://www.test.com/new"})
+
+    results = Axe().crawl(page, CrawlFrontier(["https://www.test.com/"]), html_report_generated=False,
+                          json_report_generated=False)
+
+    assert list(results) == ["https://www.test.com/", "https://www.test.com/old", "https://www.test.com/about"]
+
+
+def test_crawl_resumes_from_state_file(tmp_path: Path) -> None:
+    state_file = tmp_path / "crawl_state.json"
+    page = SiteFakePage(SITE)
+    Axe().crawl(page, CrawlFrontier(["https://www.test.com/"], max_pages=2, state_file=state_file),
+                html_report_generated=False, json_report_generated=False)
+
+    resumed_page = SiteFakePage(SITE)
+    frontier = CrawlFrontier(["https://www.test.com/"], state_file=state_file, exclude_urls=("*/logout",))
+    results = Axe().crawl(resumed_page, frontier, html_report_generated=False, json_report_generated=False)
+
+    assert page.visited == ["https://www.test.com/", "https://www.test.com/about"]
+    assert resumed_page.visited == ["https://www.test.com/search?a=1&b=2", "https://www.test.com/about/team",
+                                    "https://www.test.com/about/team/1"]
+    assert list(results) == resumed_page.visited
+    assert json.loads(state_file.read_text(encoding="utf-8"))["queue"] == []
+
+
+def test_crawl_interrupted_saves_state(tmp_path: Path) -> None:
+    state_file = tmp_path / "crawl_state.json"
+    page = SiteFakePage(SITE)
+
+    def stop_after_first_page(response: dict) -> None:
+        if not response["url"].endswith(".com/"):
+            raise RuntimeError("Interrupted")
+
+    axe = Axe(result_callback=stop_after_first_page)
+
+    with pytest.raises(RuntimeError):
+        axe.crawl(page, CrawlFrontier(["https://www.test.com/"], state_file=state_file),
+                  html_report_generated=False, json_report_generated=False)
+
+    state = json.loads(state_file.read_text(encoding="utf-8"))
+    assert state["scanned"] == ["https://www.test.com/"]
+    assert state["queue"][0] == ["https://www.test.com/about", 1]
+
+
+def test_crawl_frontier_wait_next_across_threads() -> None:
+    """Test workers waiting on the frontier pick up links added by other workers, and stop once the crawl is finished."""
+    frontier = CrawlFrontier(["https://www.test.com/"], max_depth=2)
+    scanned = []
+
+    def worker() -> None:
+        while (entry := frontier.wait_next()) is not None:
+            url, depth = entry
+            scanned.append(url)
+            frontier.complete(url, [f"{url.rstrip('/')}/{number}" for number in range(3)])
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        for future in [executor.submit(worker) for _ in range(4)]:
+            future.result(timeout=10)
+
+    assert len(scanned) == len(set(scanned)) == 13
+    assert frontier.finished
+
+
+def test_crawl_strict_mode_after_crawl() -> None:
+    page = SiteFakePage(SITE)
+    page.violations = [rule("image-alt", "img")]
+
+    with pytest.raises(AxeAccessibilityException):
+        Axe().crawl(page, CrawlFrontier(["https://www.test.com/"]), strict_mode=True,
+                    html_report_generated=False, json_report_generated=False)
+
+    assert len(page.visited) == 6
+
+
+def test_axe_options_serialization() -> None:
+    options = AxeOptions(run_only=["wcag2a"], rules={"region": False, "color-contrast": True},
+                         result_types=["violations"], iframes=False, selectors=True)
+
+    assert options.axe_options == {
+        "runOnly": {"type": "tag", "values": ["wcag2a"]},
+        "rules": {"color-contrast": {"enabled": True}, "region": {"enabled": False}},
+        "resultTypes": ["violations"],
+        "iframes": False,
+        "selectors": True
+    }
+    assert options.json == json.dumps(options.axe_options, separators=(",", ":"), sort_keys=True)
+    assert AxeOptions().axe_options == {}
+
+
+def test_axe_options_hashable() -> None:
+    first = AxeOptions(run_only=["wcag2a"], rules={"region": False, "color-contrast": True})
+    second = AxeOptions(run_only=("wcag2a",), rules={"color-contrast": True, "region": False})
+
+    assert first == second
+    assert {first: "cached"}[second] == "cached"
+    assert hash(AxeContext(include="main")) == hash(AxeContext(include=("main",)))
+
+
+def test_axe_options_invalid() -> None:
+    with pytest.raises(AxeAccessibilityException):
+        AxeOptions(run_only_type="id")
+    with pytest.raises(AxeAccessibilityException):
+        AxeOptions(result_types=("failures",))
+
+
+def test_options_wcag_22aa() -> None:
+    assert AXE_OPTIONS_WCAG_22AA.axe_options == {"runOnly": {"type": "tag", "values": [
+        'wcag2a', 'wcag21a', 'wcag2aa', 'wcag21aa', 'wcag22a', 'wcag22aa', 'best-practice']}}
+    assert OPTIONS_WCAG_22AA == ("{runOnly: {type: 'tag', values: ['wcag2a', 'wcag21a', 'wcag2aa', 'wcag21aa', "
+                                 "'wcag22a', 'wcag22aa', 'best-practice']}}")
+    assert Axe()._build_evaluate_arguments(options=OPTIONS_WCAG_22AA) == (
+        f"axe.run({OPTIONS_WCAG_22AA}).then(results => {{return results;}})", None)
+
+
+def test_axe_context_serialization() -> None:
+    assert AxeContext(include=("main",), exclude=(".ad-banner",)).axe_context == {"include": ["main"], "exclude": [".ad-banner"]}
+    assert AxeContext(exclude=".ad-banner").json == '{"exclude":[".ad-banner"]}'
+
+
+def test_build_evaluate_arguments() -> None:
+    axe = Axe()
+    assert axe._build_evaluate_arguments() == (AXE_RUN_SCRIPT, [None, None, None])
+    assert axe._build_evaluate_arguments(AxeContext(include="main"), AXE_OPTIONS_WCAG_22AA, VIOLATIONS_ONLY_FILTER) == (
+        AXE_RUN_SCRIPT, [{"include": ["main"]}, AXE_OPTIONS_WCAG_22AA.axe_options,
+                         {"drop_pass_nodes": True, "drop_inapplicable": True, "max_nodes_per_rule": None, "strip_html": False}])
+
+    # str context or options are built into the expression, with any AxeContext or AxeOptions as JSON
+    assert axe._build_evaluate_arguments("document", AxeOptions(iframes=False)) == (
+        'axe.run(document, {"iframes":false}).then(results => {return results;})', None)
+
+
+def test_build_evaluate_arguments_empty_context() -> None:
+    axe = Axe()
+    assert AxeContext().json == ""
+    assert axe._build_evaluate_arguments(AxeContext(), AXE_OPTIONS_WCAG_22AA) == (
+        AXE_RUN_SCRIPT, [None, AXE_OPTIONS_WCAG_22AA.axe_options, None])
+    assert axe._build_evaluate_arguments(AxeContext(), OPTIONS_WCAG_22AA) == (
+        f"axe.run({OPTIONS_WCAG_22AA}).then(results => {{return results;}})", None)
+
+
+def test_run_passes_options_as_argument() -> None:
+    page = FakePage()
+    page.goto("https://www.test.com")
+
+    Axe().run(page, options=AXE_OPTIONS_WCAG_22AA, html_report_generated=False, json_report_generated=False)
+
+    assert page.arguments == [[None, AXE_OPTIONS_WCAG_22AA.axe_options, None]]
+
+
+AXE_RULES = [
+    {"ruleId": "image-alt", "tags": ["wcag2a"]},
+    {"ruleId": "color-contrast", "tags": ["wcag2aa"]},
+    {"ruleId": "region", "tags": ["best-practice"]},
+    {"ruleId": "old-rule", "tags": ["wcag2a", "deprecated"]},
+    {"ruleId": "new-rule", "tags": ["wcag2a", "experimental"]}
+]
+
+
+def test_axe_options_with_resolved_rules() -> None:
+    options = AxeOptions(run_only=("wcag2a", "wcag2aa"), rules={"color-contrast": False, "region": True},
+                         result_types=("violations",), resolve_rules=True)
+
+    resolved = options.with_resolved_rules(AXE_RULES)
+
+    assert resolved.run_only == ("image-alt", "region")
+    assert resolved.axe_options == {"runOnly": {"type": "rule", "values": ["image-alt", "region"]},
+                                    "resultTypes": ["violations"]}
+    assert AxeOptions(run_only=("wcag2a", "experimental")).with_resolved_rules(AXE_RULES).run_only == (
+        "image-alt", "new-rule")
+    assert AxeOptions(run_only=("image-alt",), run_only_type="rule").with_resolved_rules(AXE_RULES).run_only == (
+        "image-alt",)
+
+
+def test_run_resolves_rules_once() -> None:
+    _RESOLVED_OPTIONS_CACHE.clear()
+    page = FakePage()
+    page.axe_rules = AXE_RULES
+    page.goto("https://www.test.com")
+    axe = Axe()
+
+    axe.run(page, options=AXE_OPTIONS_WCAG_22AA_VIOLATIONS, html_report_generated=False, json_report_generated=False)
+    axe.run(page, options=AXE_OPTIONS_WCAG_22AA_VIOLATIONS, html_report_generated=False, json_report_generated=False)
+
+    assert len([expression for expression in page.evaluated if expression.startswith("axe.getRules(")]) == 1
+    assert page.arguments[1] == [None, {"runOnly": {"type": "rule", "values": ["image-alt", "color-contrast", "region"]},
+                                        "resultTypes": ["violations"]}, None]
+
+
 def test_build_run_command() -> None:
     assert Axe()._build_run_command('context', 'options') == "context, options"
     assert Axe()._build_run_command(context='context') == "context"
     assert Axe()._build_run_command(options='options') == "options"
 
 
+def test_build_evaluate_command() -> None:
+    assert Axe()._build_evaluate_command("context", "options") == "axe.run(context, options).then(results => {return results;})"
+
+    command = Axe()._build_evaluate_command(options="options", result_filter=VIOLATIONS_ONLY_FILTER)
+    assert command.startswith("axe.run(options).then(results => ((results, resultFilter) =>")
+    assert command.endswith('(results, {"drop_pass_nodes": true, "drop_inapplicable": true, "max_nodes_per_rule": null, "strip_html": false}))')
+
+    command = Axe()._build_evaluate_command(result_filter=ResultFilter(max_nodes_per_rule=5, strip_html=True))
+    assert '"max_nodes_per_rule": 5, "strip_html": true' in command
+
+
+def test_node_count() -> None:
+    assert Axe()._node_count({"nodes": [1, 2]}) == 2
+    assert Axe()._node_count({"nodes": [1], "nodeCount": 7}) == 7
+
+
 def test_modify_filename_for_report() -> None:
     assert Axe()._modify_filename_for_report(
         'https://www.test.com/1/2\\3/') == "www_test_com_1_2_3"
@@ -72,6 +793,32 @@ def test_create_json_report() -> None:
         assert file.read() == '''{\n    "url": "https://www.test.com/1"\n}'''
 
 
+def test_create_json_report_compact_and_excluded(tmp_path: Path) -> None:
+    test_data = {"url": "https://www.test.com/1", "violations": [], "passes": [{"id": "test"}]}
+
+    Axe(output_directory=tmp_path, json_compact=True, json_exclude=["passes"])._create_json_report(test_data)
+    assert (tmp_path / TEST_JSON_DEFAULT_FILENAME).read_text(encoding="utf-8") == '{"url":"https://www.test.com/1","violations":[]}'
+
+
+def test_create_json_report_gzip(tmp_path: Path) -> None:
+    test_data = {"url": "https://www.test.com/1", "violations": [], "timestamp": "2024-11-04T16:14:57.934Z"}
+
+    Axe(output_directory=tmp_path, json_compression="gzip")._create_json_report(test_data, "snapshot")
+    with gzip.open(tmp_path / "snapshot.json.gz", "rt", encoding="utf-8") as file:
+        assert json.load(file) == test_data
+
+    # Compressed reports can be used as snapshots
+    assert Axe(snapshot_directory=tmp_path)._get_snapshot_data("snapshot") == test_data
+
+
+def test_invalid_json_options() -> None:
+    with pytest.raises(AxeAccessibilityException):
+        Axe(json_compression="zip")
+
+    with pytest.raises(AxeAccessibilityException):
+        Axe(json_exclude=["violations"])
+
+
 def test_create_html_report() -> None:
     test_data = {"testEngine":
                  {"name": "axe-core", "version": "4.10.2"},
@@ -99,6 +846,43 @@ def test_create_html_report() -> None:
         assert file.read() == expected_file_data
 
 
+def test_iter_html_matches_generate_html() -> None:
+    test_data = {"timestamp": "2024-11-04T16:14:57.934Z", "url": "https://www.test.com/1",
+                 "passes": [], "incomplete": [], "inapplicable": [],
+                 "violations": [{"id": "test", "impact": "minor", "tags": ["wcag2a"], "description": "test", "helpUrl": "test",
+                                 "nodes": [{"target": ["#a"], "html": "<a>", "failureSummary": "Fix any of the following:\n fix"}]}]}
+    fragments = list(Axe()._iter_html(test_data, "test"))
+    assert len(fragments) > 1
+    assert "".join(fragments) == Axe()._generate_html(test_data, "test")
+
+
+def test_report_writer_writes_in_background(tmp_path: Path) -> None:
+    writer = ReportWriter(max_pending=1)
+    axe = Axe(output_directory=tmp_path, report_writer=writer)
+    for number in range(3):
+        axe._write_report(axe._create_json_report, {"url": f"https://www.test.com/{number}"}, "")
+    axe.flush_reports()
+    writer.close()
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "www_test_com_0.json", "www_test_com_1.json", "www_test_com_2.json"]
+
+
+def test_report_writer_raises_errors() -> None:
+    def failing_report(data: dict, filename: str) -> None:
+        raise OSError("disk full")
+
+    writer = ReportWriter()
+    writer.submit(failing_report, {}, "")
+    with pytest.raises(AxeAccessibilityException, match="disk full"):
+        writer.flush()
+
+    # Errors are only raised once
+    writer.close()
+    with pytest.raises(AxeAccessibilityException):
+        writer.submit(failing_report, {}, "")
+
+
 def test_wcag_tagging() -> None:
     result = Axe()._wcag_tagging(['wcag22a', "best-practice", "x"])
     assert result == "WCAG 2.2 (A), Best Practice"
@@ -113,6 +897,29 @@ def test_css_styling() -> None:
     assert custom_css_result == "<style>body { background-color: red; }</style>"
 
 
+def test_report_style_cached_until_modified(tmp_path: Path) -> None:
+    css_path = tmp_path / "report.css"
+    css_path.write_text("body { color: red; }", encoding="UTF-8")
+    first = _report_style(css_path, css_path.stat().st_mtime_ns)
+    assert _report_style(css_path, css_path.stat().st_mtime_ns) is first
+
+    css_path.write_text("body { color: blue; }", encoding="UTF-8")
+    os.utime(css_path, ns=(css_path.stat().st_atime_ns, css_path.stat().st_mtime_ns + 1_000_000))
+    assert _report_style(css_path, css_path.stat().st_mtime_ns) == "<style>body { color: blue; }</style>"
+
+
+def test_report_fragments_cached() -> None:
+    axe = Axe()
+    headers = [("#", "2", True), ("Description", "98", False)]
+    assert axe._generate_table_header(headers) == ('<th style="text-align: center; width: 2%">#</th>'
+                                                   '<th style="width: 98%">Description</th>')
+
+    hits = _wcag_labels.cache_info().hits
+    axe._wcag_tagging(["wcag2a", "cat.color"])
+    axe._wcag_tagging(["wcag2a", "cat.color"])
+    assert _wcag_labels.cache_info().hits >= hits + 1
+
+
 def test_generate_violations_section_no_data() -> None:
     test_data = []
     results = Axe()._generate_violations_section(test_data)
@@ -125,6 +932,13 @@ def test_generate_violations_section_with_data() -> None:
     assert results == '<h2>Violations Found</h2><p>1 violations found.</p><table><tr><th style="text-align: center; width: 2%">#</th><th style="width: 53%">Description</th><th style="width: 15%">Axe Rule ID</th><th style="width: 15%">WCAG</th><th style="width: 10%">Impact</th><th style="text-align: center; width: 5%">Count</th><tr>\n                    <td style="text-align: center;">1</td>\n                    <td>test</td>\n                    <td><a href="test url" target="_blank">test3</a></td>\n                    <td></td>\n                    <td>high</td>\n                    <td style="text-align: center;">0</td>\n                    </tr></table><table><tr><td style="width: 100%"><h3>test</h3>\n                                <p><strong>Axe Rule ID:</strong> <a href="test url" target="_blank">test3</a><br />\n                                <strong>WCAG:</strong> <br />\n                                <strong>Impact:</strong> high<br />\n                                <strong>Tags:</strong> cat.keyboard, best-test</p>\n                                <table><tr><th style="text-align: center; width: 2%">#</th><th style="width: 49%">Description</th><th style="width: 49%">Fix Information</th></table>\n                                </td></tr></table>'
 
 
+def test_generate_violations_section_nested_target() -> None:
+    test_data = [rule("button-name", "#header", help="test")]
+    test_data[0]["nodes"][0]["target"] = [["#host", "button"]]
+    results = Axe()._generate_violations_section(test_data)
+    assert "<pre><code>#host &gt;&gt;&gt; button</code></pre>" in results
+
+
 def test_generate_passed_section_no_data() -> None:
     test_data = []
     results = Axe()._generate_passed_section(test_data)
@@ -137,6 +951,12 @@ def test_generate_passed_section_with_data() -> None:
     assert results == '<h2>Passed Checks</h2><table><tr><th style="text-align: center; width: 2%">#</th><th style="width: 50%">Description</th><th style="width: 15%">Axe Rule ID</th><th style="width: 18%">WCAG</th><th style="text-align: center; width: 15%">Nodes Passed Count</th><tr>\n                    <td style="text-align: center;">1</td>\n                    <td>test</td>\n                    <td><a href="test" target="_blank">test2</a></td>\n                    <td>Best Practice</td>\n                    <td style="text-align: center;">0</td>\n                    </tr></table>'
 
 
+def test_generate_passed_section_with_filtered_nodes() -> None:
+    test_data = [{"id": "test2", "impact": None, "tags": ["best-practice"], "description": "test", "help": "test", "helpUrl": "test", "nodes": [], "nodeCount": 12}]
+    results = Axe()._generate_passed_section(test_data)
+    assert '<td style="text-align: center;">12</td>' in results
+
+
 def test_generate_inapplicable_section_no_data() -> None:
     test_data = []
     results = Axe()._generate_inapplicable_section(test_data)
@@ -268,6 +1088,193 @@ def test_check_pre_scan_assertions(patch_locator: Locator) -> None:
     with pytest.raises(AxeAccessibilityException):
         Axe()._check_pre_scan_actions(data)
 
+def test_plan_page_list(patch_locator: Locator) -> None:
+    page_list = [
+        "https://www.test.com/1",
+        {"url": "https://www.test.com/2", "action": "click", "locator": Locator.__new__(Locator)}
+    ]
+
+    assert Axe()._plan_page_list(page_list, True) == [
+        ("https://www.test.com/1", "www_test_com_1", page_list[0]),
+        ("https://www.test.com/2_click", "www_test_com_2_click", page_list[1])
+    ]
+    assert Axe()._plan_page_list(page_list, False)[1] == ("https://www.test.com/2_click", "", page_list[1])
+
+def test_merge_scoped_results() -> None:
+    base = {"url": "https://www.test.com", "timestamp": "1",
+            "violations": [rule("rule1", "#a", "#b")], "incomplete": [],
+            "passes": [rule("rule2", "#c"), rule("rule5", nodeCount=3), rule("rule6", "#d", nodeCount=1)],
+            "inapplicable": [rule("rule3"), rule("rule4")]}
+    scoped = {"url": "https://www.test.com", "timestamp": "2",
+              "violations": [rule("rule1", "#modal")], "incomplete": [],
+              "passes": [rule("rule3", "#modal-button"), rule("rule5", nodeCount=1), rule("rule6", "#e", nodeCount=1)],
+              "inapplicable": [rule("rule2"), rule("rule4")]}
+
+    axe = Axe()
+    replaced = [target == "#b" for target in axe._base_node_targets(base)]
+    merged = axe._merge_scoped_results(base, scoped, replaced, 1)
+
+    assert merged["timestamp"] == "2"
+    assert merged["scopedRegions"] == 1
+    assert [node["target"] for node in merged["violations"][0]["nodes"]] == [["#a"], ["#modal"]]
+    assert [passed["id"] for passed in merged["passes"]] == ["rule2", "rule5", "rule6", "rule3"]
+    # rule5's base nodes were dropped, so may include the node found in the changed region
+    assert merged["passes"][1]["nodeCount"] == 3
+    assert merged["passes"][2]["nodeCount"] == 2
+    assert [inapplicable["id"] for inapplicable in merged["inapplicable"]] == ["rule4"]
+    assert [node["target"] for node in base["violations"][0]["nodes"]] == [["#a"], ["#b"]]
+
+def test_run_list_scope_to_changes(monkeypatch) -> None:
+    monkeypatch.setattr(Locator, "click", lambda self: None)
+    page = ScopingFakePage(1, [rule("rule1", "#a", "#b")], [rule("rule1", "#modal")])
+    page_list = ["https://www.test.com",
+                 {"url": "https://www.test.com", "action": "click", "locator": Locator.__new__(Locator)}]
+
+    results = Axe().run_list(page, page_list, html_report_generated=False, json_report_generated=False,
+                             scope_to_changes=True)
+
+    assert [node["target"] for node in results["https://www.test.com"]["violations"][0]["nodes"]] == [["#a"], ["#b"]]
+    scoped = results["https://www.test.com_click"]
+    assert [node["target"] for node in scoped["violations"][0]["nodes"]] == [["#a"], ["#modal"]]
+    assert scoped["scopedRegions"] == 1
+    assert [expression for expression in page.evaluated if is_axe_run(expression)] == [
+        AXE_RUN_SCRIPT,
+        Axe()._build_evaluate_command(CHANGED_REGIONS_CONTEXT)
+    ]
+
+def test_run_list_scope_to_changes_full_page_change(monkeypatch) -> None:
+    monkeypatch.setattr(Locator, "click", lambda self: None)
+    page = ScopingFakePage(None, [rule("rule1", "#a")], [])
+    page_list = ["https://www.test.com",
+                 {"url": "https://www.test.com", "action": "click", "locator": Locator.__new__(Locator)}]
+
+    results = Axe().run_list(page, page_list, html_report_generated=False, json_report_generated=False,
+                             scope_to_changes=True)
+
+    assert "scopedRegions" not in results["https://www.test.com_click"]
+    assert [expression for expression in page.evaluated if is_axe_run(expression)] == [
+        AXE_RUN_SCRIPT
+    ] * 2
+
+def test_run_list_scope_to_changes_without_base_scan(monkeypatch) -> None:
+    monkeypatch.setattr(Locator, "click", lambda self: None)
+    page = ScopingFakePage(1, [rule("rule1", "#a")], [])
+    page_list = [{"url": "https://www.test.com", "action": "click", "locator": Locator.__new__(Locator)}]
+
+    Axe().run_list(page, page_list, html_report_generated=False, json_report_generated=False, scope_to_changes=True)
+
+    assert CHANGED_REGIONS_SCRIPT not in page.evaluated
+
+def test_run_list_invalid_concurrency() -> None:
+    with pytest.raises(AxeAccessibilityException):
+        Axe().run_list(FakePage(), ["https://www.test.com/1"], concurrency=0)
+
+def test_run_list_parallel_copies_storage_state(monkeypatch) -> None:
+    playwright = FakePlaywright()
+    monkeypatch.setattr("src.pytest_playwright_axe.axe.sync_playwright", playwright)
+    urls = [f"https://www.test.com/{number}" for number in range(4)]
+
+    results = Axe().run_list(FakePage(), urls, concurrency=2, context_options={"base_url": "https://www.test.com"},
+                             html_report_generated=False, json_report_generated=False)
+
+    assert list(results) == urls
+    assert playwright.context_options == [{"base_url": "https://www.test.com", "storage_state": STORAGE_STATE}] * 2
+
+    playwright.context_options.clear()
+    Axe().run_list(FakePage(), urls, concurrency=2, context_options={"storage_state": "state.json"},
+                   html_report_generated=False, json_report_generated=False)
+    assert playwright.context_options == [{"storage_state": "state.json"}] * 2
+
+def test_run_list_consolidated_report(tmp_path: Path) -> None:
+    violation = {"id": "test", "impact": "minor", "tags": [], "description": "test", "helpUrl": "test",
+                 "nodes": [{"target": ["#a"], "html": "<a>", "failureSummary": "fix"}]}
+    axe = Axe(output_directory=tmp_path)
+
+    with ConsolidatedReport(axe, "audit") as report:
+        with pytest.raises(AxeAccessibilityException):
+            axe.run_list(FakePage(violations=[violation]), ["https://www.test.com/1", "https://www.test.com/2"],
+                         json_report_generated=False, strict_mode=True, consolidated_report=report)
+
+    # The violating page is added to the consolidated report before strict mode raises
+    lines = (tmp_path / "audit.jsonl").read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["key"] for line in lines] == ["https://www.test.com/1"]
+    assert '<a href="www_test_com_1.html">full report</a>' in (tmp_path / "audit.html").read_text(encoding="utf-8")
+
+def test_template_sampler_url_group() -> None:
+    sampler = TemplateSampler(url_patterns=("*/category/*",))
+    assert sampler.url_group("https://www.test.com/product/1234?colour=red&page=2") == \
+        "https://www.test.com/product/{id}?colour=&page="
+    assert sampler.url_group("/product/blue-shirt-99/reviews") == "/product/{id}/reviews"
+    assert sampler.url_group("https://www.test.com/category/shirts") == "*/category/*"
+    assert sampler.url_group("https://www.test.com/about") == "https://www.test.com/about"
+
+def test_template_sampler_invalid_samples() -> None:
+    with pytest.raises(AxeAccessibilityException):
+        TemplateSampler(samples_per_group=0)
+
+def test_run_list_sampler_by_url(tmp_path: Path) -> None:
+    """Test only the first pages of each URL template are loaded and scanned, with the groups in the consolidated report."""
+    page = SiteFakePage({f"https://www.test.com/product/{number}": [] for number in range(5)} |
+                        {"https://www.test.com/about": []})
+    page_list = [f"https://www.test.com/product/{number}" for number in range(5)] + ["https://www.test.com/about"]
+    sampler = TemplateSampler(samples_per_group=2)
+    axe = Axe(output_directory=tmp_path)
+
+    with ConsolidatedReport(axe, "audit") as report:
+        results = axe.run_list(page, page_list, html_report_generated=False, json_report_generated=False,
+                               sampler=sampler, consolidated_report=report)
+
+    assert list(results) == page.visited == ["https://www.test.com/product/0", "https://www.test.com/product/1",
+                                             "https://www.test.com/about"]
+    assert sampler.stats() == {"groups": 2, "scanned": 3, "skipped": 3}
+    lines = [json.loads(line) for line in (tmp_path / "audit.jsonl").read_text(encoding="utf-8").splitlines()]
+    assert lines[0]["group"] == "https://www.test.com/product/{id}"
+    assert lines[3] == {"group": "https://www.test.com/product/{id}",
+                        "scanned": ["https://www.test.com/product/0", "https://www.test.com/product/1"],
+                        "skipped": ["https://www.test.com/product/2", "https://www.test.com/product/3",
+                                    "https://www.test.com/product/4"]}
+    assert "3 page(s), representing 6 page(s)" in (tmp_path / "audit.html").read_text(encoding="utf-8")
+
+def test_run_list_sampler_by_url_parallel(monkeypatch) -> None:
+    """Test the pages scanned for each URL template are the first in page list order, however the workers are scheduled."""
+    class SlowSampler(TemplateSampler):
+        def claim(self, results_key: str, group: str) -> bool:
+            # earlier pages take longer to claim, so workers claiming pages would reach them out of order
+            time.sleep(0.01 * (8 - int(results_key.rsplit("/", 1)[1])))
+            return super().claim(results_key, group)
+
+    monkeypatch.setattr("src.pytest_playwright_axe.axe.sync_playwright", FakePlaywright())
+    page_list = [f"https://www.test.com/product/{number}" for number in range(8)]
+
+    for _ in range(3):
+        sampler = SlowSampler(samples_per_group=2)
+        results = Axe().run_list(FakePage(), page_list, concurrency=4, html_report_generated=False,
+                                 json_report_generated=False, sampler=sampler)
+
+        assert list(results) == page_list[:2]
+        assert sampler.groups["https://www.test.com/product/{id}"]["scanned"] == page_list[:2]
+        assert sampler.groups["https://www.test.com/product/{id}"]["skipped"] == page_list[2:]
+
+def test_run_list_sampler_by_dom() -> None:
+    """Test pages are grouped by their DOM signature after loading, so only the first page of each structure is scanned."""
+    class TemplateFakePage(SiteFakePage):
+        def evaluate(self, expression: str, arg=None):
+            if expression == DOM_SIGNATURE_SCRIPT:
+                return ">html>body>main" if "article" in self.url else ">html>body>form"
+            return super().evaluate(expression, arg)
+
+    page_list = ["https://www.test.com/article-one", "https://www.test.com/article-two", "https://www.test.com/search"]
+    page = TemplateFakePage({url: [] for url in page_list})
+    sampler = TemplateSampler(samples_per_group=1, group_by_dom=True)
+
+    results = Axe().run_list(page, page_list, html_report_generated=False, json_report_generated=False,
+                             sampler=sampler)
+
+    assert page.visited == page_list
+    assert list(results) == ["https://www.test.com/article-one", "https://www.test.com/search"]
+    assert sampler.group_of("https://www.test.com/article-two") == sampler.group_of("https://www.test.com/article-one")
+    assert sampler.group_of("https://www.test.com/article-two").startswith("dom-")
+
 def test_get_snapshot_data_no_directory() -> None:
     """Test when no snapshot directory is configured"""
     result = Axe()._get_snapshot_data("test")
@@ -368,3 +1375,86 @@ def test_collect_all_changes() -> None:
     assert len(changes) == 1
     assert changes[0]['type'] == 'Increased Count'
     assert changes[0]['change'] == 2
+
+def _violation_with_nodes(*targets: str) -> dict:
+    return {"id": "rule1", "description": "Test", "impact": "serious", "tags": [],
+            "nodes": [{"target": [target], "html": f"<img id='{target}'>"} for target in targets]}
+
+def test_node_fingerprint() -> None:
+    """Test node fingerprints ignore whitespace differences in the html, but not the target."""
+    node = {"target": ["#a"], "html": "<img  id='a'>"}
+    assert node_fingerprint("rule1", node) == node_fingerprint("rule1", {"target": ["#a"], "html": "<img id='a'>"})
+    assert node_fingerprint("rule1", node) != node_fingerprint("rule1", {"target": ["#b"], "html": "<img  id='a'>"})
+    assert node_fingerprint("rule1", node) != node_fingerprint("rule2", node)
+    assert node_fingerprint("rule1", {"fingerprint": "stored|hash"}) == "stored|hash"
+    assert node_fingerprint("rule1", node, include_html=False) == "rule1|#a|"
+    assert node_fingerprint("rule1", {"target": ["#a"], "html": ""}) == "rule1|#a|"
+    assert node_fingerprint("rule1", {"fingerprint": "stored|hash"}, include_html=False) == "stored|"
+
+def test_format_node_target_nested() -> None:
+    """Test iframe and shadow DOM targets are joined."""
+    assert format_node_target(["#a"]) == "#a"
+    assert format_node_target([["iframe", "#a"]]) == "iframe >>> #a"
+
+def test_collect_all_changes_same_count_different_nodes() -> None:
+    """Test a fixed node replaced by a new one is reported, even though the count is unchanged."""
+    data = {"violations": [_violation_with_nodes("#a", "#c")]}
+    snapshot_data = {"violations": [_violation_with_nodes("#a", "#b")]}
+
+    changes = Axe()._collect_all_changes(data, snapshot_data)
+
+    assert len(changes) == 1
+    assert changes[0]['type'] == 'Changed Nodes'
+    assert changes[0]['change'] == 0
+    assert [node['target'] for node in changes[0]['added_nodes']] == ["#c"]
+    assert [node['target'] for node in changes[0]['removed_nodes']] == ["#b"]
+
+def test_collect_all_changes_stripped_html_compared_by_target() -> None:
+    """Test results with stripped HTML are matched by target against a snapshot that kept the HTML."""
+    stripped = _violation_with_nodes("#a", "#c")
+    for node in stripped["nodes"]:
+        node["html"] = ""
+    snapshot = _violation_with_nodes("#a", "#b")
+
+    changes = Axe()._collect_all_changes({"violations": [stripped]}, {"violations": [snapshot]})
+    assert [node['target'] for node in changes[0]['added_nodes']] == ["#c"]
+    assert [node['target'] for node in changes[0]['removed_nodes']] == ["#b"]
+
+    stored_snapshot = summarize_results({"url": "https://www.test.com", "timestamp": "2024-11-03T16:14:57.934Z",
+                                         "violations": [_violation_with_nodes("#c", "#a")]})
+    assert Axe()._collect_all_changes({"violations": [stripped]}, stored_snapshot) == []
+
+def test_collect_all_changes_capped_nodes_not_compared() -> None:
+    """Test nodes capped by a result filter are not compared at node level."""
+    current = _violation_with_nodes("#c")
+    current["nodeCount"] = 2
+    snapshot = _violation_with_nodes("#a", "#b")
+
+    changes = Axe()._collect_all_changes({"violations": [current]}, {"violations": [snapshot]})
+
+    assert changes == []
+
+def test_diff_results() -> None:
+    """Test the diff API returns the nodes added and removed across all rules."""
+    data = {"violations": [_violation_with_nodes("#a", "#b", "#c")]}
+    snapshot_data = {"violations": [_violation_with_nodes("#a", "#d"),
+                                    {**_violation_with_nodes("#e"), "id": "rule2"}]}
+
+    diff = Axe().diff_results(data, snapshot_data)
+
+    assert {change['type'] for change in diff['changes']} == {'Increased Count', 'Resolved Violation'}
+    assert [node['target'] for node in diff['added_nodes']] == ["#b", "#c"]
+    assert sorted(node['target'] for node in diff['removed_nodes']) == ["#d", "#e"]
+    assert all(node['fingerprint'] for node in diff['added_nodes'] + diff['removed_nodes'])
+
+def test_generate_changes_section_changed_nodes() -> None:
+    """Test the changes section lists the nodes added and removed."""
+    data = {"violations": [_violation_with_nodes("#a", "#c")], "timestamp": "2024-11-04T16:14:57.934Z"}
+    snapshot = {"violations": [_violation_with_nodes("#a", "#b")], "timestamp": "2024-11-03T16:14:57.934Z"}
+
+    result = Axe()._generate_changes_section(data, snapshot)
+
+    assert 'class="changed-nodes"' in result
+    assert "1 node(s) added, 1 node(s) removed" in result
+    assert "Added: <code>#c</code>" in result
+    assert "Removed: <code>#b</code>" in result
@@ -0,0 +1,91 @@
+import gzip
+import json
+import pytest
+from pathlib import Path
+from src.pytest_playwright_axe import Axe, SnapshotStore, regenerate_reports
+from src.pytest_playwright_axe.cli import find_json_results, main
+
+
+def page_result(url: str, *targets: str) -> dict:
+    return {
+        "url": url,
+        "timestamp": "2024-11-04T16:14:57.934Z",
+        "passes": [],
+        "incomplete": [],
+        "inapplicable": [],
+        "violations": [{"id": "image-alt", "impact": "critical", "tags": ["wcag2a"], "description": "test",
+                        "helpUrl": "test url",
+                        "nodes": [{"target": [target], "html": "<img>", "failureSummary": "fix"} for target in targets]}]
+    }
+
+
+@pytest.fixture
+def results_directory(tmp_path: Path) -> Path:
+    directory = tmp_path / "results"
+    directory.mkdir()
+    for number in range(6):
+        (directory / f"page_{number}.json").write_text(
+            json.dumps(page_result(f"https://www.test.com/{number}", "#a")), encoding="utf-8")
+    with gzip.open(directory / "compressed.json.gz", "wt", encoding="utf-8") as file:
+        json.dump(page_result("https://www.test.com/compressed", "#a"), file)
+    (directory / "consolidated_report.json").write_text(json.dumps({"pages": []}), encoding="utf-8")
+    (directory / "notes.txt").write_text("not a result", encoding="utf-8")
+    return directory
+
+
+def test_find_json_results(results_directory: Path) -> None:
+    assert [path.name for path in find_json_results(results_directory)] == [
+        "compressed.json.gz", "consolidated_report.json"] + [f"page_{number}.json" for number in range(6)]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_regenerate_reports(results_directory: Path, tmp_path: Path, workers: int) -> None:
+    output_directory = tmp_path / "html"
+
+    counts = regenerate_reports(results_directory, output_directory, workers=workers)
+
+    assert counts == {"generated": 7, "skipped": 1, "failed": 0}
+    assert sorted(path.name for path in output_directory.glob("*.html")) == [
+        "compressed.html"] + [f"page_{number}.html" for number in range(6)]
+    expected = Axe()._generate_html(page_result("https://www.test.com/0", "#a"), "page_0")
+    assert (output_directory / "page_0.html").read_text(encoding="utf-8") == expected
+
+
+def test_regenerate_reports_with_excluded_sections(tmp_path: Path) -> None:
+    result = page_result("https://www.test.com/1", "#a")
+    for section in ("passes", "incomplete", "inapplicable"):
+        del result[section]
+    (tmp_path / "page_1.json").write_text(json.dumps(result), encoding="utf-8")
+
+    counts = regenerate_reports(tmp_path, workers=1)
+
+    assert counts == {"generated": 1, "skipped": 0, "failed": 0}
+    expected = Axe()._generate_html(page_result("https://www.test.com/1", "#a"), "page_1")
+    assert (tmp_path / "page_1.html").read_text(encoding="utf-8") == expected
+
+
+def test_regenerate_reports_with_snapshots(results_directory: Path, tmp_path: Path) -> None:
+    with SnapshotStore(tmp_path / "snapshots.db") as store:
+        store.put("page_0", page_result("https://www.test.com/0", "#a", "#b"), run="baseline")
+
+    regenerate_reports(results_directory, snapshot_store=tmp_path / "snapshots.db", css_override="body {}", workers=1)
+
+    html = (results_directory / "page_0.html").read_text(encoding="utf-8")
+    assert "Changes Since Last Scan" in html
+    assert "<style>body {}</style>" in html
+    assert "Changes Since Last Scan" not in (results_directory / "page_1.html").read_text(encoding="utf-8")
+
+
+def test_main_report(results_directory: Path, capsys: pytest.CaptureFixture) -> None:
+    (results_directory / "corrupt.json").write_text("{not json", encoding="utf-8")
+
+    assert main(["report", str(results_directory), "--workers", "1"]) == 1
+    assert "Generated 7 HTML report(s)" in capsys.readouterr().out
+    assert (results_directory / "page_0.html").exists()
+
+
+def test_main_report_invalid_arguments(tmp_path: Path) -> None:
+    with pytest.raises(SystemExit):
+        main(["report", str(tmp_path / "missing")])
+    with pytest.raises(SystemExit):
+        main(["report", str(tmp_path), "--workers", "0"])
@@ -0,0 +1,66 @@
+import json
+import pytest
+from pathlib import Path
+from src.pytest_playwright_axe import Axe, AxeAccessibilityException, ConsolidatedReport
+
+
+def page_result(url: str, violation_count: int) -> dict:
+    return {
+        "url": url,
+        "passes": [],
+        "incomplete": [],
+        "inapplicable": [],
+        "violations": [{"id": f"rule-{number}", "impact": "serious", "tags": ["wcag2a"], "description": "test",
+                        "helpUrl": "test url", "nodes": [{"target": ["#a"], "html": "<a>", "failureSummary": "fix"}]}
+                       for number in range(violation_count)]
+    }
+
+
+def test_consolidated_report_json_lines(tmp_path: Path) -> None:
+    with ConsolidatedReport(Axe(output_directory=tmp_path), "audit") as report:
+        report.add("/home", page_result("https://www.test.com/home", 2), "home")
+        report.add("/search", page_result("https://www.test.com/search", 0))
+        # Pages are written to disk as they are added, rather than held until the report is closed
+        assert report._page_count == 2 and report._page_numbers == {}
+
+    lines = (tmp_path / "audit.jsonl").read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["key"] for line in lines] == ["/home", "/search"]
+    assert json.loads(lines[0])["results"]["url"] == "https://www.test.com/home"
+
+    html = (tmp_path / "audit.html").read_text(encoding="utf-8")
+    assert html.count("<style>") == 1
+    assert '<a href="#page-1">/home</a>' in html
+    assert '<section id="page-2"><h2>2. /search</h2>' in html
+    assert '<a href="home.html">full report</a>' in html
+    assert html.index("Pages Scanned") < html.index('<section id="page-1">')
+    assert html.endswith("</main></body></html>")
+
+
+def test_consolidated_report_json_document(tmp_path: Path) -> None:
+    with ConsolidatedReport(Axe(output_directory=tmp_path), "audit", json_lines=False) as report:
+        report.add("/home", page_result("https://www.test.com/home", 1))
+        report.add("/search", page_result("https://www.test.com/search", 0))
+
+    data = json.loads((tmp_path / "audit.json").read_text(encoding="utf-8"))
+    assert [page["key"] for page in data["pages"]] == ["/home", "/search"]
+
+
+def test_consolidated_report_groups(tmp_path: Path) -> None:
+    groups = {"/product/{id}": {"scanned": ["/product/1"], "skipped": ["/product/2", "/product/3"]}}
+    with ConsolidatedReport(Axe(output_directory=tmp_path), "audit", json_lines=False) as report:
+        report.add("/product/1", page_result("https://www.test.com/product/1", 1), group="/product/{id}")
+        report.add_groups(groups)
+
+    data = json.loads((tmp_path / "audit.json").read_text(encoding="utf-8"))
+    assert data["pages"][0]["group"] == "/product/{id}"
+    assert data["groups"] == [{"group": "/product/{id}", **groups["/product/{id}"]}]
+
+    html = (tmp_path / "audit.html").read_text(encoding="utf-8")
+    assert "summary of 1 page(s), representing 3 page(s)" in html
+    assert '<a href="#page-1">/product/1</a>' in html[html.index("Sampled Templates"):]
+    assert "<li>/product/3</li>" in html
+
+
+def test_consolidated_report_not_opened(tmp_path: Path) -> None:
+    with pytest.raises(AxeAccessibilityException):
+        ConsolidatedReport(Axe(output_directory=tmp_path)).add("/home", page_result("https://www.test.com/home", 0))
@@ -0,0 +1,141 @@
+import json
+from src.pytest_playwright_axe.plugin import AxeSessionSummary, MetricsFile
+from src.pytest_playwright_axe import ScanMetrics, SnapshotStore
+
+pytest_plugins = ["pytester"]
+
+
+def violation(rule_id: str, node_count: int) -> dict:
+    return {"id": rule_id, "impact": "serious", "nodes": [{}] * node_count}
+
+
+def test_session_summary_record_and_merge() -> None:
+    summary = AxeSessionSummary()
+    summary.record({"violations": [violation("color-contrast", 2), violation("image-alt", 1)]})
+    summary.record({"violations": [violation("color-contrast", 3)]})
+    summary.record({"violations": []})
+
+    worker_summary = AxeSessionSummary()
+    worker_summary.record({"violations": [violation("image-alt", 4)]})
+    summary.merge(worker_summary.to_dict())
+
+    assert summary.pages_scanned == 4
+    assert summary.pages_with_violations == 3
+    assert summary.summary_lines() == [
+        "Pages scanned: 4, pages with violations: 3",
+        "  color-contrast (serious): 5 node(s) on 2 page(s)",
+        "  image-alt (serious): 5 node(s) on 2 page(s)"
+    ]
+
+
+def test_session_summary_cache_stats() -> None:
+    summary = AxeSessionSummary()
+    summary.record({"violations": []})
+    summary.record_cache({"hits": 3, "misses": 1, "hit_rate": 0.75})
+
+    worker_summary = AxeSessionSummary()
+    worker_summary.record_cache({"hits": 1, "misses": 1, "hit_rate": 0.5})
+    summary.merge(worker_summary.to_dict())
+
+    assert summary.summary_lines() == [
+        "Pages scanned: 1, pages with violations: 0",
+        "Scan cache: 4 hit(s), 2 miss(es)"
+    ]
+
+
+def test_axe_fixture_uses_command_line_options(pytester) -> None:
+    pytester.makeconftest('pytest_plugins = ["src.pytest_playwright_axe.plugin"]')
+    pytester.makepyfile("""
+        def test_fixture(axe, tmp_path):
+            assert axe.axe_path.name == "axe.min.js"
+            assert axe.strict_mode is True
+            assert axe.output_directory.name == "custom-reports"
+            axe.result_callback({"violations": [{"id": "image-alt", "impact": "critical", "nodes": [{}]}]})
+    """)
+
+    result = pytester.runpytest_inprocess("-p", "no:cacheprovider", "-p", "no:playwright", "--axe-minified", "--axe-strict",
+                                          "--axe-output-dir", "custom-reports")
+
+    result.assert_outcomes(passed=1)
+    result.stdout.fnmatch_lines(["*axe-core accessibility summary*",
+                                 "Pages scanned: 1, pages with violations: 1",
+                                 "  image-alt (critical): 1 node(s) on 1 page(s)"])
+
+
+def test_axe_fixture_promotes_snapshot_store(pytester) -> None:
+    pytester.makeconftest('pytest_plugins = ["src.pytest_playwright_axe.plugin"]')
+    pytester.makepyfile("""
+        def test_fixture(axe):
+            axe.snapshot_store.put("home", {"url": "https://www.test.com", "timestamp": "", "violations": []})
+    """)
+
+    result = pytester.runpytest_inprocess("-p", "no:cacheprovider", "-p", "no:playwright",
+                                          "--axe-snapshot-store", "snapshots.db", "--axe-promote-snapshots")
+
+    result.assert_outcomes(passed=1)
+    with SnapshotStore(pytester.path / "snapshots.db") as store:
+        assert store.keys() == ["home"]
+        assert store.keys(run="current") == []
+
+
+def test_xdist_worker_does_not_promote_snapshot_store(pytester) -> None:
+    pytester.makeconftest("""
+        pytest_plugins = ["src.pytest_playwright_axe.plugin"]
+
+        def pytest_configure(config):
+            config.workerinput = {}
+    """)
+    pytester.makepyfile("""
+        def test_fixture(axe):
+            axe.snapshot_store.put("home", {"url": "https://www.test.com", "timestamp": "", "violations": []})
+    """)
+
+    result = pytester.runpytest_inprocess("-p", "no:cacheprovider", "-p", "no:playwright",
+                                          "--axe-snapshot-store", "snapshots.db", "--axe-promote-snapshots")
+
+    result.assert_outcomes(passed=1)
+    with SnapshotStore(pytester.path / "snapshots.db") as store:
+        assert store.keys() == []
+        assert store.keys(run="current") == ["home"]
+
+
+def test_axe_fixture_report_writer(pytester) -> None:
+    pytester.makeconftest('pytest_plugins = ["src.pytest_playwright_axe.plugin"]')
+    pytester.makepyfile("""
+        def test_fixture(axe):
+            assert axe.report_writer is not None
+            axe.report_writer.submit(axe._create_json_report,
+                                     {"url": "https://www.test.com", "timestamp": "", "violations": []}, "home")
+    """)
+
+    result = pytester.runpytest_inprocess("-p", "no:cacheprovider", "-p", "no:playwright",
+                                          "--axe-output-dir", "reports", "--axe-report-workers", "2")
+
+    result.assert_outcomes(passed=1)
+    assert (pytester.path / "reports" / "home.json").exists()
+
+
+def test_metrics_file(tmp_path) -> None:
+    metrics_path = tmp_path / "metrics" / "scans.jsonl"
+    for url in ["https://www.test.com/1", "https://www.test.com/2"]:
+        metrics_file = MetricsFile(metrics_path)
+        metrics_file.write(ScanMetrics(url=url, phases={"axe_run_ms": 10.0}))
+        metrics_file.close()
+
+    lines = [json.loads(line) for line in metrics_path.read_text(encoding="utf-8").splitlines()]
+    assert [line["url"] for line in lines] == ["https://www.test.com/1", "https://www.test.com/2"]
+    assert lines[0]["total_ms"] == 10.0
+
+
+def test_axe_fixture_metrics_file(pytester) -> None:
+    pytester.makeconftest('pytest_plugins = ["src.pytest_playwright_axe.plugin"]')
+    pytester.makepyfile("""
+        def test_fixture(axe):
+            assert axe.metrics_callback is not None
+    """)
+
+    result = pytester.runpytest_inprocess("-p", "no:cacheprovider", "-p", "no:playwright",
+                                          "--axe-metrics-file", "metrics.jsonl")
+
+    result.assert_outcomes(passed=1)
+    assert (pytester.path / "metrics.jsonl").exists()
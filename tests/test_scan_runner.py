@@ -0,0 +1,175 @@
+import asyncio
+import pytest
+import time
+from playwright.async_api import Error as PlaywrightError
+from src.pytest_playwright_axe import AsyncAxe, AxeAccessibilityException, ScanRunner
+from src.pytest_playwright_axe.scan_runner import HEAP_SIZE_SCRIPT
+from tests.test_async_axe import FakeAsyncPage, run_async
+
+
+class FakeRunnerPage(FakeAsyncPage):
+    """A fake page that hangs or crashes on the URLs the browser is told to fail, reporting a fixed heap size."""
+    def __init__(self, context: "FakeRunnerContext") -> None:
+        super().__init__(context)
+        self.browser = context.browser
+
+    async def goto(self, url: str) -> None:
+        if url.endswith("error"):
+            raise RuntimeError("Unexpected error")
+        failure = self.browser.failures.get(url)
+        if failure:
+            self.browser.failures[url] -= 1
+            if url.endswith("hang"):
+                await asyncio.sleep(10)
+            self.browser.connected = not url.endswith("crash")
+            raise PlaywrightError("Target crashed")
+        await super().goto(url)
+        self.browser.visited.append(url)
+
+    async def evaluate(self, expression: str, arg=None):
+        if expression == HEAP_SIZE_SCRIPT:
+            return self.browser.heap_size
+        return await super().evaluate(expression, arg)
+
+
+class FakeRunnerContext:
+    """A fake browser context holding a single page."""
+    def __init__(self, browser: "FakeRunnerBrowser") -> None:
+        self.browser = browser
+        self.closed = False
+
+    async def new_page(self) -> FakeRunnerPage:
+        return FakeRunnerPage(self)
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class FakeRunnerBrowser:
+    """A fake browser recording the contexts opened, which can fail URLs a number of times."""
+    def __init__(self, failures: dict[str, int] = None, heap_size: int = 0) -> None:
+        self.failures = failures or {}
+        self.heap_size = heap_size
+        self.connected = True
+        self.contexts = []
+        self.visited = []
+        self.launched = []
+        self.browser_type = self
+
+    def is_connected(self) -> bool:
+        return self.connected
+
+    async def launch(self, **launch_options) -> "FakeRunnerBrowser":
+        self.launched.append(launch_options)
+        self.connected = True
+        return self
+
+    async def new_context(self, **context_options) -> FakeRunnerContext:
+        self.contexts.append(FakeRunnerContext(self))
+        return self.contexts[-1]
+
+    async def close(self) -> None:
+        self.connected = False
+
+
+class FakeConsolidatedReport:
+    """A fake consolidated report recording the pages added."""
+    def __init__(self) -> None:
+        self.added = []
+
+    def add(self, results_key: str, response: dict, report_filename: str = "", group: str = "") -> None:
+        self.added.append(results_key)
+
+
+def run_scan(runner: ScanRunner, urls, **kwargs) -> dict:
+    async def scan() -> dict:
+        async with runner:
+            return await runner.run(urls, html_report_generated=False, json_report_generated=False, **kwargs)
+    return run_async(scan())
+
+
+def test_scan_runner_recycles_pages() -> None:
+    browser = FakeRunnerBrowser()
+    urls = (f"https://www.test.com/{number}" for number in range(10))
+
+    summary = run_scan(ScanRunner(AsyncAxe(), browser, pool_size=2, max_scans_per_page=3), urls)
+
+    assert summary == {"scanned": 10, "retried": 0, "failed": 0, "recycled": 2, "failures": {}}
+    assert sorted(browser.visited) == sorted(f"https://www.test.com/{number}" for number in range(10))
+    assert len(browser.contexts) == 4
+    assert all(context.closed for context in browser.contexts)
+
+
+def test_scan_runner_recycles_pages_over_heap_limit() -> None:
+    browser = FakeRunnerBrowser(heap_size=200 * 1024 * 1024)
+
+    summary = run_scan(ScanRunner(AsyncAxe(), browser, pool_size=1, max_heap_mb=100),
+                       ["https://www.test.com/1", "https://www.test.com/2"])
+
+    assert summary["recycled"] == 2
+    assert len(browser.contexts) == 2
+
+
+def test_scan_runner_retries_on_a_new_page() -> None:
+    browser = FakeRunnerBrowser(failures={"https://www.test.com/hang": 1, "https://www.test.com/crash": 1})
+    axe = AsyncAxe()
+    report = FakeConsolidatedReport()
+
+    summary = run_scan(ScanRunner(axe, browser, pool_size=2, scan_timeout=0.1, launch_options={"headless": True}),
+                       ["https://www.test.com/hang", "https://www.test.com/crash", "https://www.test.com/3"],
+                       consolidated_report=report)
+
+    assert summary == {"scanned": 3, "retried": 2, "failed": 0, "recycled": 0, "failures": {}}
+    assert sorted(report.added) == ["https://www.test.com/3", "https://www.test.com/crash", "https://www.test.com/hang"]
+    assert browser.launched == [{"headless": True}]
+    assert len(browser.contexts) == 4
+
+
+def test_scan_runner_records_failures() -> None:
+    browser = FakeRunnerBrowser(failures={"https://www.test.com/hang": 3})
+
+    summary = run_scan(ScanRunner(AsyncAxe(), browser, pool_size=1, scan_timeout=0.1, retries=2),
+                       ["https://www.test.com/hang", "https://www.test.com/2"])
+
+    assert summary["scanned"] == 1
+    assert summary["retried"] == 2
+    assert summary["failures"] == {"https://www.test.com/hang": "TimeoutError"}
+    assert browser.visited == ["https://www.test.com/2"]
+
+
+def test_scan_runner_records_results_once() -> None:
+    """Test the reports for a page are generated once, outside the scan timeout, even if generating them is slow."""
+    class SlowReportAsyncAxe(AsyncAxe):
+        def _record_results(self, response: dict, *args) -> None:
+            time.sleep(0.2)
+            recorded.append(response["url"])
+
+    recorded = []
+    browser = FakeRunnerBrowser()
+
+    summary = run_scan(ScanRunner(SlowReportAsyncAxe(), browser, pool_size=1, scan_timeout=0.1),
+                       ["https://www.test.com/1"])
+
+    assert summary == {"scanned": 1, "retried": 0, "failed": 0, "recycled": 0, "failures": {}}
+    assert recorded == browser.visited == ["https://www.test.com/1"]
+
+def test_scan_runner_stops_pool_on_unexpected_error() -> None:
+    browser = FakeRunnerBrowser(failures={"https://www.test.com/hang": 1})
+    runner = ScanRunner(AsyncAxe(), browser, pool_size=2)
+
+    async def scan() -> None:
+        await runner.run(["https://www.test.com/hang", "https://www.test.com/error", "https://www.test.com/3"],
+                         html_report_generated=False, json_report_generated=False)
+
+    with pytest.raises(RuntimeError):
+        run_async(asyncio.wait_for(scan(), 5))
+    assert browser.visited == []
+    assert len(browser.contexts) == 2
+    assert all(context.closed for context in browser.contexts)
+
+
+def test_scan_runner_invalid_arguments() -> None:
+    with pytest.raises(AxeAccessibilityException):
+        ScanRunner(AsyncAxe(), FakeRunnerBrowser(), pool_size=0)
+    with pytest.raises(AxeAccessibilityException):
+        ScanRunner(AsyncAxe(), FakeRunnerBrowser(), retries=-1)
@@ -0,0 +1,113 @@
+import gzip
+import json
+import pytest
+from pathlib import Path
+from src.pytest_playwright_axe import Axe, AxeAccessibilityException, SnapshotStore
+from src.pytest_playwright_axe.snapshot_store import summarize_results
+
+TEST_SNAPSHOT_DIR = Path(__file__).parent / "snapshots"
+
+
+def page_result(url: str, *targets: str) -> dict:
+    return {
+        "url": url,
+        "timestamp": "2024-11-04T16:14:57.934Z",
+        "passes": [],
+        "incomplete": [],
+        "inapplicable": [],
+        "violations": [{"id": "image-alt", "impact": "critical", "tags": ["wcag2a"], "description": "test",
+                        "helpUrl": "test url",
+                        "nodes": [{"target": [target], "html": f"<img id='{target}'>", "failureSummary": "fix"}
+                                  for target in targets]}] if targets else []
+    }
+
+
+def test_summarize_results() -> None:
+    summary = summarize_results(page_result("https://www.test.com", "#a", "#b"))
+
+    assert set(summary) == {"url", "timestamp", "violations"}
+    assert summary["violations"][0]["nodeCount"] == 2
+    assert [node["target"] for node in summary["violations"][0]["nodes"]] == [["#a"], ["#b"]]
+    assert all("html" not in node and node["fingerprint"] for node in summary["violations"][0]["nodes"])
+
+
+def test_snapshot_store_put_get(tmp_path: Path) -> None:
+    with SnapshotStore(tmp_path / "snapshots.db") as store:
+        store.put("home", page_result("https://www.test.com", "#a"))
+
+        assert store.get("home") is None
+        assert store.get("home", run="current")["url"] == "https://www.test.com"
+        assert store.keys(run="current") == ["home"]
+
+
+def test_snapshot_store_shared_between_connections(tmp_path: Path) -> None:
+    with SnapshotStore(tmp_path / "snapshots.db") as store, SnapshotStore(tmp_path / "snapshots.db") as other_store:
+        assert store._connection.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+        store.put("home", page_result("https://www.test.com", "#a"))
+        other_store.put("search", page_result("https://www.test.com/search", "#a"))
+
+        assert store.keys(run="current") == ["home", "search"]
+
+
+def test_snapshot_store_invalid_run(tmp_path: Path) -> None:
+    with SnapshotStore(tmp_path / "snapshots.db") as store:
+        with pytest.raises(AxeAccessibilityException):
+            store.put("home", page_result("https://www.test.com"), run="previous")
+
+
+def test_snapshot_store_promote(tmp_path: Path) -> None:
+    with SnapshotStore(tmp_path / "snapshots.db") as store:
+        store.put("home", page_result("https://www.test.com", "#a"), run="baseline")
+        store.put("search", page_result("https://www.test.com/search"), run="baseline")
+        store.put("home", page_result("https://www.test.com", "#b"))
+
+        assert store.promote() == 1
+        assert store.keys(run="current") == []
+        assert store.keys() == ["home", "search"]
+        assert store.get("home")["violations"][0]["nodes"][0]["target"] == ["#b"]
+
+    # Persisted between connections
+    with SnapshotStore(tmp_path / "snapshots.db") as store:
+        assert store.keys() == ["home", "search"]
+
+
+def test_snapshot_store_import_json_directory(tmp_path: Path) -> None:
+    (tmp_path / "home.json").write_text(json.dumps(page_result("https://www.test.com", "#a")), encoding="utf-8")
+    with gzip.open(tmp_path / "search.json.gz", "wt", encoding="utf-8") as file:
+        json.dump(page_result("https://www.test.com/search"), file)
+    (tmp_path / "corrupt.json").write_text("{not json", encoding="utf-8")
+
+    with SnapshotStore(tmp_path / "snapshots.db") as store:
+        assert store.import_json_directory(tmp_path) == 2
+        assert store.keys() == ["home", "search"]
+
+
+def test_snapshot_store_import_existing_snapshot(tmp_path: Path) -> None:
+    with SnapshotStore(tmp_path / "snapshots.db") as store:
+        store.import_json_directory(TEST_SNAPSHOT_DIR)
+        assert "github_com_davethepunkyone_pytest-playwright-axe" in store.keys()
+
+
+def test_axe_snapshot_store_comparison(tmp_path: Path) -> None:
+    with SnapshotStore(tmp_path / "snapshots.db") as store:
+        store.put("home", page_result("https://www.test.com", "#a", "#b"), run="baseline")
+        axe = Axe(output_directory=tmp_path, snapshot_store=store)
+
+        data = page_result("https://www.test.com", "#a", "#c")
+        axe._process_results(data, "home", False, False, True, False)
+
+        html = (tmp_path / "home.html").read_text(encoding="utf-8")
+        assert "Changes Since Last Scan" in html
+        assert "Removed: <code>#b</code>" in html
+        assert store.get("home", run="current") == summarize_results(data)
+
+        diff = axe.diff_results(data, store.get("home"))
+        assert [node["target"] for node in diff["added_nodes"]] == ["#c"]
+
+
+def test_axe_snapshot_store_key_from_url(tmp_path: Path) -> None:
+    with SnapshotStore(tmp_path / "snapshots.db") as store:
+        axe = Axe(output_directory=tmp_path, snapshot_store=store)
+        axe._process_results(page_result("https://www.test.com/home"), "", False, False, False, False)
+
+        assert store.keys(run="current") == ["www_test_com_home"]
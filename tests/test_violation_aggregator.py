@@ -0,0 +1,84 @@
+import json
+import pytest
+from pathlib import Path
+from src.pytest_playwright_axe import Axe, AxeAccessibilityException, ViolationAggregator
+from tests.test_axe import FakePage, rule
+
+
+def page_result(url: str, *violations: dict) -> dict:
+    return {"url": url, "timestamp": "2024-11-04T16:14:57.934Z", "passes": [], "incomplete": [],
+            "inapplicable": [], "violations": list(violations)}
+
+
+def test_aggregator_counts_shared_violations() -> None:
+    aggregator = ViolationAggregator()
+    for number in range(3):
+        aggregator.add(page_result(f"https://www.test.com/{number}", rule("region", "#header", f"#content-{number}")))
+
+    top = aggregator.top()
+
+    assert len(top) == 1
+    assert top[0]["rule_id"] == "region" and top[0]["target"] == "#header"
+    assert top[0]["pages"] == 3 and top[0]["occurrences"] == 3
+    assert top[0]["sample_pages"] == [f"https://www.test.com/{number}" for number in range(3)]
+    assert top[0]["help_url"] == "test" and top[0]["impact"] == "serious"
+    assert len(aggregator.top(min_pages=1)) == 4
+    assert aggregator.stats() == {"pages": 3, "entries": 4, "pruned": 0}
+
+
+def test_aggregator_counts_page_once() -> None:
+    aggregator = ViolationAggregator()
+    aggregator.add(page_result("https://www.test.com/1", rule("region", "#a", "#a")))
+
+    top = aggregator.top(min_pages=1)
+
+    assert top[0]["pages"] == 1 and top[0]["occurrences"] == 2
+
+
+def test_aggregator_bounds_samples_and_html() -> None:
+    aggregator = ViolationAggregator(max_sample_pages=2, max_html_length=4)
+    for number in range(4):
+        aggregator.add(page_result(f"https://www.test.com/{number}", rule("region", "#header")))
+
+    top = aggregator.top()
+
+    assert top[0]["pages"] == 4
+    assert top[0]["sample_pages"] == ["https://www.test.com/0", "https://www.test.com/1"]
+    assert top[0]["html"] == "<div"
+
+
+def test_aggregator_prunes_least_shared() -> None:
+    aggregator = ViolationAggregator(max_entries=4)
+    aggregator.add(page_result("https://www.test.com/1", rule("region", "#header")))
+    aggregator.add(page_result("https://www.test.com/2", rule("region", "#header", "#a", "#b", "#c", "#d")))
+
+    assert aggregator.stats() == {"pages": 2, "entries": 3, "pruned": 2}
+    assert aggregator.top()[0]["target"] == "#header"
+
+    with pytest.raises(AxeAccessibilityException):
+        ViolationAggregator(max_entries=0)
+
+
+def test_aggregator_write_reports(tmp_path: Path) -> None:
+    aggregator = ViolationAggregator()
+    for number in range(2):
+        aggregator.add(page_result(f"https://www.test.com/{number}", rule("region", "#header")))
+
+    aggregator.write_reports(Axe(output_directory=tmp_path, json_compact=True))
+
+    data = json.loads((tmp_path / "shared_violations.json").read_text(encoding="utf-8"))
+    assert data["pages"] == 2 and data["issues"][0]["target"] == "#header"
+    html = (tmp_path / "shared_violations.html").read_text(encoding="utf-8")
+    assert "Top Shared Issues" in html and "2 (100%)" in html and "&lt;div&gt;" in html
+
+
+def test_run_list_adds_to_aggregator(tmp_path: Path) -> None:
+    aggregator = ViolationAggregator()
+    collected = []
+    axe = Axe(output_directory=tmp_path, violation_aggregator=aggregator, metrics_callback=collected.append)
+    page = FakePage(violations=[rule("region", "#header")])
+
+    axe.run_list(page, ["https://www.test.com/1", "https://www.test.com/2"], html_report_generated=False)
+
+    assert aggregator.top()[0]["pages"] == 2
+    assert "aggregate_ms" in collected[0].phases